@@ -17,6 +17,9 @@ from app.models.notice_cpv_additional import NoticeCpvAdditional  # noqa: F401
 from app.models.notice_detail import NoticeDetail  # noqa: F401
 from app.models.notice_document import NoticeDocument  # noqa: F401
 from app.models.notice_lot import NoticeLot  # noqa: F401
+from app.models.notice_nuts import NoticeNuts  # noqa: F401
+from app.models.notice_facet_count import NoticeFacetCount  # noqa: F401
+from app.models.notice_search_text import NoticeSearchText  # noqa: F401
 from app.models.watchlist import Watchlist  # noqa: F401
 from app.models.watchlist_match import WatchlistMatch  # noqa: F401
 from app.models.user import User  # noqa: F401
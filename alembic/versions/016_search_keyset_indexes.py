@@ -0,0 +1,38 @@
+"""Composite (sort key, id) indexes for keyset pagination of /notices/search.
+
+Cursor pages filter on (sort_key, id) past the previous page's last row and
+order by the same pair, so each page is an index range scan:
+- (publication_date DESC NULLS LAST, id DESC): date_desc (default)
+- (deadline ASC NULLS LAST, id ASC): deadline
+- (estimated_value DESC NULLS LAST, id DESC): value_desc (also value_asc, backwards)
+
+Revision ID: 016
+Revises: 015
+"""
+from alembic import op
+
+revision = "016"
+down_revision = "015"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_pubdate_id "
+        "ON notices (publication_date DESC NULLS LAST, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_deadline_id "
+        "ON notices (deadline ASC NULLS LAST, id ASC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_value_id "
+        "ON notices (estimated_value DESC NULLS LAST, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notices_value_id")
+    op.execute("DROP INDEX IF EXISTS ix_notices_deadline_id")
+    op.execute("DROP INDEX IF EXISTS ix_notices_pubdate_id")
@@ -0,0 +1,48 @@
+"""Add notice_nuts side table: one row per (notice, NUTS code).
+
+NUTS / country prefix filters used EXISTS over jsonb_array_elements_text(nuts_codes),
+which no index can serve. notice_nuts mirrors nuts_codes (upper-cased, distinct)
+with a text_pattern_ops btree so "nuts_code LIKE 'BE1%'" is an index range scan.
+The application keeps it in sync on import/enrichment (app.models.notice_nuts).
+
+Revision ID: 017
+Revises: 016
+"""
+from alembic import op
+
+revision = "017"
+down_revision = "016"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS notice_nuts (
+            notice_id VARCHAR(36) NOT NULL REFERENCES notices(id) ON DELETE CASCADE,
+            nuts_code VARCHAR(20) NOT NULL,
+            PRIMARY KEY (notice_id, nuts_code)
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notice_nuts_code "
+        "ON notice_nuts (nuts_code text_pattern_ops, notice_id)"
+    )
+
+    # Backfill from existing JSON arrays
+    op.execute("""
+        INSERT INTO notice_nuts (notice_id, nuts_code)
+        SELECT DISTINCT n.id, UPPER(TRIM(nc))
+        FROM notices n,
+             jsonb_array_elements_text(n.nuts_codes::jsonb) AS nc
+        WHERE n.nuts_codes IS NOT NULL
+          AND jsonb_typeof(n.nuts_codes::jsonb) = 'array'
+          AND TRIM(nc) <> ''
+          AND LENGTH(TRIM(nc)) <= 20
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notice_nuts_code")
+    op.execute("DROP TABLE IF EXISTS notice_nuts")
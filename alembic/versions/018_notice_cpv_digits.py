@@ -0,0 +1,47 @@
+"""Add notices.cpv_digits: canonical CPV digits for index-backed prefix filters.
+
+CPV prefix filters computed REPLACE(COALESCE(cpv_main_code, ''), '-', '') LIKE '45%'
+(or SUBSTRING(cpv_main_code FROM 1 FOR 3)) per row, which the plain cpv_main_code
+index cannot serve. cpv_digits is a stored generated column, so it is filled on
+every insert/update (all import paths) and backfilled by the ALTER itself:
+- btree (cpv_digits text_pattern_ops): LIKE 'prefix%' range scans
+- ix_notices_cpv_division rebuilt on SUBSTR(cpv_digits, 1, 2) for facet grouping
+
+Revision ID: 018
+Revises: 017
+"""
+from alembic import op
+
+revision = "018"
+down_revision = "017"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE notices ADD COLUMN IF NOT EXISTS cpv_digits VARCHAR(20) "
+        "GENERATED ALWAYS AS (REPLACE(REPLACE(cpv_main_code, '-', ''), ' ', '')) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_cpv_digits "
+        "ON notices (cpv_digits text_pattern_ops)"
+    )
+
+    op.execute("DROP INDEX IF EXISTS ix_notices_cpv_division")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_cpv_division "
+        "ON notices (SUBSTR(cpv_digits, 1, 2)) "
+        "WHERE cpv_digits IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notices_cpv_division")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_cpv_division "
+        "ON notices (LEFT(REPLACE(cpv_main_code, '-', ''), 2)) "
+        "WHERE cpv_main_code IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_notices_cpv_digits")
+    op.execute("ALTER TABLE notices DROP COLUMN IF EXISTS cpv_digits")
@@ -0,0 +1,56 @@
+"""Add notices.organisation_name_search with a pg_trgm GIN index.
+
+The authority filter ran jsonb_each_text(organisation_names) ... ILIKE '%term%'
+on every row. organisation_name_search holds the distinct organisation names of
+all languages joined by " | " (first = display name), so authority search is
+organisation_name_search ILIKE '%term%' served by a trigram index, and top
+authorities group on its first entry. Written by the application on import
+(ProcurementNotice validator / bulk import helpers); backfilled here.
+
+Revision ID: 019
+Revises: 018
+"""
+from alembic import op
+
+revision = "019"
+down_revision = "018"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("ALTER TABLE notices ADD COLUMN IF NOT EXISTS organisation_name_search TEXT")
+
+    # Backfill: distinct trimmed names, fr / nl / en first, then original key order
+    # (same order as app.models.notice.build_organisation_name_search)
+    op.execute("""
+        UPDATE notices n
+        SET organisation_name_search = s.names
+        FROM (
+            SELECT id, string_agg(name, ' | ' ORDER BY lang_rank, ord) AS names
+            FROM (
+                SELECT DISTINCT ON (notices.id, TRIM(e.value))
+                       notices.id, TRIM(e.value) AS name, e.ord,
+                       CASE e.key WHEN 'fr' THEN 1 WHEN 'nl' THEN 2 WHEN 'en' THEN 3 ELSE 4 END AS lang_rank
+                FROM notices,
+                     json_each_text(notices.organisation_names::json) WITH ORDINALITY AS e(key, value, ord)
+                WHERE notices.organisation_names IS NOT NULL
+                  AND json_typeof(notices.organisation_names::json) = 'object'
+                  AND TRIM(e.value) <> ''
+                ORDER BY notices.id, TRIM(e.value), lang_rank, e.ord
+            ) d
+            GROUP BY id
+        ) s
+        WHERE n.id = s.id
+    """)
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_org_name_trgm "
+        "ON notices USING GIN (organisation_name_search gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notices_org_name_trgm")
+    op.execute("ALTER TABLE notices DROP COLUMN IF EXISTS organisation_name_search")
@@ -0,0 +1,106 @@
+"""Weighted multilingual search_vector (title A, keywords/dossier/organisation B, description C).
+
+Revision ID: 020
+Revises: 019
+
+PostgreSQL only. Replaces the 002 trigger (simple config, title + description):
+- notices_build_search_vector(): one definition of the vector, used by the
+  trigger and by enrichment_service.refresh_search_vectors()
+- each field is indexed with simple (exact / prefix match) plus french, dutch
+  and english stemming; search ORs the query parsed with the same configs
+- trigger also fires on keywords, dossier_title and organisation_name_search
+- existing rows are rebuilt once here
+"""
+from alembic import op
+
+
+revision = "020"
+down_revision = "019"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notices_build_search_vector(
+            p_title text, p_keywords json, p_dossier_title text,
+            p_org_names text, p_description text
+        ) RETURNS tsvector AS $$
+        DECLARE
+            kw text;
+            mid text;
+            cfg regconfig;
+            v tsvector := ''::tsvector;
+        BEGIN
+            IF json_typeof(p_keywords) = 'array' THEN
+                SELECT string_agg(value, ' ') INTO kw FROM json_array_elements_text(p_keywords);
+            END IF;
+            mid := concat_ws(' ', kw, p_dossier_title, p_org_names);
+            FOREACH cfg IN ARRAY ARRAY['simple', 'french', 'dutch', 'english']::regconfig[] LOOP
+                v := v
+                    || setweight(to_tsvector(cfg, coalesce(p_title, '')), 'A')
+                    || setweight(to_tsvector(cfg, mid), 'B')
+                    || setweight(to_tsvector(cfg, coalesce(p_description, '')), 'C');
+            END LOOP;
+            RETURN v;
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE;
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notices_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := notices_build_search_vector(
+                NEW.title, NEW.keywords::json, NEW.dossier_title,
+                NEW.organisation_name_search, NEW.description
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        DROP TRIGGER IF EXISTS notices_search_vector_trigger ON notices;
+        CREATE TRIGGER notices_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description, keywords, dossier_title, organisation_name_search
+        ON notices
+        FOR EACH ROW EXECUTE FUNCTION notices_search_vector_update();
+    """)
+
+    # One-time rebuild; afterwards the trigger keeps rows current
+    op.execute("""
+        UPDATE notices SET search_vector = notices_build_search_vector(
+            title, keywords::json, dossier_title, organisation_name_search, description
+        )
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notices_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+                setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        DROP TRIGGER IF EXISTS notices_search_vector_trigger ON notices;
+        CREATE TRIGGER notices_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF title, description ON notices
+        FOR EACH ROW EXECUTE FUNCTION notices_search_vector_update();
+    """)
+    op.execute("""
+        UPDATE notices SET search_vector =
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    """)
+    op.execute("DROP FUNCTION IF EXISTS notices_build_search_vector(text, json, text, text, text)")
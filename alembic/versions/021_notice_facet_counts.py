@@ -0,0 +1,53 @@
+"""Add notice_facet_counts: precomputed counts behind /notices/facets.
+
+get_facets re-ran its grouped aggregates over all notices (NUTS via notice_nuts)
+whenever its 5-minute cache expired or an import invalidated it. Counts now live
+in (facet, value) rows the application maintains with deltas on write
+(app.models.notice_facet_count); the daily cron reconciles them. Backfilled here.
+
+Revision ID: 021
+Revises: 020
+"""
+from alembic import op
+
+revision = "021"
+down_revision = "020"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS notice_facet_counts (
+            facet VARCHAR(32) NOT NULL,
+            value VARCHAR(255) NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (facet, value)
+        )
+    """)
+
+    op.execute("""
+        INSERT INTO notice_facet_counts (facet, value, count)
+        SELECT 'total', '', COUNT(*) FROM notices
+        UNION ALL
+        SELECT 'source', source, COUNT(*) FROM notices GROUP BY source
+        UNION ALL
+        SELECT 'cpv_division', SUBSTR(cpv_digits, 1, 2), COUNT(*)
+        FROM notices
+        WHERE cpv_digits IS NOT NULL AND cpv_digits <> ''
+        GROUP BY SUBSTR(cpv_digits, 1, 2)
+        UNION ALL
+        SELECT 'nuts_country', SUBSTR(nuts_code, 1, 2), COUNT(DISTINCT notice_id)
+        FROM notice_nuts
+        GROUP BY SUBSTR(nuts_code, 1, 2)
+        UNION ALL
+        SELECT 'notice_type', LEFT(notice_type, 255), COUNT(*)
+        FROM notices
+        WHERE notice_type IS NOT NULL
+        GROUP BY LEFT(notice_type, 255)
+        ON CONFLICT (facet, value) DO UPDATE SET count = EXCLUDED.count
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS notice_facet_counts")
@@ -0,0 +1,41 @@
+"""Add notice_search_texts: materialized keyword-matching text of notices.
+
+Watchlist refreshes rebuilt build_searchable_text() (raw_data walk, json.loads
+of notice_details.raw_json) for every candidate notice on every run, after a
+title / description ILIKE pre-filter that did not see the same text. The
+lowercased text is now stored with a hash of its inputs and a pg_trgm GIN
+index, so the pre-filter and the deep-check read one column. The application
+keeps it in sync (app.models.notice_search_text); existing notices are filled
+by enrichment_service.refresh_search_texts() (daily cron), since the text is
+built in Python.
+
+Revision ID: 022
+Revises: 021
+"""
+from alembic import op
+
+revision = "022"
+down_revision = "021"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS notice_search_texts (
+            notice_id VARCHAR(36) NOT NULL PRIMARY KEY REFERENCES notices(id) ON DELETE CASCADE,
+            searchable_text TEXT NOT NULL DEFAULT '',
+            input_hash VARCHAR(64) NOT NULL
+        )
+    """)
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_notice_search_texts_trgm "
+            "ON notice_search_texts USING gin (searchable_text gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notice_search_texts_trgm")
+    op.execute("DROP TABLE IF EXISTS notice_search_texts")
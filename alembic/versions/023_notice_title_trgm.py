@@ -0,0 +1,29 @@
+"""Add a pg_trgm GIN index on notices.title.
+
+The public /public/preview-matches teaser filters on title ILIKE '%kw%' (OR-ed
+over up to five keywords), which no btree index can serve, so each anonymous
+request scanned every notice. A trigram index turns it into a bitmap index scan.
+
+Revision ID: 023
+Revises: 022
+"""
+from alembic import op
+
+revision = "023"
+down_revision = "022"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_notices_title_trgm "
+        "ON notices USING GIN (title gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_notices_title_trgm")
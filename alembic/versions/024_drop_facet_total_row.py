@@ -0,0 +1,27 @@
+"""Drop the ("total", "") row from notice_facet_counts.
+
+Every notice insert / delete updated that single counter row, so concurrent
+importers and enrichment serialized on its row lock until commit. The notice
+total is now the sum of the per-source rows (source is NOT NULL).
+
+Revision ID: 024
+Revises: 023
+"""
+from alembic import op
+
+revision = "024"
+down_revision = "023"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DELETE FROM notice_facet_counts WHERE facet = 'total'")
+
+
+def downgrade() -> None:
+    op.execute("""
+        INSERT INTO notice_facet_counts (facet, value, count)
+        SELECT 'total', '', COUNT(*) FROM notices
+        ON CONFLICT (facet, value) DO UPDATE SET count = EXCLUDED.count
+    """)
@@ -732,6 +732,7 @@ def bosa_enrich_awards_via_api(
         if not rows:
             break
 
+        raw_rewritten: list[str] = []
         for row in rows:
             if (enriched + skipped_no_xml + skipped_no_fields + api_errors + parse_errors + already_has_xml) >= limit:
                 break
@@ -796,6 +797,7 @@ def bosa_enrich_awards_via_api(
                         "nid": notice_id,
                     },
                 )
+                raw_rewritten.append(notice_id)
                 enriched += 1
 
             except Exception as e:
@@ -805,6 +807,9 @@ def bosa_enrich_awards_via_api(
                 )
                 parse_errors += 1
 
+        # Raw SQL bypasses the ORM listeners: rebuild keyword matching texts
+        from app.models.notice_search_text import sync_notice_search_texts
+        sync_notice_search_texts(db, raw_rewritten)
         db.commit()
         batches_done += 1
         offset += batch_size
@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.connectors.async_http import run_async
 from app.core.auth import require_admin_key, rate_limit_admin
 from app.db.session import get_db
 from app.services.notice_service import NoticeService
@@ -63,14 +64,14 @@ async def trigger_import(
 
                 if source == "BOSA":
                     stats = await asyncio.to_thread(
-                        lambda: asyncio.run(
-                            svc.import_from_eproc_search(items, fetch_details=fetch_details)
+                        lambda: run_async(
+                            svc.import_from_eproc_search(items, fetch_details=fetch_details, bulk=True)
                         )
                     )
                 else:
                     stats = await asyncio.to_thread(
-                        lambda: asyncio.run(
-                            svc.import_from_ted_search(items, fetch_details=fetch_details)
+                        lambda: run_async(
+                            svc.import_from_ted_search(items, fetch_details=fetch_details, bulk=True)
                         )
                     )
 
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.core.auth import require_admin_key, rate_limit_admin
 from app.db.session import get_db
+from app.models.notice_facet_count import apply_facet_deltas, count_notice_facets
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,10 @@ def fix_ted_cpv(
             "message": "Set dry_run=false to fix",
         }
 
+    # Raw UPDATEs bypass the ORM listeners: keep facet counters in step by hand
+    notice_ids = [str(r[0]) for r in rows]
+    facets_before = count_notice_facets(db, notice_ids)
+
     fixed = 0
     for row in rows:
         notice_id, raw_cpv = row[0], row[1]
@@ -67,6 +72,9 @@ def fix_ted_cpv(
             ), {"cpv": cleaned, "id": notice_id})
             fixed += 1
 
+    facet_delta = count_notice_facets(db, notice_ids)
+    facet_delta.subtract(facets_before)
+    apply_facet_deltas(db, facet_delta)
     db.commit()
     return {"total_malformed": len(rows), "fixed": fixed}
 
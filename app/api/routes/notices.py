@@ -1,5 +1,4 @@
 """Notice endpoints."""
-import asyncio
 import time
 import uuid
 from collections import deque
@@ -10,6 +9,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Qu
 from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
+from app.connectors.async_http import run_async
 from app.core.auth import rate_limit_public
 from app.api.routes.auth import get_optional_user
 
@@ -75,7 +75,7 @@ def _run_refresh_sync(search_criteria: dict[str, Any], sources: Optional[list[st
     db = SessionLocal()
     try:
         service = NoticeService(db)
-        return asyncio.run(service.import_from_all_sources(search_criteria, fetch_details=fetch_details, sources=sources))
+        return run_async(service.import_from_all_sources(search_criteria, fetch_details=fetch_details, sources=sources))
     finally:
         db.close()
 
@@ -251,6 +251,47 @@ async def get_notices(
     )
 
 
+def _search_filters(
+    q: Optional[str],
+    cpv: Optional[str],
+    nuts: Optional[str],
+    source: Optional[str],
+    authority: Optional[str],
+    notice_type: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+    deadline_before: Optional[str],
+    deadline_after: Optional[str],
+    value_min: Optional[float],
+    value_max: Optional[float],
+    active_only: bool,
+) -> dict[str, Any]:
+    """build_search_query keyword arguments from /search query parameters."""
+    # Parse multi-source: "BOSA,TED" → ["BOSA", "TED"]
+    sources_list: Optional[list[str]] = None
+    if source and source.strip():
+        sources_list = [s.strip() for s in source.split(",") if s.strip()]
+        if len(sources_list) == 1:
+            sources_list = None  # single source handled as before
+
+    return dict(
+        q=q,
+        cpv=cpv,
+        nuts=nuts,
+        source=source.split(",")[0].strip() if source and "," not in source else None,
+        sources=sources_list,
+        authority=authority,
+        notice_type=notice_type,
+        date_from=_safe_date(date_from),
+        date_to=_safe_date(date_to),
+        deadline_before=_safe_date(deadline_before),
+        deadline_after=_safe_date(deadline_after),
+        value_min=value_min,
+        value_max=value_max,
+        active_only=active_only,
+    )
+
+
 @router.get("/search", response_model=NoticeSearchResponse, dependencies=[Depends(rate_limit_public)])
 def search_notices(
     q: Optional[str] = Query(None, description="Full-text keyword search (title + description). Supports AND/OR."),
@@ -269,11 +310,13 @@ def search_notices(
     sort: str = Query("date_desc", description="Sort: date_desc, date_asc, relevance, deadline, deadline_desc, value_desc, value_asc, award_desc, award_asc, award_date_desc, award_date_asc, cpv_asc, cpv_desc, source_asc, source_desc"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(25, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque next_cursor from a previous response (keyset paging; page is ignored)"),
     db: Session = Depends(get_db),
 ) -> NoticeSearchResponse:
     """
     Advanced search with full-text (PostgreSQL tsvector) + filters.
-    Public, no auth. All filters optional; returns paginated items with total count.
+    Public, no auth. All filters optional; returns paginated items with total count
+    (total_exact is false when the total is an estimate for very broad filters).
 
     Filters:
     - q: keywords (AND by default, OR explicit)
@@ -289,73 +332,56 @@ def search_notices(
 
     Sort options: date_desc (default), date_asc, relevance (auto when q),
                   deadline, deadline_desc, value_desc, value_asc
-    """
-    from app.services.search_service import build_search_query
 
-    # Parse date strings
-    d_from = _safe_date(date_from)
-    d_to = _safe_date(date_to)
-    d_deadline_before = _safe_date(deadline_before)
-    d_deadline_after = _safe_date(deadline_after)
+    Pagination: page/page_size (OFFSET), or pass next_cursor back as cursor
+    for keyset paging (same cost at any depth; keep the same filters and sort).
+    """
+    from app.services.search_service import (
+        SEARCH_RESULT_COLUMNS,
+        build_search_query,
+        count_search_results,
+        decode_search_cursor,
+        encode_search_cursor,
+        fetch_search_page,
+        search_sort_keys,
+    )
 
-    # Parse multi-source: "BOSA,TED" → ["BOSA", "TED"]
-    sources_list: Optional[list[str]] = None
-    if source and source.strip():
-        sources_list = [s.strip() for s in source.split(",") if s.strip()]
-        if len(sources_list) == 1:
-            sources_list = None  # single source handled as before
+    filters = _search_filters(
+        q, cpv, nuts, source, authority, notice_type, date_from, date_to,
+        deadline_before, deadline_after, value_min, value_max, active_only,
+    )
 
     # If keyword search and no explicit sort, default to relevance
     effective_sort = sort
     if q and q.strip() and sort == "date_desc":
         effective_sort = "relevance"
 
-    query, _has_rank = build_search_query(
-        db,
-        q=q,
-        cpv=cpv,
-        nuts=nuts,
-        source=source.split(",")[0].strip() if source and "," not in source else None,
-        sources=sources_list,
-        authority=authority,
-        notice_type=notice_type,
-        date_from=d_from,
-        date_to=d_to,
-        deadline_before=d_deadline_before,
-        deadline_after=d_deadline_after,
-        value_min=value_min,
-        value_max=value_max,
-        active_only=active_only,
-        sort=effective_sort,
+    query, _has_rank = build_search_query(db, **filters, sort=effective_sort)
+    sort_keys = search_sort_keys(db, q, effective_sort)
+    after = None
+    if cursor:
+        try:
+            after = decode_search_cursor(cursor, effective_sort, sort_keys)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # Count (exact below threshold, estimated above, cached per filter set) + paginate
+    total, total_exact = count_search_results(db, query, filters)
+    rows, last_keys = fetch_search_page(
+        query, sort_keys, limit=page_size, offset=(page - 1) * page_size, after=after,
+        columns=SEARCH_RESULT_COLUMNS,
     )
 
-    # Count + paginate
-    total = query.count()
-    offset = (page - 1) * page_size
-    rows = query.offset(offset).limit(page_size).all()
-
+    # Rows hold only the listed columns (no raw_data; description already cut to 300 chars)
     items = [
-        NoticeSearchItem(
-            id=n.id,
-            title=n.title,
-            source=n.source,
-            cpv_main_code=n.cpv_main_code,
-            nuts_codes=n.nuts_codes,
-            organisation_names=n.organisation_names,
-            publication_date=n.publication_date.isoformat() if n.publication_date else None,
-            deadline=n.deadline.isoformat() if n.deadline else None,
-            reference_number=n.reference_number,
-            description=(n.description[:300] if n.description else None),
-            notice_type=n.notice_type,
-            form_type=n.form_type,
-            estimated_value=float(n.estimated_value) if n.estimated_value else None,
-            url=n.url,
-            status=n.status,
-            award_winner_name=n.award_winner_name,
-            award_value=float(n.award_value) if n.award_value else None,
-            award_date=n.award_date.isoformat() if n.award_date else None,
-            number_tenders_received=n.number_tenders_received,
-        )
+        NoticeSearchItem(**{
+            **n,
+            "publication_date": n["publication_date"].isoformat() if n["publication_date"] else None,
+            "deadline": n["deadline"].isoformat() if n["deadline"] else None,
+            "estimated_value": float(n["estimated_value"]) if n["estimated_value"] else None,
+            "award_value": float(n["award_value"]) if n["award_value"] else None,
+            "award_date": n["award_date"].isoformat() if n["award_date"] else None,
+        })
         for n in rows
     ]
     total_pages = (total + page_size - 1) // page_size if page_size else 0
@@ -363,10 +389,43 @@ def search_notices(
     return NoticeSearchResponse(
         items=items,
         total=total,
+        total_exact=total_exact,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=encode_search_cursor(effective_sort, last_keys) if last_keys else None,
+    )
+
+
+@router.get("/search/facets", dependencies=[Depends(rate_limit_public)])
+def get_search_facet_counts(
+    q: Optional[str] = Query(None, description="Full-text keyword search (title + description). Supports AND/OR."),
+    cpv: Optional[str] = Query(None, description="CPV code prefix filter (e.g. '45' or '45000000')"),
+    nuts: Optional[str] = Query(None, description="NUTS code prefix filter (e.g. 'BE1' or 'BE100')"),
+    source: Optional[str] = Query(None, description="Source filter: BOSA, TED, or comma-separated 'BOSA,TED'"),
+    authority: Optional[str] = Query(None, description="Authority / organisation name search"),
+    notice_type: Optional[str] = Query(None, description="Notice type filter (e.g. 'CONTRACT_NOTICE')"),
+    date_from: Optional[str] = Query(None, description="Publication date from (ISO YYYY-MM-DD)"),
+    date_to: Optional[str] = Query(None, description="Publication date to (ISO YYYY-MM-DD)"),
+    deadline_before: Optional[str] = Query(None, description="Deadline before (ISO YYYY-MM-DD)"),
+    deadline_after: Optional[str] = Query(None, description="Deadline after (ISO YYYY-MM-DD)"),
+    value_min: Optional[float] = Query(None, ge=0, description="Minimum estimated value (EUR)"),
+    value_max: Optional[float] = Query(None, ge=0, description="Maximum estimated value (EUR)"),
+    active_only: bool = Query(False, description="If true, only notices with deadline in the future"),
+    db: Session = Depends(get_db),
+) -> dict:
+    """
+    Facet counts within a search (same filters as /search): total plus
+    sources, top CPV divisions, top NUTS countries and notice types of the
+    matching notices, in one round trip. Cached briefly per filter set.
+    """
+    from app.services.search_service import get_search_facets
+
+    filters = _search_filters(
+        q, cpv, nuts, source, authority, notice_type, date_from, date_to,
+        deadline_before, deadline_after, value_min, value_max, active_only,
     )
+    return get_search_facets(db, filters)
 
 
 @router.get("/facets", dependencies=[Depends(rate_limit_public)])
@@ -683,67 +683,16 @@ def preview_matches(
     """
     Public teaser: count matching notices for given keywords + CPV codes.
     Returns estimated count + 5 sample notices. No auth required.
-    Performance-optimised: caps keywords, uses LIMIT-based count estimate.
+    Performance-optimised: title trigram index, capped / estimated count and
+    sample in one query, short-TTL cache per normalized criteria
+    (app.services.preview_service).
     """
-    from app.models.notice import ProcurementNotice
-    from sqlalchemy import or_
-
-    if not req.keywords and not req.cpv_codes:
-        return PreviewResponse(total_matches=0, sample=[])
-
-    N = ProcurementNotice
-    filters = []
-
-    # Cap at 5 keywords for query performance (ILIKE is expensive on 180K+ rows)
-    for kw in req.keywords[:5]:
-        kw_clean = kw.strip()
-        if len(kw_clean) < 2:
-            continue
-        pat = f"%{kw_clean}%"
-        # Search title only (much faster than title+description ILIKE)
-        filters.append(N.title.ilike(pat))
-
-    # CPV prefix matching (fast — indexed column)
-    for cpv in req.cpv_codes[:5]:
-        cpv_clean = cpv.replace("-", "").strip()
-        if len(cpv_clean) >= 2:
-            filters.append(N.cpv_main_code.ilike(f"{cpv_clean}%"))
-
-    if not filters:
-        return PreviewResponse(total_matches=0, sample=[])
-
-    combined = or_(*filters)
-
-    # Simple count (title-only + 5 keyword cap keeps it fast enough)
-    total = db.query(N.id).filter(combined).count()
-
-    # 5 most recent samples
-    samples = (
-        db.query(N)
-        .filter(combined)
-        .order_by(N.publication_date.desc().nulls_last())
-        .limit(5)
-        .all()
-    )
+    from app.services.preview_service import preview_matches as run_preview
 
+    result = run_preview(db, req.keywords, req.cpv_codes)
     return PreviewResponse(
-        total_matches=total,
-        sample=[
-            PreviewNotice(
-                title=n.title or "—",
-                authority=(
-                    (n.organisation_names or {}).get("fr")
-                    or (n.organisation_names or {}).get("nl")
-                    or (n.organisation_names or {}).get("en")
-                    or next(iter((n.organisation_names or {}).values()), None)
-                ),
-                cpv=n.cpv_main_code,
-                source="BOSA" if n.source and "BOSA" in n.source else "TED",
-                publication_date=n.publication_date.isoformat() if n.publication_date else None,
-                deadline=n.deadline.isoformat() if n.deadline else None,
-            )
-            for n in samples
-        ],
+        total_matches=result["total_matches"],
+        sample=[PreviewNotice(**n) for n in result["sample"]],
     )
 
 
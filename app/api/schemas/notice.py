@@ -94,9 +94,11 @@ class NoticeSearchResponse(BaseModel):
 
     items: List[NoticeSearchItem]
     total: int
+    total_exact: bool = True  # False when total is an estimate (very broad filters)
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page (keyset)
 
 
 class NoticeDetailRead(BaseModel):
@@ -7,7 +7,20 @@ Canonical locations:
 Legacy thin wrappers (eproc_connector, ted_connector) kept for
 backward compat but delegate to packages above.
 """
-from app.connectors.eproc_connector import fetch_publication_workspace
-from app.connectors.ted_connector import search_ted_notices
+from app.connectors.async_http import close_async_clients, run_async
+from app.connectors.eproc_connector import (
+    fetch_publication_workspace,
+    fetch_publication_workspace_async,
+    fetch_publication_workspaces,
+)
+from app.connectors.ted_connector import search_ted_notices, search_ted_notices_async
 
-__all__ = ["fetch_publication_workspace", "search_ted_notices"]
+__all__ = [
+    "close_async_clients",
+    "fetch_publication_workspace",
+    "fetch_publication_workspace_async",
+    "fetch_publication_workspaces",
+    "run_async",
+    "search_ted_notices",
+    "search_ted_notices_async",
+]
@@ -0,0 +1,128 @@
+"""Shared httpx.AsyncClient pools for the async connector variants.
+
+httpx clients are bound to the event loop that first used them, so each
+AsyncClientPool keeps one client per running loop. Long-lived callers
+(FastAPI) reuse the same pool for the life of the process; short-lived
+event loops (bulk import, /notices/refresh) go through run_async(), which
+closes the loop's clients before asyncio.run() tears it down.
+"""
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Optional, TypeVar
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# All pools created in this process (for close_async_clients)
+_pools: "weakref.WeakSet[AsyncClientPool]" = weakref.WeakSet()
+
+
+class AsyncClientPool:
+    """Per-event-loop httpx.AsyncClient with keep-alive connection limits."""
+
+    def __init__(self, max_connections: int = 16, timeout_seconds: float = 30) -> None:
+        size = max(1, int(max_connections or 1))
+        self.limits = httpx.Limits(max_connections=size, max_keepalive_connections=size)
+        self.timeout_seconds = timeout_seconds
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        _pools.add(self)
+
+    def get(self) -> httpx.AsyncClient:
+        """Return the client for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout_seconds)
+            self._clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close the client bound to the running loop (if any)."""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+async def close_async_clients() -> None:
+    """Close every pooled client bound to the running loop."""
+    for pool in list(_pools):
+        try:
+            await pool.aclose()
+        except Exception as e:
+            logger.debug("Closing async client pool failed: %s", e)
+
+
+def run_async(awaitable: Awaitable[T]) -> T:
+    """asyncio.run() that closes the loop's pooled clients before the loop ends."""
+
+    async def _main() -> T:
+        try:
+            return await awaitable
+        finally:
+            await close_async_clients()
+
+    return asyncio.run(_main())
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    attempts: int = 3,
+    backoff_cap: float = 10,
+    label: str = "HTTP",
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Async request with the same policy as the sync connectors: retry 429/5xx and
+    transport errors with capped exponential backoff, never retry other 4xx.
+    The last response is returned; the last transport error is raised.
+    """
+    resp: Optional[httpx.Response] = None
+    for attempt in range(attempts):
+        try:
+            resp = await client.request(method, url, **kwargs)
+        except httpx.TransportError as e:
+            if attempt >= attempts - 1:
+                raise
+            backoff = min(2 ** attempt, backoff_cap)
+            logger.warning("%s request failed: %s, retry in %ss", label, e, backoff)
+            await asyncio.sleep(backoff)
+            continue
+        if resp.status_code == 429 or 500 <= resp.status_code < 600:
+            if attempt < attempts - 1:
+                backoff = min(2 ** attempt, backoff_cap)
+                logger.warning(
+                    "%s API %s, retry in %ss (attempt %s/%s)",
+                    label, resp.status_code, backoff, attempt + 1, attempts,
+                )
+                await asyncio.sleep(backoff)
+                continue
+        return resp
+    if resp is not None:
+        return resp
+    raise RuntimeError(f"{label} request failed after retries")
+
+
+def to_requests_response(resp: httpx.Response) -> requests.Response:
+    """
+    Copy an httpx response into a requests.Response so the sync clients'
+    response handling (raise_for_status, HTTPError, .ok, .json()) is reused as-is.
+    """
+    out = requests.Response()
+    out.status_code = resp.status_code
+    out._content = resp.content
+    out.headers = CaseInsensitiveDict(resp.headers)
+    out.url = str(resp.url)
+    out.reason = resp.reason_phrase
+    out.encoding = resp.encoding
+    return out
@@ -1,4 +1,5 @@
 """Provider router for Belgian e-Procurement (official API vs Playwright fallback)."""
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -43,6 +44,7 @@ def _get_client():  # noqa: ANN202
             dos_base_url=config.get("dos_base_url"),
             timeout_seconds=settings.eproc_timeout_seconds,
             cpv_probe=settings.eproc_cpv_probe,
+            pool_size=settings.eproc_pool_size,
         )
         _provider_name = "official"
         logger.info("e-Procurement provider: official (OAuth2)")
@@ -68,6 +70,7 @@ def _get_client():  # noqa: ANN202
                 dos_base_url=config.get("dos_base_url"),
                 timeout_seconds=settings.eproc_timeout_seconds,
                 cpv_probe=settings.eproc_cpv_probe,
+                pool_size=settings.eproc_pool_size,
             )
             _provider_name = "official"
             logger.info("e-Procurement provider: official (auto, credentials found)")
@@ -106,6 +109,29 @@ def search_publications(
     return client.search_publications(term=term, page=page, page_size=page_size)
 
 
+async def search_publications_async(
+    term: str,
+    page: int = 1,
+    page_size: int = 25,
+    publication_date_from: Optional[str] = None,
+    publication_date_to: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Async variant of search_publications. The official provider uses its shared
+    httpx pool; playwright runs in a worker thread (no native async support).
+    """
+    client, name = _get_client()
+
+    if name == "official":
+        return await client.search_publications_async(
+            term=term, page=page, page_size=page_size,
+            publication_date_from=publication_date_from,
+            publication_date_to=publication_date_to,
+        )
+
+    return await asyncio.to_thread(client.search_publications, term=term, page=page, page_size=page_size)
+
+
 def get_publication_detail(publication_id: str) -> Optional[dict[str, Any]]:
     """Get a single publication by ID (official only; playwright returns None)."""
     client, _ = _get_client()
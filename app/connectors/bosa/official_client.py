@@ -1,15 +1,19 @@
 """Official Belgian e-Procurement API client (OAuth2 client_credentials)."""
+import asyncio
 import json
 import logging
 import os
 import time
 import uuid
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from app.connectors.async_http import AsyncClientPool, request_with_retry, to_requests_response
 from app.connectors.bosa.exceptions import (
     EProcurementCredentialsError,
     EProcurementEndpointNotConfiguredError,
@@ -22,6 +26,13 @@ from app.connectors.bosa.openapi_discovery import (
 
 logger = logging.getLogger(__name__)
 
+# Retry: max attempts, backoff cap (seconds). Same policy as the TED client:
+# only 429/5xx and transport errors are retried; 4xx responses are returned as-is.
+EPROC_RETRY_ATTEMPTS = 3
+EPROC_RETRY_BACKOFF_CAP = 10
+# Default keep-alive pool size (connections per host); should cover EPROC_DETAIL_CONCURRENCY.
+EPROC_DEFAULT_POOL_SIZE = 16
+
 
 class OfficialEProcurementClient:
     """
@@ -42,6 +53,7 @@ class OfficialEProcurementClient:
         endpoints: Optional[DiscoveredEndpoints] = None,
         endpoint_confirmed: bool = False,
         cpv_probe: bool = False,
+        pool_size: int = EPROC_DEFAULT_POOL_SIZE,
     ):
         self.token_url = token_url.rstrip("/")
         self.client_id = client_id
@@ -58,8 +70,17 @@ class OfficialEProcurementClient:
         # In-memory token cache
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0.0
+        # One token refresh at a time per event loop (asyncio.Lock is loop-bound)
+        self._token_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
         self._refresh_before_seconds = 60
 
+        # Pooled keep-alive session shared by all API calls (Search, Dos, Location)
+        self._session = _make_session(pool_size)
+        # Async variants share one httpx pool of the same size (per event loop)
+        self._async_pool = AsyncClientPool(max_connections=pool_size, timeout_seconds=timeout_seconds)
+
     @staticmethod
     def _truthy(value: Any) -> bool:
         """Check if value is truthy (handles strings like 'true', '1', etc.)."""
@@ -209,6 +230,82 @@ class OfficialEProcurementClient:
             headers.update(extra_headers)
         return headers
 
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+
+    async def _auth_headers_async(
+        self, extra_headers: Optional[dict[str, str]] = None, accept_language: Optional[str] = None,
+    ) -> dict[str, str]:
+        """_auth_headers for async callers: a token refresh runs in a worker thread.
+
+        Concurrent coroutines seeing an expiring token wait for a single refresh.
+        """
+        self._require_credentials()
+        if self._token_expiring():
+            lock = self._token_locks.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+            async with lock:
+                if self._token_expiring():  # not refreshed while we waited
+                    await asyncio.to_thread(self.get_access_token)
+        return self._auth_headers(extra_headers, accept_language=accept_language)
+
+    def _token_expiring(self) -> bool:
+        return not self._access_token or self._token_expires_at <= time.time() + self._refresh_before_seconds
+
+    async def _request_async(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Async request on the shared httpx pool with the same retry policy as _request_with_retry."""
+        resp = await request_with_retry(
+            self._async_pool.get(),
+            method,
+            url,
+            attempts=EPROC_RETRY_ATTEMPTS,
+            backoff_cap=EPROC_RETRY_BACKOFF_CAP,
+            label="e-Procurement",
+            **kwargs,
+        )
+        return to_requests_response(resp)
+
+    def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Perform request on the pooled session with retry on 429/5xx and transport errors.
+        Backoff is exponential and capped. After the last attempt the response is returned
+        (callers keep their own raise_for_status / status handling).
+        """
+        kwargs.setdefault("timeout", self.timeout_seconds)
+        resp: requests.Response | None = None
+        for attempt in range(EPROC_RETRY_ATTEMPTS):
+            try:
+                resp = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= EPROC_RETRY_ATTEMPTS - 1:
+                    raise
+                backoff = min(2 ** attempt, EPROC_RETRY_BACKOFF_CAP)
+                logger.warning("e-Procurement request failed: %s, retry in %ss", e, backoff)
+                time.sleep(backoff)
+                continue
+            status = resp.status_code
+            if isinstance(status, int) and (status == 429 or 500 <= status < 600):
+                if attempt < EPROC_RETRY_ATTEMPTS - 1:
+                    backoff = min(2 ** attempt, EPROC_RETRY_BACKOFF_CAP)
+                    logger.warning(
+                        "e-Procurement API %s, retry in %ss (attempt %s/%s)",
+                        status,
+                        backoff,
+                        attempt + 1,
+                        EPROC_RETRY_ATTEMPTS,
+                    )
+                    time.sleep(backoff)
+                    continue
+            return resp
+        if resp is not None:
+            return resp
+        raise RuntimeError("e-Procurement request failed after retries")
+
     def request(
         self,
         method: str,
@@ -229,15 +326,39 @@ class OfficialEProcurementClient:
         if headers:
             auth_headers.update(headers)
         timeout = timeout or self.timeout_seconds
-        return requests.request(
-            method=method.upper(),
-            url=url,
+        return self._request_with_retry(
+            method.upper(),
+            url,
             params=params,
             json=json_data,
             headers=auth_headers,
             timeout=timeout,
         )
 
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict[str, Any]] = None,
+        json_data: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> requests.Response:
+        """Async variant of request() on the shared httpx pool."""
+        self._require_credentials()
+        auth_headers = await self._auth_headers_async()
+        if headers:
+            auth_headers.update(headers)
+        return await self._request_async(
+            method.upper(),
+            url,
+            params=params,
+            json=json_data,
+            headers=auth_headers,
+            timeout=timeout or self.timeout_seconds,
+        )
+
     def discover_openapi(self, swagger_url: str, cache_dir: Optional[Path] = None) -> dict[str, Any]:
         """
         Download and cache OpenAPI/Swagger JSON from URL.
@@ -281,19 +402,15 @@ class OfficialEProcurementClient:
 
         return swagger_data
 
-    def search_publications(
+    def _prepare_search(
         self,
         term: str,
-        page: int = 1,
-        page_size: int = 25,
-        publication_date_from: str | None = None,
-        publication_date_to: str | None = None,
-    ) -> dict[str, Any]:
-        """
-        Search publications. Returns structure compatible with Playwright collector:
-        {"metadata": {...}, "json": {...}}
-        publication_date_from / publication_date_to: YYYY-MM-DD date filters.
-        """
+        page: int,
+        page_size: int,
+        publication_date_from: str | None,
+        publication_date_to: str | None,
+    ) -> tuple[str, str, dict[str, Any]]:
+        """Resolve the search endpoint and build (method, url, request kwargs) for one page."""
         self._require_credentials()
         if not self.search_base_url:
             raise EProcurementEndpointNotConfiguredError(
@@ -339,32 +456,15 @@ class OfficialEProcurementClient:
             qparams["publicationDateFrom"] = publication_date_from
         if publication_date_to:
             qparams["publicationDateTo"] = publication_date_to
-        headers = self._auth_headers()
+
+        if method != "GET" and style == "json_body":
+            return method, url, {"json": qparams}
+        return method, url, {"params": qparams}
+
+    @staticmethod
+    def _search_result(resp: requests.Response, term: str, page: int, page_size: int) -> dict[str, Any]:
+        """Validate a search response and wrap it as {"metadata": {...}, "json": {...}}."""
         try:
-            if method == "GET":
-                resp = requests.request(
-                    method,
-                    url,
-                    params=qparams,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
-            elif style == "json_body":
-                resp = requests.request(
-                    method,
-                    url,
-                    json=qparams,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
-            else:
-                resp = requests.request(
-                    method,
-                    url,
-                    params=qparams,
-                    headers=headers,
-                    timeout=self.timeout_seconds,
-                )
             status = resp.status_code
             resp.raise_for_status()
 
@@ -393,32 +493,56 @@ class OfficialEProcurementClient:
                 f"Search API error (status={e.response.status_code}): {e.response.text[:300]}"
             ) from e
 
-    def get_publication_workspace(self, publication_workspace_id: str) -> Optional[dict[str, Any]]:
+    def search_publications(
+        self,
+        term: str,
+        page: int = 1,
+        page_size: int = 25,
+        publication_date_from: str | None = None,
+        publication_date_to: str | None = None,
+    ) -> dict[str, Any]:
         """
-        Get publication workspace from Dos API.
-        
-        Args:
-            publication_workspace_id: The publication workspace identifier.
-        
-        Returns:
-            JSON dict if successful, None on 401/403/404.
-        
-        Raises:
-            EProcurementEndpointNotConfiguredError: If dos_base_url is not set.
+        Search publications. Returns structure compatible with Playwright collector:
+        {"metadata": {...}, "json": {...}}
+        publication_date_from / publication_date_to: YYYY-MM-DD date filters.
         """
+        method, url, kwargs = self._prepare_search(
+            term, page, page_size, publication_date_from, publication_date_to,
+        )
+        headers = self._auth_headers()
+        resp = self._request_with_retry(method, url, headers=headers, **kwargs)
+        return self._search_result(resp, term, page, page_size)
+
+    async def search_publications_async(
+        self,
+        term: str,
+        page: int = 1,
+        page_size: int = 25,
+        publication_date_from: str | None = None,
+        publication_date_to: str | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of search_publications on the shared httpx pool (same return shape)."""
+        method, url, kwargs = self._prepare_search(
+            term, page, page_size, publication_date_from, publication_date_to,
+        )
+        headers = await self._auth_headers_async()
+        resp = await self._request_async(method, url, headers=headers, **kwargs)
+        return self._search_result(resp, term, page, page_size)
+
+    def _dos_url(self, path: str) -> str:
+        """Build a Dos API URL; raises if EPROC_DOS_BASE_URL is not set."""
         if not self.dos_base_url:
             raise EProcurementEndpointNotConfiguredError(
                 "EPROC_DOS_BASE_URL is not set."
             )
-        
         self._require_credentials()
         self._ensure_endpoints_confirmed()
-        
-        url = f"{self.dos_base_url.rstrip('/')}/publication-workspaces/{publication_workspace_id}"
-        headers = self._auth_headers()
-        
+        return f"{self.dos_base_url.rstrip('/')}{path}"
+
+    @staticmethod
+    def _json_or_none(resp: requests.Response) -> Optional[dict[str, Any]]:
+        """Parsed JSON body, or None on 401/403/404, other HTTP errors or non-JSON."""
         try:
-            resp = requests.get(url, headers=headers, timeout=self.timeout_seconds)
             if resp.status_code in (401, 403, 404):
                 return None
             resp.raise_for_status()
@@ -428,6 +552,32 @@ class OfficialEProcurementClient:
         except ValueError:
             return None
 
+    def get_publication_workspace(self, publication_workspace_id: str) -> Optional[dict[str, Any]]:
+        """
+        Get publication workspace from Dos API.
+        
+        Args:
+            publication_workspace_id: The publication workspace identifier.
+        
+        Returns:
+            JSON dict if successful, None on 401/403/404.
+        
+        Raises:
+            EProcurementEndpointNotConfiguredError: If dos_base_url is not set.
+        """
+        url = self._dos_url(f"/publication-workspaces/{publication_workspace_id}")
+        headers = self._auth_headers()
+        
+        resp = self._request_with_retry("GET", url, headers=headers)
+        return self._json_or_none(resp)
+
+    async def get_publication_workspace_async(self, publication_workspace_id: str) -> Optional[dict[str, Any]]:
+        """Async variant of get_publication_workspace on the shared httpx pool."""
+        url = self._dos_url(f"/publication-workspaces/{publication_workspace_id}")
+        headers = await self._auth_headers_async()
+        resp = await self._request_async("GET", url, headers=headers)
+        return self._json_or_none(resp)
+
     def get_notice(self, notice_id: str) -> Optional[dict[str, Any]]:
         """
         Get notice from Dos API.
@@ -441,27 +591,11 @@ class OfficialEProcurementClient:
         Raises:
             EProcurementEndpointNotConfiguredError: If dos_base_url is not set.
         """
-        if not self.dos_base_url:
-            raise EProcurementEndpointNotConfiguredError(
-                "EPROC_DOS_BASE_URL is not set."
-            )
-        
-        self._require_credentials()
-        self._ensure_endpoints_confirmed()
-        
-        url = f"{self.dos_base_url.rstrip('/')}/notices/{notice_id}"
+        url = self._dos_url(f"/notices/{notice_id}")
         headers = self._auth_headers()
         
-        try:
-            resp = requests.get(url, headers=headers, timeout=self.timeout_seconds)
-            if resp.status_code in (401, 403, 404):
-                return None
-            resp.raise_for_status()
-            return resp.json()
-        except requests.HTTPError:
-            return None
-        except ValueError:
-            return None
+        resp = self._request_with_retry("GET", url, headers=headers)
+        return self._json_or_none(resp)
 
     def get_publication_detail(self, publication_id: str) -> Optional[dict[str, Any]]:
         """
@@ -495,7 +629,7 @@ class OfficialEProcurementClient:
         url = f"{self.search_base_url.rstrip('/')}{url_path}"
         headers = self._auth_headers()
         try:
-            resp = requests.get(url, headers=headers, timeout=self.timeout_seconds)
+            resp = self._request_with_retry("GET", url, headers=headers)
             if resp.status_code in (401, 403, 404):
                 return None
             resp.raise_for_status()
@@ -665,12 +799,11 @@ class OfficialEProcurementClient:
                 params[lang_param] = (lang or "fr").upper()[:2]
 
             try:
-                resp = requests.request(
+                resp = self._request_with_retry(
                     method,
                     url,
                     params=params,
                     headers=headers,
-                    timeout=self.timeout_seconds,
                 )
                 status_code = resp.status_code
                 last_status_code = status_code
@@ -784,7 +917,7 @@ class OfficialEProcurementClient:
             try:
                 # Try GET /cpvs with query params
                 url = f"{self.loc_base_url.rstrip('/')}/cpvs"
-                resp = requests.get(url, params=params, headers=headers, timeout=self.timeout_seconds)
+                resp = self._request_with_retry("GET", url, params=params, headers=headers)
                 
                 if resp.status_code == 200:
                     try:
@@ -844,6 +977,16 @@ class OfficialEProcurementClient:
             return None
 
 
+def _make_session(pool_size: int) -> requests.Session:
+    """Build a keep-alive session whose per-host pool holds up to pool_size connections."""
+    size = max(1, int(pool_size or 1))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def _extract_label_from_cpv_item(item: dict[str, Any], lang_match: str) -> Optional[str]:
     """
     Extract human-readable label from a CPV item.
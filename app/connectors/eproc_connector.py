@@ -1,4 +1,5 @@
 """E-Procurement connector: wraps BOSA official client for app use."""
+import asyncio
 import logging
 from typing import Any, Optional
 
@@ -27,3 +28,63 @@ def fetch_publication_workspace(publication_workspace_id: str) -> Optional[dict[
     except Exception as e:
         logger.warning("fetch_publication_workspace(%s) failed: %s", publication_workspace_id, e)
         return None
+
+
+async def fetch_publication_workspace_async(publication_workspace_id: str) -> Optional[dict[str, Any]]:
+    """Async variant of fetch_publication_workspace on the official client's shared httpx pool."""
+    try:
+        client, provider = _get_client()
+        if not isinstance(client, OfficialEProcurementClient):
+            logger.warning("Eproc connector: client is not OfficialEProcurementClient (provider=%s)", provider)
+            return None
+        return await client.get_publication_workspace_async(publication_workspace_id)
+    except Exception as e:
+        logger.warning("fetch_publication_workspace(%s) failed: %s", publication_workspace_id, e)
+        return None
+
+
+async def fetch_publication_workspaces(
+    publication_workspace_ids: list[str],
+    concurrency: int = 8,
+    rate_per_second: Optional[float] = None,
+) -> dict[str, Optional[dict[str, Any]]]:
+    """
+    Fetch many publication workspaces in parallel with bounded concurrency.
+
+    Fetches go through fetch_publication_workspace_async (no thread per request).
+    At most `concurrency` requests are in flight, and request starts are spaced to
+    stay within `rate_per_second` (None or 0 = no rate budget).
+
+    Returns:
+        {workspace_id: workspace dict | None}, in input order. Failed fetches
+        are logged and give None, as with fetch_publication_workspace.
+        Duplicate ids are fetched once.
+    """
+    ids = list(dict.fromkeys(publication_workspace_ids))
+    if not ids:
+        return {}
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    interval = 1.0 / rate_per_second if rate_per_second and rate_per_second > 0 else 0.0
+    rate_lock = asyncio.Lock()
+    next_start = 0.0
+
+    async def _wait_for_budget() -> None:
+        nonlocal next_start
+        if not interval:
+            return
+        async with rate_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            delay = next_start - now
+            next_start = max(now, next_start) + interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _fetch(workspace_id: str) -> Optional[dict[str, Any]]:
+        async with semaphore:
+            await _wait_for_budget()
+            return await fetch_publication_workspace_async(workspace_id)
+
+    results = await asyncio.gather(*(_fetch(wid) for wid in ids))
+    return dict(zip(ids, results))
@@ -43,23 +43,40 @@ def search_ted_notices(
     """
     client = _get_client()
     if client is None:
-        from datetime import datetime, timezone
-
-        return {
-            "metadata": {
-                "term": term,
-                "page": page,
-                "pageSize": page_size,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "url": None,
-                "status": None,
-                "totalCount": None,
-            },
-            "json": {"notices": [], "totalCount": 0},
-        }
+        return _off_result(term, page, page_size)
     return client.search_notices(term=term, page=page, page_size=page_size, debug=debug)
 
 
+async def search_ted_notices_async(
+    term: str,
+    page: int = 1,
+    page_size: int = 25,
+) -> dict[str, Any]:
+    """Async variant of search_ted_notices on the official client's shared httpx pool."""
+    client = _get_client()
+    if client is None:
+        return _off_result(term, page, page_size)
+    return await client.search_notices_async(term=term, page=page, page_size=page_size)
+
+
+def _off_result(term: str, page: int, page_size: int) -> dict[str, Any]:
+    """Empty search result returned when TED_MODE is "off"."""
+    from datetime import datetime, timezone
+
+    return {
+        "metadata": {
+            "term": term,
+            "page": page,
+            "pageSize": page_size,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "url": None,
+            "status": None,
+            "totalCount": None,
+        },
+        "json": {"notices": [], "totalCount": 0},
+    }
+
+
 def reset_client() -> None:
     """Reset cached client (for tests)."""
     global _client
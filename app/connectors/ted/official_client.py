@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 import requests
 
+from app.connectors.async_http import AsyncClientPool, request_with_retry, to_requests_response
+
 logger = logging.getLogger(__name__)
 
 # Retry: max attempts, backoff cap (seconds). Only 429/5xx are retried; 4xx (e.g. 400) are not.
@@ -126,6 +128,7 @@ class OfficialTEDClient:
         self.search_base_url = (search_base_url or "").rstrip("/")
         self.timeout_seconds = timeout_seconds
         self._session = requests.Session()
+        self._async_pool = AsyncClientPool(timeout_seconds=timeout_seconds)
 
     def _request_with_retry(
         self,
@@ -185,6 +188,46 @@ class OfficialTEDClient:
         Returns normalized shape: {"metadata": {...}, "json": <raw response>, "notices": [...]}.
         When debug=True, prints URL, request body, status, content-type, and on error first 1000 chars of body.
         """
+        url, body = self._prepare_search(term, page, page_size, fields)
+        resp = self._request_with_retry(
+            "POST",
+            url,
+            json=body,
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+        )
+        if debug:
+            _debug_print("POST", url, body, resp)
+        return self._search_result(resp, term, page, page_size)
+
+    async def search_notices_async(
+        self,
+        term: str,
+        page: int = 1,
+        page_size: int = 25,
+        fields: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Async variant of search_notices on the shared httpx pool (same return shape and errors)."""
+        url, body = self._prepare_search(term, page, page_size, fields)
+        resp = await request_with_retry(
+            self._async_pool.get(),
+            "POST",
+            url,
+            attempts=TED_RETRY_ATTEMPTS,
+            backoff_cap=TED_RETRY_BACKOFF_CAP,
+            label="TED",
+            json=body,
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+        )
+        return self._search_result(to_requests_response(resp), term, page, page_size)
+
+    def _prepare_search(
+        self,
+        term: str,
+        page: int,
+        page_size: int,
+        fields: Optional[list[str]],
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the search URL and request body (expert query, fields, page, limit)."""
         base_url = self.search_base_url.rstrip("/")
         url = f"{base_url}{TED_SEARCH_PATH}"
 
@@ -204,15 +247,12 @@ class OfficialTEDClient:
             "paginationMode": "PAGE_NUMBER",
         }
 
-        resp = self._request_with_retry(
-            "POST",
-            url,
-            json=body,
-            headers={"Accept": "application/json", "Content-Type": "application/json"},
-        )
+        return url, body
+
+    @staticmethod
+    def _search_result(resp: requests.Response, term: str, page: int, page_size: int) -> dict[str, Any]:
+        """Validate a search response and normalize it to {"metadata", "json", "notices"}."""
         status = resp.status_code
-        if debug:
-            _debug_print("POST", url, body, resp)
 
         # Detect HTML responses (wrong endpoint, e.g. website instead of API)
         ct = (resp.headers.get("Content-Type") or "")
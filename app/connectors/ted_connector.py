@@ -3,6 +3,7 @@ import logging
 from typing import Any
 
 from app.connectors.ted.client import search_ted_notices as _search_ted_notices
+from app.connectors.ted.client import search_ted_notices_async as _search_ted_notices_async
 
 logger = logging.getLogger(__name__)
 
@@ -27,3 +28,12 @@ def search_ted_notices(
         When TED is off, returns empty notices with metadata.
     """
     return _search_ted_notices(term=term, page=page, page_size=page_size, debug=debug)
+
+
+async def search_ted_notices_async(
+    term: str,
+    page: int = 1,
+    page_size: int = 25,
+) -> dict[str, Any]:
+    """Async variant of search_ted_notices (shared httpx pool, same return shape)."""
+    return await _search_ted_notices_async(term=term, page=page, page_size=page_size)
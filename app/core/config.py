@@ -44,6 +44,10 @@ class Settings(BaseSettings):
     )
     eproc_cpv_probe: bool = Field(False, validation_alias="EPROC_CPV_PROBE")
     eproc_timeout_seconds: int = Field(30, validation_alias="EPROC_TIMEOUT_SECONDS")
+    eproc_pool_size: int = Field(16, validation_alias="EPROC_POOL_SIZE")
+    # Workspace detail prefetch (fetch_details=True imports)
+    eproc_detail_concurrency: int = Field(8, validation_alias="EPROC_DETAIL_CONCURRENCY")
+    eproc_detail_rate_per_second: float = Field(10.0, validation_alias="EPROC_DETAIL_RATE_PER_SECOND")
 
     # BOSA e-Procurement OAuth2 (Client Credentials) - separate INT/PR environments
     eprocurement_env: str = Field("INT", validation_alias="EPROCUREMENT_ENV")  # INT | PR
@@ -134,6 +138,7 @@ class Settings(BaseSettings):
     import_ted_days_back: int = Field(3, validation_alias="IMPORT_TED_DAYS_BACK")
     import_page_size: int = Field(100, validation_alias="IMPORT_PAGE_SIZE")
     import_max_pages: int = Field(10, validation_alias="IMPORT_MAX_PAGES")
+    import_fetch_details: bool = Field(False, validation_alias="IMPORT_FETCH_DETAILS")
     backfill_after_import: bool = Field(True, validation_alias="BACKFILL_AFTER_IMPORT")
 
     # JWT (mock auth for Lovable; real user management later)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.models.notice import Notice  # alias for ProcurementNotice
 from app.models.notice_cpv_additional import NoticeCpvAdditional
+from app.models.notice_nuts import nuts_prefix_filter
 
 
 def list_notices(
@@ -43,12 +44,8 @@ def list_notices(
 
     # Filter by NUTS code prefix (replaces legacy country filter)
     if country:
-        # NUTS codes start with 2-letter country code (e.g. BE, FR)
-        # ProcurementNotice stores nuts_codes as JSON array
-        country_upper = country.upper()
-        query = query.filter(
-            cast(Notice.nuts_codes, String).ilike(f'%"{country_upper}%')
-        )
+        # NUTS codes start with 2-letter country code (e.g. BE, FR); see notice_nuts
+        query = query.filter(nuts_prefix_filter([country]))
 
     # Filter by CPV (main code or additional codes)
     if cpv:
@@ -58,7 +55,7 @@ def list_notices(
             Notice.id == NoticeCpvAdditional.notice_id,
         ).filter(
             or_(
-                Notice.cpv_main_code.like(f"{cpv_clean}%"),
+                Notice.cpv_digits.like(f"{cpv_clean}%"),
                 NoticeCpvAdditional.cpv_code.like(f"{cpv_clean}%"),
             )
         ).distinct()
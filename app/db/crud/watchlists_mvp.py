@@ -1,20 +1,29 @@
 """CRUD operations for watchlists MVP: arrays, match storage, description matching."""
 import json
-from datetime import datetime, timezone
+import time
+import uuid
+from datetime import date, datetime, timezone
 from typing import Any, Optional, Tuple
 
-from sqlalchemy import and_, cast, or_, func, String
+from sqlalchemy import and_, cast, delete, exists, insert, or_, func, String
 from sqlalchemy.orm import Session
 
 from app.models.notice import Notice  # alias for ProcurementNotice
 from app.models.notice_cpv_additional import NoticeCpvAdditional
+from app.models.notice_nuts import nuts_prefix_filter
+from app.models.notice_search_text import load_searchable_texts, searchable_text_filter
 from app.models.notice_detail import NoticeDetail
 from app.models.watchlist import Watchlist
 from app.models.watchlist_match import WatchlistMatch
+from app.utils.dates import naive_utc
+from app.utils.keyword_matcher import keyword_matcher
 from app.utils.searchable_text import build_searchable_text
 from app.utils.sources import DEFAULT_SOURCES, get_notice_sources_for_watchlist
 
 
+_REFRESH_CHUNK_SIZE = 1000
+
+
 def _parse_array(value: Optional[str]) -> list[str]:
     """Parse comma-separated string to list, empty if None."""
     if not value:
@@ -145,6 +154,7 @@ def update_watchlist(
     if notify_email is not None:
         wl.notify_email = notify_email if notify_email else None
     db.commit()
+    invalidate_watchlist_candidates(wl.id)
     db.refresh(wl)
     return wl
 
@@ -156,24 +166,22 @@ def delete_watchlist(db: Session, watchlist_id: str) -> bool:
         return False
     db.delete(wl)
     db.commit()
+    invalidate_watchlist_candidates(watchlist_id)
     return True
 
 
 def _match_keywords_sql(query, keywords: list[str]) -> Tuple[Any, list[str]]:
     """
-    Add SQL filters for keyword matching (title OR description).
+    Add SQL filter for keyword matching on the stored searchable text
+    (notice_search_texts, the text the Python deep-check reads).
     Returns (modified_query, matched_keywords_list_for_explanation).
     """
     if not keywords:
         return query, []
 
-    keyword_conditions = []
-    for keyword in keywords:
-        keyword_conditions.append(Notice.title.ilike(f"%{keyword}%"))
-        keyword_conditions.append(Notice.description.ilike(f"%{keyword}%"))
-
-    if keyword_conditions:
-        query = query.filter(or_(*keyword_conditions))
+    keyword_clause = searchable_text_filter(keywords)
+    if keyword_clause is not None:
+        query = query.filter(keyword_clause)
 
     return query, keywords
 
@@ -183,14 +191,10 @@ def _match_countries_sql(query, countries: list[str]) -> Tuple[Any, Optional[str
     NUTS codes start with 2-letter country code (e.g. BE, FR, NL)."""
     if not countries:
         return query, None
-    # Match NUTS codes containing country prefix in JSON array
-    country_conditions = []
-    for c in countries:
-        country_conditions.append(
-            cast(Notice.nuts_codes, String).ilike(f'%"{c.upper()}%')
-        )
-    if country_conditions:
-        query = query.filter(or_(*country_conditions))
+    # Match NUTS codes starting with the country prefix (notice_nuts side table)
+    country_clause = nuts_prefix_filter(countries)
+    if country_clause is not None:
+        query = query.filter(country_clause)
     return query, countries[0] if countries else None
 
 
@@ -207,19 +211,11 @@ def _match_cpv_prefixes_sql(query, cpv_prefixes: list[str]) -> Tuple[Any, list[s
         prefix_clean = prefix.replace("-", "").strip()
         if not prefix_clean:
             continue
-        # Match main CPV (normalized, no hyphens)
-        cpv_conditions.append(
-            func.replace(
-                func.replace(Notice.cpv_main_code, "-", ""), " ", ""
-            ).like(f"{prefix_clean}%")
-        )
+        # Match main CPV (normalized digits column)
+        cpv_conditions.append(Notice.cpv_digits.like(f"{prefix_clean}%"))
 
     if cpv_conditions:
-        # Also check additional CPVs via join
-        query = query.outerjoin(
-            NoticeCpvAdditional,
-            Notice.id == NoticeCpvAdditional.notice_id,
-        )
+        # Also check additional CPVs (EXISTS: no join fan-out, no GROUP BY over notices)
         additional_conditions = []
         for prefix in cpv_prefixes:
             prefix_clean = prefix.replace("-", "").strip()
@@ -230,10 +226,13 @@ def _match_cpv_prefixes_sql(query, cpv_prefixes: list[str]) -> Tuple[Any, list[s
                     ).like(f"{prefix_clean}%")
                 )
         if additional_conditions:
-            cpv_conditions.extend(additional_conditions)
-        # Use group_by(Notice.id) instead of .distinct() to avoid
-        # "could not identify an equality operator for type json" on JSON columns.
-        query = query.filter(or_(*cpv_conditions)).group_by(Notice.id)
+            cpv_conditions.append(
+                exists().where(
+                    NoticeCpvAdditional.notice_id == Notice.id,
+                    or_(*additional_conditions),
+                )
+            )
+        query = query.filter(or_(*cpv_conditions))
 
     return query, cpv_prefixes
 
@@ -270,6 +269,25 @@ def _build_matched_on_explanation(
     return ", ".join(parts) if parts else "no filters"
 
 
+def _searchable_texts(db: Session, notices: list[Notice]) -> dict[str, str]:
+    """
+    Lowercased searchable text by notice id: stored rows, built on the fly
+    (with NoticeDetail) for notices not materialized yet.
+    """
+    texts = load_searchable_texts(db, [n.id for n in notices])
+    missing = [n for n in notices if n.id not in texts]
+    if missing:
+        detail_map = {
+            d.notice_id: d
+            for d in db.query(NoticeDetail).filter(
+                NoticeDetail.notice_id.in_([n.id for n in missing])
+            )
+        }
+        for notice in missing:
+            texts[notice.id] = build_searchable_text(notice, detail_map.get(notice.id))
+    return texts
+
+
 def _check_keyword_in_searchable_text(
     notice: Notice, keywords: list[str], db: Session
 ) -> list[str]:
@@ -280,36 +298,28 @@ def _check_keyword_in_searchable_text(
     if not keywords:
         return []
 
-    detail = db.query(NoticeDetail).filter(NoticeDetail.notice_id == notice.id).first()
-    searchable_text = build_searchable_text(notice, detail)
-
-    matched = []
-    searchable_lower = searchable_text.lower()
-    for keyword in keywords:
-        if keyword.lower() in searchable_lower:
-            matched.append(keyword)
-
-    return matched
+    return keyword_matcher(keywords).found_in(_searchable_texts(db, [notice])[notice.id])
 
 
 def refresh_watchlist_matches(db: Session, watchlist: Watchlist, user=None) -> dict[str, int]:
     """
     Recompute and store matches for a watchlist idempotently.
-    Optimized: batch-loads NoticeDetail + NoticeCpvAdditional to avoid N+1.
+    Optimized: batch-loads stored searchable texts + NoticeCpvAdditional to avoid N+1.
     If user is provided, relevance scores include profile boost (geo + NACE).
-    Returns dict with counts: matched, added.
+
+    Reconciles instead of rewriting: the new match set is diffed against the
+    stored one and only inserts, deletes and changed score / explanation rows
+    are written (in bulk).
+    Returns dict with counts: matched, added, removed, updated.
     """
     from app.services.relevance_scoring import calculate_relevance_score
+    from app.services.watchlist_matcher import _MATCHED_ON_MAX, _update_match_scores
+
     keywords = _parse_array(watchlist.keywords)
     countries = _parse_array(watchlist.countries)
     cpv_prefixes = _parse_array(watchlist.cpv_prefixes)
     sources = _parse_sources_json(watchlist.sources)
 
-    # Delete existing matches (idempotent)
-    db.query(WatchlistMatch).filter(
-        WatchlistMatch.watchlist_id == watchlist.id
-    ).delete()
-
     query = db.query(Notice)
     query = _match_sources_sql(query, sources)
     query, matched_keywords_for_explanation = _match_keywords_sql(query, keywords)
@@ -319,24 +329,16 @@ def refresh_watchlist_matches(db: Session, watchlist: Watchlist, user=None) -> d
     )
 
     candidate_notices = query.all()
-    if not candidate_notices:
-        watchlist.last_refresh_at = datetime.now(timezone.utc)
-        db.commit()
-        return {"matched": 0, "added": 0}
-
     candidate_ids = [n.id for n in candidate_notices]
 
-    # Batch-load NoticeDetail for keyword deep-check (1 query instead of N)
-    detail_map: dict[str, NoticeDetail] = {}
-    if keywords:
-        details = db.query(NoticeDetail).filter(
-            NoticeDetail.notice_id.in_(candidate_ids)
-        ).all()
-        detail_map = {d.notice_id: d for d in details}
+    # Stored searchable texts for keyword deep-check (no per-candidate rebuild)
+    text_map: dict[str, str] = {}
+    if keywords and candidate_ids:
+        text_map = _searchable_texts(db, candidate_notices)
 
     # Batch-load additional CPVs (1 query instead of N)
     additional_cpv_map: dict[str, list[str]] = {}
-    if cpv_prefixes:
+    if cpv_prefixes and candidate_ids:
         additional_rows = db.query(NoticeCpvAdditional).filter(
             NoticeCpvAdditional.notice_id.in_(candidate_ids)
         ).all()
@@ -345,14 +347,15 @@ def refresh_watchlist_matches(db: Session, watchlist: Watchlist, user=None) -> d
                 (row.cpv_code or "").replace("-", "").strip()
             )
 
-    matched_count = 0
+    matcher = keyword_matcher(keywords)
+
+    # notice_id -> (matched_on, relevance_score) of the new match set
+    fresh: dict[str, tuple[str, int]] = {}
     for notice in candidate_notices:
-        # Keyword deep-check using pre-loaded details
+        # Keyword deep-check using pre-loaded searchable texts
         matched_kw = []
         if keywords:
-            detail = detail_map.get(notice.id)
-            searchable_text = build_searchable_text(notice, detail).lower()
-            matched_kw = [kw for kw in keywords if kw.lower() in searchable_text]
+            matched_kw = matcher.found_in(text_map[notice.id])
             if not matched_kw:
                 continue  # At least one keyword must match (OR logic)
 
@@ -377,19 +380,47 @@ def refresh_watchlist_matches(db: Session, watchlist: Watchlist, user=None) -> d
         )
 
         score, score_explanation = calculate_relevance_score(notice, watchlist, user=user)
-
-        db.add(WatchlistMatch(
-            watchlist_id=watchlist.id,
-            notice_id=notice.id,
-            matched_on=matched_on,
-            relevance_score=score,
-        ))
-        matched_count += 1
+        fresh[notice.id] = (matched_on[:_MATCHED_ON_MAX], score)
+
+    # Diff against stored matches
+    stored = {
+        notice_id: (match_id, matched_on, score)
+        for match_id, notice_id, matched_on, score in db.query(
+            WatchlistMatch.id,
+            WatchlistMatch.notice_id,
+            WatchlistMatch.matched_on,
+            WatchlistMatch.relevance_score,
+        ).filter(WatchlistMatch.watchlist_id == watchlist.id)
+    }
+    removed = [stored[nid][0] for nid in stored.keys() - fresh.keys()]
+    added = [
+        {
+            "id": str(uuid.uuid4()),
+            "watchlist_id": watchlist.id,
+            "notice_id": nid,
+            "matched_on": matched_on,
+            "relevance_score": score,
+        }
+        for nid, (matched_on, score) in fresh.items()
+        if nid not in stored
+    ]
+    changed = [
+        {"id": stored[nid][0], "relevance_score": score, "matched_on": matched_on}
+        for nid, (matched_on, score) in fresh.items()
+        if nid in stored and stored[nid][1:] != (matched_on, score)
+    ]
+
+    table = WatchlistMatch.__table__
+    for i in range(0, len(removed), _REFRESH_CHUNK_SIZE):
+        db.execute(delete(table).where(table.c.id.in_(removed[i:i + _REFRESH_CHUNK_SIZE])))
+    for i in range(0, len(added), _REFRESH_CHUNK_SIZE):
+        db.execute(insert(table), added[i:i + _REFRESH_CHUNK_SIZE])
+    _update_match_scores(db, changed)
 
     watchlist.last_refresh_at = datetime.now(timezone.utc)
     db.commit()
 
-    return {"matched": matched_count, "added": matched_count}
+    return {"matched": len(fresh), "added": len(added), "removed": len(removed), "updated": len(changed)}
 
 
 def list_watchlist_matches(
@@ -453,6 +484,8 @@ def _apply_extra_filters(query, source=None, q=None, sort="date_desc", active_on
         query = query.order_by(Notice.estimated_value.desc().nulls_last())
     else:
         query = query.order_by(Notice.publication_date.desc().nulls_last(), Notice.created_at.desc())
+    # Ties ordered by id: stable pages, same order as _sort_candidates()
+    query = query.order_by(Notice.id)
 
     return query, total
 
@@ -479,6 +512,115 @@ def _build_watchlist_query(db: Session, watchlist: Watchlist):
     return query
 
 
+# ── Aperçu / Nouveaux candidate cache (per watchlist, short TTL) ──
+# Sort / filter columns of the notices matching a watchlist's filters, so page
+# views (tab switches, pagination, sorting) skip the keyword / country / CPV
+# scan and the separate count. Entries are keyed by watchlist id and checked
+# against its filter values; dropped on watchlist edit and after imports.
+_CANDIDATE_TTL = 300  # seconds
+_CANDIDATE_CACHE_MAX = 200
+_CANDIDATE_MAX_ROWS = 5000  # larger match sets are paged in SQL
+_CANDIDATE_COLUMNS = (
+    Notice.id,
+    Notice.source,
+    Notice.publication_date,
+    Notice.created_at,
+    Notice.deadline,
+    Notice.estimated_value,
+)
+# watchlist id -> (cached_at, filter signature, rows or None when too many)
+_candidate_cache: dict[str, tuple[float, tuple, Optional[list[Any]]]] = {}
+
+
+def _watchlist_signature(watchlist: Watchlist) -> tuple:
+    """Watchlist values _build_watchlist_query() depends on."""
+    return (
+        watchlist.keywords,
+        watchlist.countries,
+        watchlist.cpv_prefixes,
+        watchlist.sources,
+        getattr(watchlist, "value_min", None),
+        getattr(watchlist, "value_max", None),
+    )
+
+
+def _watchlist_candidates(db: Session, watchlist: Watchlist) -> Optional[list[Any]]:
+    """Cached _CANDIDATE_COLUMNS rows of notices matching the watchlist (None if too many)."""
+    now = time.time()
+    signature = _watchlist_signature(watchlist)
+    cached = _candidate_cache.get(watchlist.id)
+    if cached and cached[1] == signature and (now - cached[0]) < _CANDIDATE_TTL:
+        return cached[2]
+
+    rows = (
+        _build_watchlist_query(db, watchlist)
+        .with_entities(*_CANDIDATE_COLUMNS)
+        .limit(_CANDIDATE_MAX_ROWS + 1)
+        .all()
+    )
+    candidates = rows if len(rows) <= _CANDIDATE_MAX_ROWS else None
+    if len(_candidate_cache) >= _CANDIDATE_CACHE_MAX:
+        _candidate_cache.clear()
+    _candidate_cache[watchlist.id] = (now, signature, candidates)
+    return candidates
+
+
+def invalidate_watchlist_candidates(watchlist_id: Optional[str] = None) -> None:
+    """Drop cached candidates of one watchlist (edit / delete), or of all (after imports)."""
+    if watchlist_id is None:
+        _candidate_cache.clear()
+    else:
+        _candidate_cache.pop(watchlist_id, None)
+
+
+def _nulls_last(rows: list[Any], field: str, descending: bool) -> list[Any]:
+    """Stable sort on field with NULLs last in either direction."""
+    with_value = sorted((r for r in rows if getattr(r, field) is not None),
+                        key=lambda r: getattr(r, field), reverse=descending)
+    return with_value + [r for r in rows if getattr(r, field) is None]
+
+
+def _sort_candidates(rows: list[Any], sort: str) -> list[Any]:
+    """Python counterpart of the ORDER BY in _apply_extra_filters (id breaks ties)."""
+    rows = sorted(rows, key=lambda r: r.id)
+    if sort == "date_asc":
+        return _nulls_last(rows, "publication_date", False)
+    if sort == "deadline":
+        return _nulls_last(rows, "deadline", False)
+    if sort == "deadline_desc":
+        return _nulls_last(rows, "deadline", True)
+    if sort == "value_desc":
+        return _nulls_last(rows, "estimated_value", True)
+    rows.sort(key=lambda r: r.created_at or datetime.min, reverse=True)
+    return _nulls_last(rows, "publication_date", True)
+
+
+def _page_candidates(
+    db: Session,
+    candidates: list[Any],
+    limit: int,
+    offset: int,
+    source: str | None,
+    sort: str,
+    active_only: bool,
+    created_after: Optional[datetime] = None,
+) -> Tuple[list[Notice], int]:
+    """Filter, sort and paginate cached candidates; load only the page's notices."""
+    rows = candidates
+    if source:
+        rows = [r for r in rows if r.source == source]
+    if active_only:
+        today = datetime.combine(date.today(), datetime.min.time())
+        rows = [r for r in rows if r.deadline is not None and r.deadline >= today]
+    if created_after is not None:
+        cutoff = naive_utc(created_after)
+        rows = [r for r in rows if r.created_at is not None and naive_utc(r.created_at) > cutoff]
+
+    page_ids = [r.id for r in _sort_candidates(rows, sort)[offset:offset + limit]]
+    by_id = {n.id: n for n in db.query(Notice).filter(Notice.id.in_(page_ids))} if page_ids else {}
+    return [by_id[nid] for nid in page_ids if nid in by_id], len(rows)
+
+
 def list_notices_for_watchlist(
     db: Session,
     watchlist: Watchlist,
@@ -491,8 +633,14 @@ def list_notices_for_watchlist(
 ) -> Tuple[list[Notice], int]:
     """
     Get notices matching a watchlist's filters via direct SQL query.
-    Fast read-only — no refresh, no match table.
+    Fast read-only — no refresh, no match table. Without a text filter (q),
+    pages are cut from the cached candidate rows.
     """
+    if not (q and q.strip()):
+        candidates = _watchlist_candidates(db, watchlist)
+        if candidates is not None:
+            return _page_candidates(db, candidates, limit, offset, source, sort, active_only)
+
     query = _build_watchlist_query(db, watchlist)
     query, total = _apply_extra_filters(query, source, q, sort, active_only)
     notices = query.offset(offset).limit(limit).all()
@@ -511,12 +659,19 @@ def list_new_since_for_watchlist(
 ) -> Tuple[list[Notice], int]:
     """
     Get NEW notices matching a watchlist — created since last_refresh_at.
-    Direct SQL query, no match table.
+    Direct SQL query, no match table (cached candidates when no q, as above).
     """
     cutoff = watchlist.last_refresh_at
     if not cutoff:
         return list_notices_for_watchlist(db, watchlist, limit, offset, source, q, sort, active_only)
 
+    if not (q and q.strip()):
+        candidates = _watchlist_candidates(db, watchlist)
+        if candidates is not None:
+            return _page_candidates(
+                db, candidates, limit, offset, source, sort, active_only, created_after=cutoff
+            )
+
     query = _build_watchlist_query(db, watchlist)
     query = query.filter(Notice.created_at > cutoff)
     query, total = _apply_extra_filters(query, source, q, sort, active_only)
@@ -0,0 +1,37 @@
+"""Count SQL statements executed by a session's engine on the current thread."""
+import threading
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class QueryCounter:
+    """
+    Context manager counting statements sent to the database while active.
+
+    Only statements issued from the thread that entered the context are counted,
+    so concurrent requests on the same engine do not inflate the figure.
+    executemany batches count as one statement.
+
+        with QueryCounter(db) as qc:
+            ...
+        logger.info("%d queries", qc.count)
+    """
+
+    def __init__(self, db: Session) -> None:
+        self._engine = db.get_bind()
+        self._thread_id = threading.get_ident()
+        self.count = 0
+
+    def _on_execute(self, conn: Any, cursor: Any, statement: str, params: Any, context: Any, executemany: bool) -> None:
+        if threading.get_ident() == self._thread_id:
+            self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        self._thread_id = threading.get_ident()
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
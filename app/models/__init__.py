@@ -9,8 +9,11 @@ from app.models.filter import Filter
 from app.models.notice import Notice, NoticeSource, ProcurementNotice
 from app.models.notice_cpv_additional import NoticeCpvAdditional
 from app.models.notice_detail import NoticeDetail
+from app.models.notice_facet_count import NoticeFacetCount
 from app.models.notice_document import NoticeDocument
 from app.models.notice_lot import NoticeLot
+from app.models.notice_nuts import NoticeNuts
+from app.models.notice_search_text import NoticeSearchText
 from app.models.watchlist import Watchlist
 from app.models.watchlist_match import WatchlistMatch
 from app.models.import_run import ImportRun
@@ -23,8 +26,11 @@ __all__ = [
     "NoticeSource",
     "NoticeCpvAdditional",
     "NoticeDetail",
+    "NoticeFacetCount",
     "NoticeDocument",
     "NoticeLot",
+    "NoticeNuts",
+    "NoticeSearchText",
     "ProcurementNotice",
     "Watchlist",
     "ImportRun",
@@ -5,13 +5,30 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Numeric, String, Text, func
+from sqlalchemy import Boolean, Computed, Date, DateTime, Index, Numeric, String, Text, func
 from sqlalchemy.types import JSON
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.models.base import Base
 
 
+_NAME_LANGUAGE_ORDER = ("fr", "nl", "en")
+
+
+def build_organisation_name_search(names: Any) -> Optional[str]:
+    """Distinct organisation names joined by " | ": fr, nl, en, then other languages (first = display name)."""
+    if not isinstance(names, dict):
+        return None
+    ordered = [names.get(lang) for lang in _NAME_LANGUAGE_ORDER]
+    ordered += [value for lang, value in names.items() if lang not in _NAME_LANGUAGE_ORDER]
+    parts: list[str] = []
+    for value in ordered:
+        name = str(value).strip() if value is not None else ""
+        if name and name not in parts:
+            parts.append(name)
+    return " | ".join(parts) or None
+
+
 class NoticeSource(str, enum.Enum):
     """Source of the procurement notice."""
 
@@ -44,6 +61,13 @@ class ProcurementNotice(Base):
     dossier_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     reference_number: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     cpv_main_code: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, index=True)
+    # Canonical digits of cpv_main_code ("45000000-7" → "450000007"), maintained by the DB;
+    # CPV prefix filters use cpv_digits LIKE '45%' (text_pattern_ops index on Postgres)
+    cpv_digits: Mapped[Optional[str]] = mapped_column(
+        String(20),
+        Computed("REPLACE(REPLACE(cpv_main_code, '-', ''), ' ', '')", persisted=True),
+        nullable=True,
+    )
     cpv_additional_codes: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)  # list of strings
     nuts_codes: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)  # list of strings
     publication_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
@@ -53,6 +77,9 @@ class ProcurementNotice(Base):
     form_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     organisation_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     organisation_names: Mapped[Optional[dict[str, str]]] = mapped_column(JSON, nullable=True)  # multilingual dict
+    # Flattened organisation_names for authority search (pg_trgm GIN index, migration 019);
+    # set with organisation_names on ORM writes, by the bulk import helpers on Core writes
+    organisation_name_search: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     publication_languages: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)  # list
     raw_data: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)  # full API response
 
@@ -103,9 +130,17 @@ class ProcurementNotice(Base):
         nullable=False,
     )
 
-    # Indexes are defined via index=True on each mapped_column above.
+    # Indexes are defined via index=True on each mapped_column above (except
+    # cpv_digits, which needs text_pattern_ops for LIKE 'prefix%' on Postgres).
     # UniqueConstraint on source_id is handled by unique=True on the column.
-    __table_args__: tuple = ()
+    __table_args__: tuple = (
+        Index("ix_notices_cpv_digits", "cpv_digits", postgresql_ops={"cpv_digits": "text_pattern_ops"}),
+    )
+
+    @validates("organisation_names")
+    def _set_organisation_name_search(self, key: str, value: Any) -> Any:
+        self.organisation_name_search = build_organisation_name_search(value)
+        return value
 
 
 # --- Backward-compatibility alias ---
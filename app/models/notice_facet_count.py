@@ -0,0 +1,176 @@
+"""Precomputed facet counts for /notices/facets: one row per (facet, value).
+
+Facets: source, cpv_division (first two CPV digits), nuts_country (first two
+letters of the notice's NUTS codes, once per notice) and notice_type. The
+notice total is the sum of the source rows (source is NOT NULL), so there is
+no single counter every insert / delete would lock. Reading them replaces the
+aggregate scans get_facets used to run whenever its cache expired.
+
+Kept in sync with deltas:
+- ORM writes: flush listeners below (inserted / deleted notices, changed facet
+  columns; flushes without such notice writes return before any query)
+- Core bulk / raw SQL writes: count_notice_facets() before and after the
+  write, then apply_facet_deltas() with the difference (imports, duplicate
+  cleanup, TED CPV fix)
+- Full rebuild / drift repair: refresh_facet_counts() (migration 021, daily cron)
+"""
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Integer, String, event, func, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.base import Base
+from app.models.notice import ProcurementNotice
+from app.models.notice_nuts import NoticeNuts, normalize_nuts_codes
+
+FACET_FIELDS = ("source", "cpv_main_code", "nuts_codes", "notice_type")
+_FACET_VALUE_MAX = 255
+_CHUNK_SIZE = 500
+
+FacetKey = tuple[str, str]
+
+
+class NoticeFacetCount(Base):
+    """Number of notices having `value` for `facet`."""
+
+    __tablename__ = "notice_facet_counts"
+
+    facet: Mapped[str] = mapped_column(String(32), primary_key=True)
+    value: Mapped[str] = mapped_column(String(_FACET_VALUE_MAX), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+def cpv_division(cpv_main_code: Optional[str]) -> Optional[str]:
+    """First two digits of a CPV code (same rule as the cpv_digits column)."""
+    digits = (cpv_main_code or "").replace("-", "").replace(" ", "")
+    return digits[:2] or None
+
+
+def facet_keys(
+    source: Optional[str],
+    cpv_main_code: Optional[str],
+    nuts_codes: Any,
+    notice_type: Optional[str],
+) -> list[FacetKey]:
+    """(facet, value) pairs a notice with these column values counts towards."""
+    keys: list[FacetKey] = []
+    if source:
+        keys.append(("source", source))
+    division = cpv_division(cpv_main_code)
+    if division:
+        keys.append(("cpv_division", division))
+    for country in dict.fromkeys(code[:2] for code in normalize_nuts_codes(nuts_codes)):
+        keys.append(("nuts_country", country))
+    if notice_type is not None:
+        keys.append(("notice_type", notice_type[:_FACET_VALUE_MAX]))
+    return keys
+
+
+def count_notice_facets(db: Any, notice_ids: Iterable[str]) -> Counter:
+    """Facet counts contributed by the given notices as currently stored."""
+    ids = list(dict.fromkeys(notice_ids))
+    counts: Counter = Counter()
+    table = ProcurementNotice.__table__
+    for i in range(0, len(ids), _CHUNK_SIZE):
+        for row in db.execute(
+            select(*(table.c[f] for f in FACET_FIELDS)).where(table.c.id.in_(ids[i:i + _CHUNK_SIZE]))
+        ):
+            counts.update(facet_keys(*row))
+    return counts
+
+
+def _upsert_counts(conn: Any, counts: dict[FacetKey, int], increment: bool) -> None:
+    """INSERT ... ON CONFLICT (facet, value): add to (increment) or replace count."""
+    if not counts:
+        return
+    dialect = getattr(conn, "dialect", None) or conn.bind.dialect
+    if dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    table = NoticeFacetCount.__table__
+    # Sorted keys: concurrent imports lock counter rows in the same order
+    rows = [{"facet": f, "value": v, "count": c} for (f, v), c in sorted(counts.items())]
+    stmt = insert(table).values(rows)
+    new_count = table.c["count"] + stmt.excluded["count"] if increment else stmt.excluded["count"]
+    conn.execute(stmt.on_conflict_do_update(index_elements=["facet", "value"], set_={"count": new_count}))
+
+
+def apply_facet_deltas(conn: Any, delta: Counter) -> None:
+    """Add non-zero deltas to the counters (conn: Session or Connection)."""
+    _upsert_counts(conn, {k: d for k, d in delta.items() if d}, increment=True)
+
+
+def refresh_facet_counts(db: Session) -> int:
+    """Recompute every counter from notices; writes only rows that differ.
+
+    Returns number of counter rows changed.
+    """
+    N = ProcurementNotice
+    division = func.substr(N.cpv_digits, 1, 2)
+    country = func.substr(NoticeNuts.nuts_code, 1, 2)
+    grouped = {
+        "source": db.query(N.source, func.count(N.id)).group_by(N.source),
+        "cpv_division": (
+            db.query(division, func.count(N.id)).filter(N.cpv_digits.isnot(None)).group_by(division)
+        ),
+        "nuts_country": (
+            db.query(country, func.count(func.distinct(NoticeNuts.notice_id)))
+            .join(N, N.id == NoticeNuts.notice_id)
+            .group_by(country)
+        ),
+        "notice_type": (
+            db.query(N.notice_type, func.count(N.id)).filter(N.notice_type.isnot(None)).group_by(N.notice_type)
+        ),
+    }
+    fresh: dict[FacetKey, int] = {}
+    for facet, rows in grouped.items():
+        for value, count in rows:
+            if value or (facet == "notice_type" and value is not None):
+                key = (facet, value[:_FACET_VALUE_MAX])
+                fresh[key] = fresh.get(key, 0) + count
+
+    current = {(r.facet, r.value): r.count for r in db.query(NoticeFacetCount)}
+    changed = {k: c for k, c in fresh.items() if current.get(k) != c}
+    changed.update({k: 0 for k, c in current.items() if k not in fresh and c})
+    _upsert_counts(db, changed, increment=False)
+    db.commit()
+    return len(changed)
+
+
+_PENDING_KEY = "notice_facet_counts_before"
+
+
+@event.listens_for(Session, "before_flush")
+def _snapshot_changed_notices(session: Session, flush_context: Any, instances: Any) -> None:
+    """Stored facet counts of notices this flush will change or delete."""
+    ids = [
+        obj.id for obj in session.deleted if isinstance(obj, ProcurementNotice)
+    ] + [
+        obj.id for obj in session.dirty
+        if isinstance(obj, ProcurementNotice)
+        and any(get_history(obj, f).has_changes() for f in FACET_FIELDS)
+    ]
+    if ids:
+        # Stored values: attributes may have been set on expired instances (no old value in memory)
+        session.info[_PENDING_KEY] = (ids, count_notice_facets(session.connection(), ids))
+
+
+@event.listens_for(Session, "after_flush")
+def _count_flushed_notices(session: Session, flush_context: Any) -> None:
+    """Apply facet deltas of notices inserted, deleted or changed by this flush."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    inserted = [obj for obj in session.new if isinstance(obj, ProcurementNotice)]
+    if pending is None and not inserted:
+        return  # no notice facet writes (read-only / unrelated flush)
+    delta = Counter()
+    if pending is not None:
+        ids, before = pending
+        delta = count_notice_facets(session.connection(), ids)
+        delta.subtract(before)
+    for obj in inserted:
+        delta.update(facet_keys(*(getattr(obj, f) for f in FACET_FIELDS)))
+    if any(delta.values()):
+        apply_facet_deltas(session.connection(), delta)
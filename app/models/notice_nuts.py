@@ -0,0 +1,120 @@
+"""Normalized NUTS codes of notices: one row per (notice, code).
+
+notices.nuts_codes is a JSON array, which cannot be prefix-searched through an
+index. This side table mirrors it (codes upper-cased, deduplicated) so NUTS and
+country filters become btree range lookups (nuts_code LIKE 'BE1%').
+
+Kept in sync:
+- ORM writes: after_flush listener below (new notices / nuts_codes changes)
+- Core bulk writes: call sync_notice_nuts(db, notice_ids) after the write
+- Existing rows: backfilled by migration 017
+"""
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import ForeignKey, Index, String, event, exists, or_
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.base import Base
+from app.models.notice import ProcurementNotice
+
+_NUTS_CODE_MAX = 20
+_SYNC_CHUNK_SIZE = 500
+
+
+class NoticeNuts(Base):
+    """NUTS code of a notice (normalized copy of notices.nuts_codes)."""
+
+    __tablename__ = "notice_nuts"
+
+    notice_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("notices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    nuts_code: Mapped[str] = mapped_column(String(_NUTS_CODE_MAX), primary_key=True)
+
+    __table_args__ = (
+        Index(
+            "ix_notice_nuts_code",
+            "nuts_code",
+            "notice_id",
+            postgresql_ops={"nuts_code": "text_pattern_ops"},
+        ),
+    )
+
+
+def normalize_nuts_codes(value: Any) -> list[str]:
+    """Distinct upper-cased codes from a nuts_codes value (non-lists → [])."""
+    if not isinstance(value, list):
+        return []
+    codes: list[str] = []
+    for code in value:
+        c = str(code).strip().upper() if code is not None else ""
+        if c and len(c) <= _NUTS_CODE_MAX and c not in codes:
+            codes.append(c)
+    return codes
+
+
+def nuts_prefix_filter(prefixes: Iterable[str]) -> Optional[Any]:
+    """EXISTS clause: notice has a NUTS code starting with any prefix (None if no prefix)."""
+    clean = [p.strip().upper() for p in prefixes if p and p.strip()]
+    if not clean:
+        return None
+    return exists().where(
+        NoticeNuts.notice_id == ProcurementNotice.id,
+        or_(*(NoticeNuts.nuts_code.like(f"{p}%") for p in clean)),
+    )
+
+
+def _replace_nuts_rows(conn: Any, codes_by_notice: dict[str, list[str]], delete: bool = True) -> None:
+    """(Delete and) insert notice_nuts rows for the given notices."""
+    table = NoticeNuts.__table__
+    ids = list(codes_by_notice) if delete else []
+    for i in range(0, len(ids), _SYNC_CHUNK_SIZE):
+        conn.execute(table.delete().where(table.c.notice_id.in_(ids[i:i + _SYNC_CHUNK_SIZE])))
+    rows = [
+        {"notice_id": nid, "nuts_code": code}
+        for nid, codes in codes_by_notice.items()
+        for code in codes
+    ]
+    if rows:
+        conn.execute(table.insert(), rows)
+
+
+def sync_notice_nuts(db: Session, notice_ids: Iterable[str]) -> None:
+    """Rebuild notice_nuts rows from notices.nuts_codes (after Core bulk writes).
+
+    Ids of deleted notices are fine: their rows are removed.
+    """
+    ids = list(dict.fromkeys(notice_ids))
+    if not ids:
+        return
+    codes_by_notice: dict[str, list[str]] = {nid: [] for nid in ids}
+    for i in range(0, len(ids), _SYNC_CHUNK_SIZE):
+        for nid, nuts_codes in db.execute(
+            ProcurementNotice.__table__.select()
+            .with_only_columns(ProcurementNotice.id, ProcurementNotice.nuts_codes)
+            .where(ProcurementNotice.id.in_(ids[i:i + _SYNC_CHUNK_SIZE]))
+        ):
+            codes_by_notice[nid] = normalize_nuts_codes(nuts_codes)
+    _replace_nuts_rows(db, codes_by_notice)
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_flushed_notices(session: Session, flush_context: Any) -> None:
+    """Mirror nuts_codes of notices inserted or changed by this flush."""
+    inserted: dict[str, list[str]] = {}
+    changed: dict[str, list[str]] = {}
+    for obj in session.new:
+        if isinstance(obj, ProcurementNotice) and obj.id:
+            codes = normalize_nuts_codes(obj.nuts_codes)
+            if codes:
+                inserted[obj.id] = codes
+    for obj in session.dirty:
+        if isinstance(obj, ProcurementNotice) and get_history(obj, "nuts_codes").has_changes():
+            changed[obj.id] = normalize_nuts_codes(obj.nuts_codes)
+    if inserted:
+        _replace_nuts_rows(session.connection(), inserted, delete=False)
+    if changed:
+        _replace_nuts_rows(session.connection(), changed)
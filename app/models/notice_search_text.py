@@ -0,0 +1,152 @@
+"""Materialized keyword-matching text of notices: one row per notice.
+
+Watchlist refreshes deep-checked keywords against build_searchable_text(),
+rebuilt for every candidate on every refresh (raw_data walk + json.loads of
+notice_details.raw_json). The lowercased text is stored here instead, with a
+hash of its inputs so unchanged notices are never rewritten, and a pg_trgm
+index lets the keyword pre-filter (searchable_text_filter) run in SQL against
+the very text the Python check reads.
+
+Kept in sync:
+- ORM writes: after_flush listener below (notices title / description /
+  raw_data, notice_details raw_json)
+- Core bulk / raw SQL writes: call sync_notice_search_texts(db, notice_ids)
+  after the write (imports, BOSA / TED award enrichment)
+- Missing rows, and rows of notices updated since the previous run (repairs
+  writes outside the paths above): enrichment_service.refresh_search_texts()
+  in the daily cron
+"""
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import ForeignKey, Index, String, Text, and_, event, exists, or_, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.base import Base
+from app.models.notice import ProcurementNotice
+from app.models.notice_detail import NoticeDetail
+from app.utils.searchable_text import searchable_text_from_values, searchable_text_hash
+
+_SOURCE_FIELDS = ("title", "description", "raw_data")
+_SYNC_CHUNK_SIZE = 500
+
+
+class NoticeSearchText(Base):
+    """Lowercased searchable text of a notice (build_searchable_text output)."""
+
+    __tablename__ = "notice_search_texts"
+
+    notice_id: Mapped[str] = mapped_column(
+        String(36),
+        ForeignKey("notices.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    searchable_text: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    input_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+
+    __table_args__ = (
+        Index(
+            "ix_notice_search_texts_trgm",
+            "searchable_text",
+            postgresql_using="gin",
+            postgresql_ops={"searchable_text": "gin_trgm_ops"},
+        ),
+    )
+
+
+def searchable_text_filter(keywords: Iterable[str]) -> Optional[Any]:
+    """Notice contains any keyword (case-insensitive substring), None if no keyword.
+
+    Notices without a stored text yet fall back to title / description ILIKE.
+    """
+    clean = [kw.strip() for kw in keywords if kw and kw.strip()]
+    if not clean:
+        return None
+    N, T = ProcurementNotice, NoticeSearchText
+    stored = exists().where(
+        T.notice_id == N.id,
+        or_(*(T.searchable_text.contains(kw.lower(), autoescape=True) for kw in clean)),
+    )
+    missing = ~exists().where(T.notice_id == N.id)
+    fallback = or_(*(col.ilike(f"%{kw}%") for kw in clean for col in (N.title, N.description)))
+    return or_(stored, and_(missing, fallback))
+
+
+def load_searchable_texts(db: Any, notice_ids: Iterable[str]) -> dict[str, str]:
+    """Stored searchable_text by notice id (notices without a row are absent)."""
+    ids = list(dict.fromkeys(notice_ids))
+    texts: dict[str, str] = {}
+    T = NoticeSearchText.__table__
+    for i in range(0, len(ids), _SYNC_CHUNK_SIZE):
+        texts.update(db.execute(
+            select(T.c.notice_id, T.c.searchable_text).where(T.c.notice_id.in_(ids[i:i + _SYNC_CHUNK_SIZE]))
+        ).all())
+    return texts
+
+
+def _upsert_texts(conn: Any, rows: list[dict[str, str]]) -> None:
+    """INSERT ... ON CONFLICT (notice_id) DO UPDATE text and hash."""
+    dialect = getattr(conn, "dialect", None) or conn.bind.dialect
+    if dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(NoticeSearchText.__table__).values(rows)
+    conn.execute(stmt.on_conflict_do_update(
+        index_elements=["notice_id"],
+        set_={"searchable_text": stmt.excluded.searchable_text, "input_hash": stmt.excluded.input_hash},
+    ))
+
+
+def sync_notice_search_texts(db: Any, notice_ids: Iterable[str]) -> int:
+    """Rebuild stored texts whose inputs changed (db: Session or Connection).
+
+    Ids of deleted notices are skipped (rows go with the FK cascade).
+    Returns number of rows written.
+    """
+    ids = list(dict.fromkeys(notice_ids))
+    N, D, T = ProcurementNotice.__table__, NoticeDetail.__table__, NoticeSearchText.__table__
+    written = 0
+    for i in range(0, len(ids), _SYNC_CHUNK_SIZE):
+        chunk = ids[i:i + _SYNC_CHUNK_SIZE]
+        stored = dict(db.execute(select(T.c.notice_id, T.c.input_hash).where(T.c.notice_id.in_(chunk))).all())
+        rows = []
+        for nid, *inputs in db.execute(
+            select(N.c.id, N.c.title, N.c.description, N.c.raw_data, D.c.raw_json)
+            .outerjoin(D, D.c.notice_id == N.c.id)
+            .where(N.c.id.in_(chunk))
+        ):
+            input_hash = searchable_text_hash(*inputs)
+            if stored.get(nid) != input_hash:
+                rows.append({
+                    "notice_id": nid,
+                    "searchable_text": searchable_text_from_values(*inputs),
+                    "input_hash": input_hash,
+                })
+        if rows:
+            _upsert_texts(db, rows)
+            written += len(rows)
+    return written
+
+
+@event.listens_for(Session, "after_flush")
+def _sync_flushed_texts(session: Session, flush_context: Any) -> None:
+    """Rebuild texts of notices whose inputs were inserted or changed by this flush."""
+    ids: list[str] = []
+    for obj in session.new:
+        if isinstance(obj, ProcurementNotice):
+            ids.append(obj.id)
+        elif isinstance(obj, NoticeDetail):
+            ids.append(obj.notice_id)
+    for obj in session.dirty:
+        if isinstance(obj, ProcurementNotice) and any(
+            get_history(obj, f).has_changes() for f in _SOURCE_FIELDS
+        ):
+            ids.append(obj.id)
+        elif isinstance(obj, NoticeDetail) and get_history(obj, "raw_json").has_changes():
+            ids.append(obj.notice_id)
+    for obj in session.deleted:
+        if isinstance(obj, NoticeDetail):
+            ids.append(obj.notice_id)
+    if ids:
+        sync_notice_search_texts(session.connection(), ids)
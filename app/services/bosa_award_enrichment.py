@@ -16,6 +16,8 @@ from typing import Any, Optional
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.models.notice_search_text import sync_notice_search_texts
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,6 +100,7 @@ def enrich_bosa_can_batch(
         if not rows:
             break
 
+        raw_rewritten: list[str] = []
         for row in rows:
             if processed >= limit:
                 break
@@ -166,6 +169,7 @@ def enrich_bosa_can_batch(
                     text("UPDATE notices SET raw_data = :rd WHERE id = :nid"),
                     {"rd": json.dumps(workspace_data, default=str), "nid": notice_id},
                 )
+                raw_rewritten.append(notice_id)
                 stats["enriched"] += 1
 
             except Exception as e:
@@ -175,6 +179,8 @@ def enrich_bosa_can_batch(
                 )
                 stats["parse_errors"] += 1
 
+        # Raw SQL bypasses the ORM listeners: rebuild keyword matching texts
+        sync_notice_search_texts(db, raw_rewritten)
         db.commit()
         stats["batches"] += 1
         offset += batch_size
@@ -2,14 +2,17 @@
 
 Fetches all available notices from BOSA and/or TED by auto-paginating
 through all pages. Commits in batches to avoid huge transactions.
+Page fetches run ahead of DB imports through a bounded queue.
 """
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from sqlalchemy.orm import Session
 
+from app.connectors.async_http import run_async
 from app.services.notice_service import NoticeService
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,8 @@ def _ted_term_with_date(base_term: str, days_back: int = 3) -> str:
 # Hard safety limit to prevent runaway imports
 MAX_TOTAL_PAGES = 100
 MAX_PAGE_SIZE = 250
+# Pages the fetcher may run ahead of the importer
+DEFAULT_PREFETCH_PAGES = 2
 
 
 def _fetch_page_bosa(
@@ -98,10 +103,16 @@ def bulk_import_source(
     fetch_details: bool = False,
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
+    prefetch_pages: int = DEFAULT_PREFETCH_PAGES,
 ) -> dict[str, Any]:
     """
     Auto-paginating import for a single source.
 
+    Pages are pipelined: a fetcher task stays up to `prefetch_pages` pages
+    ahead of the importer through a bounded queue, so the API call for
+    page N+1 overlaps the DB import of page N. The whole run uses one
+    event loop.
+
     Args:
         source: "BOSA" or "TED"
         term: Search term
@@ -110,6 +121,7 @@ def bulk_import_source(
         fetch_details: Fetch full workspace details (BOSA only, slower)
         date_from: YYYY-MM-DD publication date filter (BOSA only)
         date_to: YYYY-MM-DD publication date filter (BOSA only)
+        prefetch_pages: Max pages fetched ahead of the importer (queue size, >= 1)
 
     Returns:
         Detailed stats with per-page breakdown.
@@ -143,100 +155,150 @@ def bulk_import_source(
         "pages": [],
     }
 
-    page = 1
+    effective_max = run_async(_run_pipeline(
+        svc, source, fetch_fn, term, page_size, max_pages, fetch_details,
+        max(1, prefetch_pages), stats,
+    ))
+
+    stats["completed_at"] = datetime.now(timezone.utc).isoformat()
+    elapsed_total = (
+        datetime.fromisoformat(stats["completed_at"])
+        - datetime.fromisoformat(stats["started_at"])
+    ).total_seconds()
+    stats["elapsed_seconds"] = round(elapsed_total, 1)
+    stats["effective_max_pages"] = effective_max
+
+    return stats
+
+
+async def _run_pipeline(
+    svc: NoticeService,
+    source: str,
+    fetch_fn: Callable[[str, int, int], dict[str, Any]],
+    term: str,
+    page_size: int,
+    max_pages: Optional[int],
+    fetch_details: bool,
+    prefetch_pages: int,
+    stats: dict[str, Any],
+) -> int:
+    """Producer/consumer page loop for bulk_import_source. Returns the effective page cap."""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=prefetch_pages)
     effective_max = min(max_pages if max_pages is not None else MAX_TOTAL_PAGES, MAX_TOTAL_PAGES)
 
-    while page <= effective_max:
-        page_start = datetime.now(timezone.utc)
+    async def fetcher() -> None:
+        nonlocal effective_max
+        page = 1
+        while page <= effective_max:
+            fetch_start = time.monotonic()
+            try:
+                result = await asyncio.to_thread(fetch_fn, term, page, page_size)
+            except Exception as e:
+                await queue.put((page, None, e, time.monotonic() - fetch_start))
+                page += 1
+                continue
 
-        try:
-            result = fetch_fn(term, page, page_size)
             items = result.get("items", [])
             total_count = result.get("total_count")
 
             # Store total count from first page
             if page == 1 and total_count is not None:
                 stats["api_total_count"] = total_count
-                if max_pages is None and total_count is not None:
+                if max_pages is None:
                     try:
                         needed_pages = (int(total_count) + page_size - 1) // page_size
                         effective_max = min(needed_pages, MAX_TOTAL_PAGES)
                     except (ValueError, TypeError):
                         pass
 
-            if not items:
-                logger.info("[Bulk %s] Page %d: empty, stopping", source, page)
-                break
-
-            # Import this page
-            if source == "BOSA":
-                page_stats = asyncio.run(
-                    svc.import_from_eproc_search(items, fetch_details=fetch_details)
-                )
-            else:
-                page_stats = asyncio.run(
-                    svc.import_from_ted_search(items, fetch_details=fetch_details)
-                )
-
-            created = page_stats.get("created", 0)
-            updated = page_stats.get("updated", 0)
-            skipped = page_stats.get("skipped", 0)
-            errors = page_stats.get("errors", [])
-
-            stats["total_created"] += created
-            stats["total_updated"] += updated
-            stats["total_skipped"] += skipped
-            stats["total_errors"] += len(errors)
-            stats["pages_fetched"] += 1
-
-            elapsed = (datetime.now(timezone.utc) - page_start).total_seconds()
-
-            page_info = {
-                "page": page,
-                "items_received": len(items),
-                "created": created,
-                "updated": updated,
-                "skipped": skipped,
-                "errors": len(errors),
-                "elapsed_seconds": round(elapsed, 1),
-            }
-            if errors:
-                page_info["error_details"] = errors[:3]  # Cap error details
-            stats["pages"].append(page_info)
-
-            logger.info(
-                "[Bulk %s] Page %d: %d items → %d new, %d updated (%.1fs)",
-                source, page, len(items), created, updated, elapsed,
-            )
-
-            # If we got fewer items than page_size, we've reached the end
-            if len(items) < page_size:
-                logger.info("[Bulk %s] Last page (got %d < %d)", source, len(items), page_size)
+            await queue.put((page, items, None, time.monotonic() - fetch_start))
+            # Empty or partial page: nothing left to fetch
+            if not items or len(items) < page_size:
                 break
-
-        except Exception as e:
-            stats["total_errors"] += 1
-            stats["pages"].append({
-                "page": page,
-                "error": str(e),
-            })
-            logger.exception("[Bulk %s] Page %d failed", source, page)
-            # Continue to next page on error
-            if page >= 3 and stats["total_created"] == 0 and stats["total_updated"] == 0:
-                logger.warning("[Bulk %s] 3 pages with no results, aborting", source)
+            page += 1
+        await queue.put(None)
+
+    fetch_task = asyncio.create_task(fetcher())
+    try:
+        while True:
+            entry = await queue.get()
+            if entry is None:
                 break
+            page, items, fetch_error, fetch_seconds = entry
+
+            try:
+                if fetch_error is not None:
+                    raise fetch_error
+
+                if not items:
+                    logger.info("[Bulk %s] Page %d: empty, stopping", source, page)
+                    break
+
+                import_start = time.monotonic()
+                if source == "BOSA":
+                    page_stats = await svc.import_from_eproc_search(items, fetch_details=fetch_details, bulk=True)
+                else:
+                    page_stats = await svc.import_from_ted_search(items, fetch_details=fetch_details, bulk=True)
+                import_seconds = time.monotonic() - import_start
+
+                created = page_stats.get("created", 0)
+                updated = page_stats.get("updated", 0)
+                skipped = page_stats.get("skipped", 0)
+                errors = page_stats.get("errors", [])
+
+                stats["total_created"] += created
+                stats["total_updated"] += updated
+                stats["total_skipped"] += skipped
+                stats["total_errors"] += len(errors)
+                stats["pages_fetched"] += 1
+
+                elapsed = fetch_seconds + import_seconds
+
+                page_info = {
+                    "page": page,
+                    "items_received": len(items),
+                    "created": created,
+                    "updated": updated,
+                    "skipped": skipped,
+                    "errors": len(errors),
+                    "elapsed_seconds": round(elapsed, 1),
+                    "fetch_seconds": round(fetch_seconds, 1),
+                    "import_seconds": round(import_seconds, 1),
+                }
+                if errors:
+                    page_info["error_details"] = errors[:3]  # Cap error details
+                stats["pages"].append(page_info)
+
+                logger.info(
+                    "[Bulk %s] Page %d: %d items → %d new, %d updated (%.1fs)",
+                    source, page, len(items), created, updated, elapsed,
+                )
 
-        page += 1
-
-    stats["completed_at"] = datetime.now(timezone.utc).isoformat()
-    elapsed_total = (
-        datetime.fromisoformat(stats["completed_at"])
-        - datetime.fromisoformat(stats["started_at"])
-    ).total_seconds()
-    stats["elapsed_seconds"] = round(elapsed_total, 1)
-    stats["effective_max_pages"] = effective_max
+                # If we got fewer items than page_size, we've reached the end
+                if len(items) < page_size:
+                    logger.info("[Bulk %s] Last page (got %d < %d)", source, len(items), page_size)
+                    break
+
+            except Exception as e:
+                stats["total_errors"] += 1
+                stats["pages"].append({
+                    "page": page,
+                    "error": str(e),
+                })
+                logger.exception("[Bulk %s] Page %d failed", source, page)
+                # Continue to next page on error
+                if page >= 3 and stats["total_created"] == 0 and stats["total_updated"] == 0:
+                    logger.warning("[Bulk %s] 3 pages with no results, aborting", source)
+                    break
+    finally:
+        # Importer stopped early (abort / empty page): drop pages fetched ahead
+        fetch_task.cancel()
+        try:
+            await fetch_task
+        except asyncio.CancelledError:
+            pass
 
-    return stats
+    return effective_max
 
 
 def bulk_import_all(
@@ -369,11 +431,16 @@ def bulk_import_all(
         total_created, total_updated, results["elapsed_seconds"],
     )
 
-    # Invalidate facets cache so next search page load gets fresh counts
+    # Invalidate facets / totals / watchlist candidate / preview caches so next page load is fresh
     if total_created > 0 or total_updated > 0:
         try:
-            from app.services.search_service import invalidate_facets_cache
+            from app.db.crud.watchlists_mvp import invalidate_watchlist_candidates
+            from app.services.preview_service import invalidate_preview_cache
+            from app.services.search_service import invalidate_facets_cache, invalidate_search_count_cache
             invalidate_facets_cache()
+            invalidate_search_count_cache()
+            invalidate_watchlist_candidates()
+            invalidate_preview_cache()
         except Exception:
             pass
 
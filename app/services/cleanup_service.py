@@ -2,9 +2,13 @@
 Cleanup: remove duplicate BOSA notices (same title + cpv + org, keep newest).
 """
 import logging
+from collections import Counter
+
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.models.notice_facet_count import apply_facet_deltas, count_notice_facets
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,6 +118,11 @@ def cleanup_bosa_duplicates(db: Session, dry_run: bool = True) -> dict:
             ) ranked WHERE rn > 1
         """
 
+        # Facet counters: subtract what the deleted notices contributed
+        doomed_ids = db.execute(text(ranked_subquery)).scalars().all()
+        facet_delta = Counter()
+        facet_delta.subtract(count_notice_facets(db, doomed_ids))
+
         r1 = db.execute(text(
             f"DELETE FROM notice_lots WHERE notice_id IN ({ranked_subquery})"
         ))
@@ -123,6 +132,7 @@ def cleanup_bosa_duplicates(db: Session, dry_run: bool = True) -> dict:
         r3 = db.execute(text(
             f"DELETE FROM notices WHERE id IN ({ranked_subquery})"
         ))
+        apply_facet_deltas(db, facet_delta)
         db.commit()
 
         stats["deleted_count"] = r3.rowcount
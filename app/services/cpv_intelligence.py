@@ -112,11 +112,11 @@ def list_cpv_groups_from_db(db: Session) -> list[dict[str, Any]]:
     """
     rows = db.execute(text("""
         SELECT
-            SUBSTRING(cpv_main_code FROM 1 FOR 3) AS grp,
+            SUBSTRING(cpv_digits FROM 1 FOR 3) AS grp,
             COUNT(*) AS cnt
         FROM notices
-        WHERE cpv_main_code IS NOT NULL
-          AND LENGTH(cpv_main_code) >= 3
+        WHERE cpv_digits IS NOT NULL
+          AND LENGTH(cpv_digits) >= 3
         GROUP BY grp
         ORDER BY cnt DESC
     """)).mappings().all()
@@ -138,19 +138,20 @@ def list_cpv_groups_from_db(db: Session) -> list[dict[str, Any]]:
 def _cpv_filter_clause(cpv_groups: list[str]) -> str:
     """Build SQL WHERE clause for CPV group filtering.
 
-    Uses SUBSTRING to match 3-digit group prefix.
+    Prefix match on the cpv_digits column (text_pattern_ops index);
+    the bound values carry the trailing '%' (see _cpv_params).
     Multiple groups are OR'd together.
     """
     if len(cpv_groups) == 1:
-        return "SUBSTRING(cpv_main_code FROM 1 FOR 3) = :cpv0"
-    clauses = [f"SUBSTRING(cpv_main_code FROM 1 FOR 3) = :cpv{i}"
+        return "cpv_digits LIKE :cpv0"
+    clauses = [f"cpv_digits LIKE :cpv{i}"
                for i in range(len(cpv_groups))]
     return "(" + " OR ".join(clauses) + ")"
 
 
 def _cpv_params(cpv_groups: list[str]) -> dict[str, str]:
-    """Build SQL params dict for CPV group codes."""
-    return {f"cpv{i}": g for i, g in enumerate(cpv_groups)}
+    """Build SQL params dict for CPV group codes (LIKE prefix patterns)."""
+    return {f"cpv{i}": f"{g}%" for i, g in enumerate(cpv_groups)}
 
 
 # ---------------------------------------------------------------------------
@@ -530,20 +531,16 @@ def get_geography(
     cpv_clause = _cpv_filter_clause(cpv_groups)
     params = {**_cpv_params(cpv_groups), "limit": limit}
 
-    # NUTS codes are stored as JSON arrays, so we unnest them
+    # NUTS codes come from the normalized notice_nuts side table
     rows = db.execute(text(f"""
         SELECT
-            nuts_code,
+            nn.nuts_code AS nuts_code,
             COUNT(*) AS cnt
-        FROM (
-            SELECT jsonb_array_elements_text(nuts_codes::jsonb) AS nuts_code
-            FROM notices
-            WHERE {cpv_clause}
-              AND cpv_main_code IS NOT NULL
-              AND nuts_codes IS NOT NULL
-              AND jsonb_typeof(nuts_codes::jsonb) = 'array'
-        ) sub
-        GROUP BY nuts_code
+        FROM notice_nuts nn
+        JOIN notices ON notices.id = nn.notice_id
+        WHERE {cpv_clause}
+          AND cpv_main_code IS NOT NULL
+        GROUP BY nn.nuts_code
         ORDER BY cnt DESC
         LIMIT :limit
     """), params).mappings().all()
@@ -197,11 +197,11 @@ def get_top_cpv(db: Session, limit: int = 20, active_only: bool = False) -> dict
     now = datetime.now(timezone.utc)
 
     query = db.query(
-        func.substr(Notice.cpv_main_code, 1, 2).label("division"),
+        func.substr(Notice.cpv_digits, 1, 2).label("division"),
         func.count(Notice.id).label("cnt"),
     ).filter(
-        Notice.cpv_main_code.isnot(None),
-        func.length(Notice.cpv_main_code) >= 2,
+        Notice.cpv_digits.isnot(None),
+        func.length(Notice.cpv_digits) >= 2,
     )
 
     if active_only:
@@ -228,41 +228,24 @@ def get_top_cpv(db: Session, limit: int = 20, active_only: bool = False) -> dict
 def get_top_authorities(db: Session, limit: int = 20, active_only: bool = False) -> dict[str, Any]:
     """
     Top contracting authorities by notice count.
-    Uses organisation_names JSON field (multilingual dict).
-    Falls back to organisation_id if names are missing.
+    Uses the denormalized organisation_name_search column (first name = display name).
+    Falls back to organisation_id if the query fails.
     """
     now = datetime.now(timezone.utc)
 
-    # For PostgreSQL: extract first value from organisation_names JSON
-    # organisation_names is like {"fr": "Ville de Bruxelles", "nl": "Stad Brussel"}
-    # We'll use raw SQL for JSON extraction
+    # Display name = first entry of organisation_name_search ("Ville de Bruxelles | Stad Brussel")
     try:
-        query_str = """
-            SELECT
-                COALESCE(
-                    (SELECT value FROM jsonb_each_text(organisation_names::jsonb) LIMIT 1),
-                    organisation_id,
-                    'Unknown'
-                ) AS authority_name,
-                COUNT(*) AS cnt
-            FROM notices
-            WHERE organisation_names IS NOT NULL
-              AND jsonb_typeof(organisation_names::jsonb) = 'object'
-        """
-        if active_only:
-            query_str += " AND deadline > :now"
-
-        query_str += """
-            GROUP BY authority_name
-            ORDER BY cnt DESC
-            LIMIT :limit
-        """
-
-        params: dict[str, Any] = {"limit": limit}
+        names = Notice.organisation_name_search
+        if db.bind.dialect.name == "postgresql":
+            authority_name = func.split_part(names, " | ", 1)
+        else:
+            authority_name = func.substr(names, 1, func.instr(names + " | ", " | ") - 1)
+        authority_name = authority_name.label("authority_name")
+
+        query = db.query(authority_name, func.count(Notice.id).label("cnt")).filter(names.isnot(None))
         if active_only:
-            params["now"] = now.isoformat()
-
-        rows = db.execute(text(query_str), params).fetchall()
+            query = query.filter(Notice.deadline > now)
+        rows = query.group_by(authority_name).order_by(text("cnt DESC")).limit(limit).all()
 
         return {
             "active_only": active_only,
@@ -272,7 +255,8 @@ def get_top_authorities(db: Session, limit: int = 20, active_only: bool = False)
             ],
         }
     except Exception as e:
-        logger.warning("Top authorities query failed (JSON compat): %s", e)
+        logger.warning("Top authorities query failed: %s", e)
+        db.rollback()
         # Fallback: group by organisation_id
         query = db.query(
             Notice.organisation_id,
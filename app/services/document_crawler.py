@@ -50,28 +50,50 @@ def _get_bosa_client():
     return client
 
 
+def _workspace_documents_url(client: Any, workspace_id: str) -> str:
+    dos_base = client.dos_base_url.rstrip("/")
+    return f"{dos_base}/publication-workspaces/{workspace_id}/documents?full=false&type=WORKSPACE"
+
+
+def _parse_workspace_documents(workspace_id: str, resp: Any) -> list[dict[str, Any]]:
+    """Document list from a /documents response ([] on 403/404/other errors)."""
+    if resp.status_code in (404, 403):
+        logger.debug("Workspace %s: %d", workspace_id, resp.status_code)
+        return []
+    if resp.status_code != 200:
+        logger.warning(
+            "Workspace %s documents: status=%d body=%s",
+            workspace_id, resp.status_code, resp.text[:200],
+        )
+        return []
+    data = resp.json()
+    return data if isinstance(data, list) else []
+
+
 def list_workspace_documents(workspace_id: str) -> list[dict[str, Any]]:
     """List documents for a publication workspace via official BOSA API.
 
     Uses OAuth2 + BelGov-Trace-Id headers (required by BOSA).
     """
     client = _get_bosa_client()
-    dos_base = client.dos_base_url.rstrip("/")
-    url = f"{dos_base}/publication-workspaces/{workspace_id}/documents?full=false&type=WORKSPACE"
+    url = _workspace_documents_url(client, workspace_id)
 
     try:
         resp = client.request("GET", url)
-        if resp.status_code in (404, 403):
-            logger.debug("Workspace %s: %d", workspace_id, resp.status_code)
-            return []
-        if resp.status_code != 200:
-            logger.warning(
-                "Workspace %s documents: status=%d body=%s",
-                workspace_id, resp.status_code, resp.text[:200],
-            )
-            return []
-        data = resp.json()
-        return data if isinstance(data, list) else []
+        return _parse_workspace_documents(workspace_id, resp)
+    except Exception as e:
+        logger.warning("Failed to list docs for workspace %s: %s", workspace_id, e)
+        return []
+
+
+async def list_workspace_documents_async(workspace_id: str) -> list[dict[str, Any]]:
+    """Async variant of list_workspace_documents on the BOSA client's shared httpx pool."""
+    client = _get_bosa_client()
+    url = _workspace_documents_url(client, workspace_id)
+
+    try:
+        resp = await client.request_async("GET", url)
+        return _parse_workspace_documents(workspace_id, resp)
     except Exception as e:
         logger.warning("Failed to list docs for workspace %s: %s", workspace_id, e)
         return []
@@ -227,6 +227,21 @@ def _doc_label(key: str) -> str:
 # ── Persistence ────────────────────────────────────────────────────
 
 
+def _extract_documents_for_notice(notice: Any) -> list[dict[str, Any]]:
+    """Dispatch raw_data extraction by notice source (TED, BOSA or both)."""
+    raw = getattr(notice, "raw_data", None)
+    if not isinstance(raw, dict):
+        return []
+
+    source = (getattr(notice, "source", None) or "").upper()
+
+    if "TED" in source:
+        return _extract_ted_documents(raw)
+    if "BOSA" in source:
+        return _extract_bosa_documents(raw, notice=notice)
+    return _extract_ted_documents(raw) + _extract_bosa_documents(raw, notice=notice)
+
+
 def extract_and_save_documents(
     db: Session,
     notice: Notice,
@@ -243,19 +258,7 @@ def extract_and_save_documents(
     Returns:
         Number of documents created.
     """
-    raw = notice.raw_data
-    if not isinstance(raw, dict):
-        return 0
-
-    source = (notice.source or "").upper()
-
-    if "TED" in source:
-        extracted = _extract_ted_documents(raw)
-    elif "BOSA" in source:
-        extracted = _extract_bosa_documents(raw, notice=notice)
-    else:
-        extracted = _extract_ted_documents(raw) + _extract_bosa_documents(raw, notice=notice)
-
+    extracted = _extract_documents_for_notice(notice)
     if not extracted:
         return 0
 
@@ -292,6 +295,49 @@ def extract_and_save_documents(
     return count
 
 
+def replace_documents_bulk(db: Session, notices: list[Any]) -> int:
+    """
+    Set-based equivalent of extract_and_save_documents(replace=True) for a page of notices.
+
+    One DELETE for all notices that yielded documents, then one multi-row INSERT.
+    Notices only need id, source, raw_data (and source_id / publication_workspace_id
+    for BOSA portal links), so lightweight row objects work as well as ORM entities.
+
+    Returns:
+        Number of documents created.
+    """
+    rows: list[dict[str, Any]] = []
+    notice_ids: list[str] = []
+    for notice in notices:
+        extracted = _extract_documents_for_notice(notice)
+        if not extracted:
+            continue
+        notice_ids.append(notice.id)
+        seen_urls: set[str] = set()
+        for doc in extracted:
+            if doc["url"] in seen_urls:
+                continue
+            seen_urls.add(doc["url"])
+            rows.append({
+                "id": str(uuid.uuid4()),
+                "notice_id": notice.id,
+                "title": (doc.get("title") or "Document")[:500],
+                "url": doc["url"][:2000],
+                "file_type": doc.get("file_type"),
+                "language": doc.get("language"),
+            })
+
+    if not notice_ids:
+        return 0
+
+    db.execute(
+        NoticeDocument.__table__.delete().where(NoticeDocument.notice_id.in_(notice_ids))
+    )
+    if rows:
+        db.execute(NoticeDocument.__table__.insert(), rows)
+    return len(rows)
+
+
 def backfill_documents_for_all(
     db: Session,
     source: Optional[str] = None,
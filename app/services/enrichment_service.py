@@ -630,24 +630,109 @@ def backfill_from_raw_data(
     return stats
 
 
-def refresh_search_vectors(db: Session) -> int:
+_SEARCH_VECTOR_SQL = """
+    notices_build_search_vector(
+        title, keywords::json, dossier_title, organisation_name_search, description
+    )
+"""
+
+
+def refresh_search_vectors(
+    db: Session,
+    notice_ids: Optional[list[str]] = None,
+    batch_size: int = 2000,
+) -> int:
     """
-    Refresh tsvector search_vector column for all notices (PostgreSQL only).
-    Uses the same trigger logic as migration 002.
-    Returns number of rows updated.
+    Incremental search_vector reindex (PostgreSQL only).
+
+    The notices trigger (migration 020) rebuilds the vector whenever an indexed
+    column changes, so this only fills rows that have none yet, or rebuilds the
+    given notice_ids. Works in committed batches so notices is never locked as a
+    whole. Returns number of rows updated.
     """
     if db.bind.dialect.name != "postgresql":
         logger.info("Skipping search_vector refresh (not PostgreSQL)")
         return 0
 
-    result = db.execute(text("""
-        UPDATE notices
-        SET search_vector = to_tsvector('simple',
-            coalesce(title, '') || ' ' || coalesce(description, '')
-        )
-    """))
-    db.commit()
-    return result.rowcount
+    total = 0
+    if notice_ids is not None:
+        ids = list(dict.fromkeys(notice_ids))
+        for i in range(0, len(ids), batch_size):
+            result = db.execute(
+                text(f"UPDATE notices SET search_vector = {_SEARCH_VECTOR_SQL} WHERE id = ANY(:ids)"),
+                {"ids": ids[i:i + batch_size]},
+            )
+            db.commit()
+            total += result.rowcount
+        return total
+
+    while True:
+        result = db.execute(text(f"""
+            UPDATE notices SET search_vector = {_SEARCH_VECTOR_SQL}
+            WHERE id IN (
+                SELECT id FROM notices WHERE search_vector IS NULL LIMIT :batch
+            )
+        """), {"batch": batch_size})
+        db.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+
+
+def refresh_search_texts(
+    db: Session,
+    notice_ids: Optional[list[str]] = None,
+    batch_size: int = 2000,
+    updated_since: Optional[datetime] = None,
+) -> int:
+    """
+    Incremental notice_search_texts maintenance (keyword matching text, migration 022).
+
+    Builds rows for notices that have none yet, then re-hashes stored rows of
+    notices updated at or after `updated_since` (repairs texts left stale by
+    raw SQL writes). With notice_ids, re-checks exactly those notices instead.
+    Rows whose input hash is unchanged are not rewritten. Works in committed
+    batches. Returns number of rows written.
+    """
+    from app.models.notice_search_text import NoticeSearchText, sync_notice_search_texts
+
+    total = 0
+    if notice_ids is not None:
+        ids = list(dict.fromkeys(notice_ids))
+        for i in range(0, len(ids), batch_size):
+            total += sync_notice_search_texts(db, ids[i:i + batch_size])
+            db.commit()
+        return total
+
+    while True:
+        ids = [
+            nid for (nid,) in db.query(Notice.id)
+            .outerjoin(NoticeSearchText, NoticeSearchText.notice_id == Notice.id)
+            .filter(NoticeSearchText.notice_id.is_(None))
+            .limit(batch_size)
+        ]
+        total += sync_notice_search_texts(db, ids)
+        db.commit()
+        if len(ids) < batch_size:
+            break
+
+    if updated_since is None:
+        return total
+
+    # Keyset over ids of recently updated notices (the hash check skips unchanged ones)
+    last_id = ""
+    while True:
+        ids = [
+            nid for (nid,) in db.query(Notice.id)
+            .filter(Notice.updated_at >= updated_since, Notice.id > last_id)
+            .order_by(Notice.id)
+            .limit(batch_size)
+        ]
+        if not ids:
+            return total
+        total += sync_notice_search_texts(db, ids)
+        db.commit()
+        last_id = ids[-1]
 
 
 # ── Data quality report ──────────────────────────────────────────────
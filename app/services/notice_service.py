@@ -3,17 +3,24 @@ import asyncio
 import logging
 from datetime import date, datetime
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any, Optional
+import uuid
 
+from sqlalchemy import bindparam, func, or_
 from sqlalchemy.orm import Session
 
-from app.connectors.eproc_connector import fetch_publication_workspace
-from app.connectors.ted_connector import search_ted_notices as search_ted_notices_app
+from app.connectors.eproc_connector import fetch_publication_workspaces
+from app.core.config import settings
+from app.connectors.ted_connector import search_ted_notices_async as search_ted_notices_app_async
 from app.models.notice_cpv_additional import NoticeCpvAdditional
+from app.models.notice_facet_count import apply_facet_deltas, count_notice_facets
+from app.models.notice_nuts import sync_notice_nuts
+from app.models.notice_search_text import sync_notice_search_texts
 from app.models.notice_lot import NoticeLot
-from app.connectors.bosa.client import search_publications as search_publications_bosa
-from app.services.document_extraction import extract_and_save_documents
-from app.models.notice import NoticeSource, ProcurementNotice
+from app.connectors.bosa.client import search_publications_async as search_publications_bosa_async
+from app.services.document_extraction import extract_and_save_documents, replace_documents_bulk
+from app.models.notice import NoticeSource, ProcurementNotice, build_organisation_name_search
 
 logger = logging.getLogger(__name__)
 
@@ -877,6 +884,164 @@ def _map_ted_item_to_notice(item: dict[str, Any], source_id: str) -> dict[str, A
     }
 
 
+# ── Set-based page writes ────────────────────────────────────────────
+
+# Award fields copied from a TED CAN onto its matching CN
+_CAN_FIELDS = (
+    "award_winner_name", "award_value", "award_date",
+    "number_tenders_received", "award_criteria_json",
+)
+
+# Rows per multi-VALUES statement (keeps bind params well under driver limits)
+_BULK_CHUNK_SIZE = 200
+
+
+def _dialect_insert(db: Session) -> Any:
+    """Dialect-specific insert() supporting ON CONFLICT (PostgreSQL, SQLite >= 3.24)."""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _with_derived_columns(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Add columns derived from mapped fields (set by the ORM on per-item writes)."""
+    if rows and "organisation_names" in rows[0]:
+        for row in rows:
+            row["organisation_name_search"] = build_organisation_name_search(row["organisation_names"])
+    return rows
+
+
+def _bulk_upsert_notices(
+    db: Session,
+    rows: list[dict[str, Any]],
+    update_existing: bool = True,
+) -> dict[str, str]:
+    """INSERT ... ON CONFLICT (source_id) DO UPDATE (or DO NOTHING) for fully mapped notice rows.
+
+    All rows must carry the same keys (including an explicit id). Returns
+    source_id -> id of the rows written (RETURNING): an existing row keeps its
+    own id, and with update_existing=False only inserted rows are returned.
+    """
+    stored: dict[str, str] = {}
+    if not rows:
+        return stored
+    rows = _with_derived_columns(rows)
+    table = ProcurementNotice.__table__
+    insert = _dialect_insert(db)
+    columns = list(rows[0].keys())
+    for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+        stmt = insert(table).values(rows[start:start + _BULK_CHUNK_SIZE])
+        if update_existing:
+            set_ = {c: stmt.excluded[c] for c in columns if c not in ("id", "source_id")}
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(index_elements=[table.c.source_id], set_=set_)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[table.c.source_id])
+        stored.update(db.execute(stmt.returning(table.c.source_id, table.c.id)).all())
+    return stored
+
+
+def _bulk_insert_notices(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Multi-row INSERT of new notice rows (same keys, explicit id), chunked."""
+    table = ProcurementNotice.__table__
+    rows = _with_derived_columns(rows)
+    for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+        db.execute(table.insert().values(rows[start:start + _BULK_CHUNK_SIZE]))
+
+
+def _bulk_update_notices(db: Session, rows: list[dict[str, Any]]) -> None:
+    """executemany UPDATE ... WHERE id = :b_id for fully mapped notice rows (same keys)."""
+    if not rows:
+        return
+    rows = _with_derived_columns(rows)
+    table = ProcurementNotice.__table__
+    columns = [c for c in rows[0].keys() if c != "id"]
+    values: dict[str, Any] = {c: bindparam(f"b_{c}", type_=table.c[c].type) for c in columns}
+    values["updated_at"] = func.now()
+    stmt = table.update().where(table.c.id == bindparam("b_id")).values(values)
+    db.execute(stmt, [{f"b_{k}": v for k, v in row.items()} for row in rows])
+
+
+def _bulk_merge_can_fields(db: Session, rows: list[dict[str, Any]]) -> None:
+    """executemany UPDATE of CAN award fields onto existing CNs (None keeps current value)."""
+    if not rows:
+        return
+    table = ProcurementNotice.__table__
+    values: dict[str, Any] = {
+        field: func.coalesce(bindparam(f"b_{field}", type_=table.c[field].type), table.c[field])
+        for field in _CAN_FIELDS
+    }
+    values["raw_data"] = bindparam("b_raw_data", type_=table.c.raw_data.type)
+    values["procedure_id"] = bindparam("b_procedure_id")
+    values["updated_at"] = func.now()
+    stmt = table.update().where(table.c.id == bindparam("b_id")).values(values)
+    db.execute(stmt, [
+        {
+            "b_id": row["id"],
+            "b_raw_data": row["raw_data"],
+            "b_procedure_id": row["procedure_id"],
+            **{f"b_{field}": row.get(field) for field in _CAN_FIELDS},
+        }
+        for row in rows
+    ])
+
+
+class _PageRow:
+    """In-memory state of one notices row while a page is reconciled."""
+
+    __slots__ = ("id", "values", "full", "is_new")
+
+    def __init__(self, row_id: str, values: dict[str, Any], full: bool, is_new: bool):
+        self.id = row_id
+        self.values = values
+        self.full = full  # values hold every mapped column (upsert) vs CAN-merge fields only
+        self.is_new = is_new
+
+
+def _is_cn_target(form_type: Optional[str], procedure_id: Optional[str]) -> bool:
+    """Mirror of the SQL CN lookup: procedure_id set and form_type != 'result' (NULL excluded)."""
+    return bool(procedure_id) and form_type is not None and form_type != "result"
+
+
+def _eproc_workspace_id(item: Any) -> Optional[str]:
+    """publicationWorkspaceId of a BOSA search item (None if missing/invalid)."""
+    if not isinstance(item, dict):
+        return None
+    wid = item.get("publicationWorkspaceId")
+    if wid and isinstance(wid, str):
+        return wid.strip() or None
+    return None
+
+
+def _bosa_child_rows(
+    notice_id: str,
+    lots: list[dict[str, Any]],
+    additional_cpv: list[str],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """NoticeLot / NoticeCpvAdditional insert rows for one BOSA notice."""
+    lot_rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "notice_id": notice_id,
+            "lot_number": lot_data.get("number"),
+            "title": lot_data.get("title"),
+            "description": lot_data.get("external_id"),
+            "cpv_code": None,
+            "nuts_code": None,
+        }
+        for lot_data in lots
+        if lot_data.get("number") is not None or lot_data.get("title")
+    ]
+    cpv_rows = [
+        {"notice_id": notice_id, "cpv_code": str(cpv_code).strip()[:20]}
+        for cpv_code in additional_cpv
+        if cpv_code and str(cpv_code).strip()
+    ]
+    return lot_rows, cpv_rows
+
+
 class NoticeService:
     """Import and manage BOSA procurement notices."""
 
@@ -887,39 +1052,42 @@ class NoticeService:
         self,
         search_results: list[dict],
         fetch_details: bool = True,
+        bulk: bool = False,
     ) -> dict[str, Any]:
         """
         Import notices from e-Procurement search results.
 
         Args:
             search_results: List of items from search API (e.g. publications list).
-            fetch_details: If True, fetch full workspace details for each item.
+            fetch_details: If True, fetch full workspace details for each item
+                (in parallel, see prefetch_workspaces).
+            bulk: If True, resolve dedup and write the page set-based
+                (see _import_eproc_page_bulk); falls back to the per-item path on failure.
 
         Returns:
             {"created": int, "updated": int, "skipped": int, "errors": list}
         """
+        # Fetch workspace details for the whole page up front (needed for dossier_id dedup)
+        workspaces = await self.prefetch_workspaces(search_results) if fetch_details else {}
+
+        if bulk:
+            try:
+                return self._import_eproc_page_bulk(search_results, workspaces)
+            except Exception:
+                self.db.rollback()
+                logger.exception("BOSA bulk import failed, retrying page item by item")
+
         stats = {"created": 0, "updated": 0, "skipped": 0, "errors": []}
 
         for item in search_results:
-            workspace_id = None
             raw = item if isinstance(item, dict) else None
-            if raw:
-                wid = raw.get("publicationWorkspaceId")
-                if wid and isinstance(wid, str):
-                    workspace_id = wid.strip()
+            workspace_id = _eproc_workspace_id(raw)
             if not workspace_id:
                 stats["skipped"] += 1
                 continue
 
             try:
-                # Fetch workspace detail first (needed for dossier_id dedup)
-                workspace: Optional[dict[str, Any]] = None
-                if fetch_details:
-                    workspace = await asyncio.to_thread(
-                        fetch_publication_workspace,
-                        workspace_id,
-                    )
-
+                workspace = workspaces.get(workspace_id)
                 attrs = _map_search_item_to_notice(raw, workspace, workspace_id)
                 bosa_lots = attrs.pop("_bosa_lots", [])
                 bosa_additional_cpv = attrs.pop("_bosa_additional_cpv", [])
@@ -992,15 +1160,188 @@ class NoticeService:
 
         return stats
 
+    async def prefetch_workspaces(
+        self,
+        search_results: list[dict],
+        concurrency: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        Fetch workspace details for every item on a page in parallel.
+
+        Bounded by EPROC_DETAIL_CONCURRENCY in-flight requests and an
+        EPROC_DETAIL_RATE_PER_SECOND start budget unless overridden.
+
+        Returns:
+            {workspace_id: workspace dict | None}; a failed fetch gives None
+            (the item is imported from its search fields alone).
+        """
+        workspace_ids = [wid for wid in (_eproc_workspace_id(item) for item in search_results) if wid]
+        return await fetch_publication_workspaces(
+            workspace_ids,
+            concurrency=concurrency or settings.eproc_detail_concurrency,
+            rate_per_second=(
+                rate_per_second if rate_per_second is not None
+                else settings.eproc_detail_rate_per_second
+            ),
+        )
+
+    def _import_eproc_page_bulk(
+        self,
+        search_results: list[dict],
+        workspaces: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Page-level BOSA import: one query resolves every dedup candidate
+        (title+CPV and source_id), the per-item dedup rules are replayed in
+        memory, then notices are written with a multi-row INSERT plus an
+        executemany UPDATE, and lots / additional CPVs are replaced with one
+        DELETE and one multi-row INSERT per table.
+
+        Raises on write failure; the caller rolls back and falls back to the
+        per-item path.
+        """
+        stats: dict[str, Any] = {"created": 0, "updated": 0, "skipped": 0, "errors": []}
+
+        # 1. Map the page (workspaces already prefetched, empty when fetch_details=False)
+        mapped: list[tuple[str, dict[str, Any], list[dict[str, Any]], list[str]]] = []
+        for item in search_results:
+            raw = item if isinstance(item, dict) else None
+            workspace_id = _eproc_workspace_id(raw)
+            if not workspace_id:
+                stats["skipped"] += 1
+                continue
+            try:
+                workspace = workspaces.get(workspace_id)
+                attrs = _map_search_item_to_notice(raw, workspace, workspace_id)
+            except Exception as e:
+                stats["errors"].append({"source_id": workspace_id, "message": str(e)})
+                logger.warning("Import failed for %s: %s", workspace_id, e)
+                continue
+            bosa_lots = attrs.pop("_bosa_lots", [])
+            bosa_additional_cpv = attrs.pop("_bosa_additional_cpv", [])
+            mapped.append((workspace_id, attrs, bosa_lots, bosa_additional_cpv))
+
+        if not mapped:
+            return stats
+
+        # 2. Resolve all dedup candidates in one query
+        titles = list({m[1]["title"] for m in mapped if m[1].get("title")})
+        source_ids = list({m[0] for m in mapped})
+        conditions = [ProcurementNotice.source_id.in_(source_ids)]
+        if titles:
+            conditions.append(
+                (ProcurementNotice.source == BOSA_SOURCE) & ProcurementNotice.title.in_(titles)
+            )
+        candidates = (
+            self.db.query(
+                ProcurementNotice.id,
+                ProcurementNotice.source,
+                ProcurementNotice.source_id,
+                ProcurementNotice.title,
+                ProcurementNotice.cpv_main_code,
+            )
+            .filter(or_(*conditions))
+            .all()
+        )
+
+        # id -> current (source, source_id, title, cpv) as the per-item loop would see it,
+        # indexed by source_id, BOSA title and BOSA (title, cpv); index values are
+        # insertion-ordered id sets so the first candidate wins, as in a linear scan
+        known: dict[str, tuple[str, str, Optional[str], Optional[str]]] = {}
+        by_source_id: dict[str, dict[str, None]] = {}
+        by_title: dict[str, dict[str, None]] = {}
+        by_title_cpv: dict[tuple[str, Optional[str]], dict[str, None]] = {}
+
+        def _index_keys(nid: str) -> list[tuple[dict, Any]]:
+            source, sid, title, cpv = known[nid]
+            keys: list[tuple[dict, Any]] = [(by_source_id, sid)]
+            if source == BOSA_SOURCE and title:
+                keys += [(by_title, title), (by_title_cpv, (title, cpv))]
+            return keys
+
+        def _remember(nid: str, row: tuple[str, str, Optional[str], Optional[str]]) -> None:
+            if nid in known:
+                for index, key in _index_keys(nid):
+                    index[key].pop(nid, None)
+            known[nid] = row
+            for index, key in _index_keys(nid):
+                index.setdefault(key, {})[nid] = None
+
+        for nid, source, sid, title, cpv in candidates:
+            _remember(nid, (source, sid, title, cpv))
+        existing_ids = set(known)
+
+        def _find(workspace_id: str, title: Optional[str], cpv: Optional[str]) -> Optional[str]:
+            if title:
+                hits = by_title_cpv.get((title, cpv)) if cpv else by_title.get(title)
+                if hits:
+                    return next(iter(hits))
+            hits = by_source_id.get(workspace_id)
+            return next(iter(hits)) if hits else None
+
+        # 3. Replay per-item dedup in page order (last write per notice wins)
+        notices: dict[str, dict[str, Any]] = {}
+        children: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {}
+        for workspace_id, attrs, bosa_lots, bosa_additional_cpv in mapped:
+            nid = _find(workspace_id, attrs.get("title"), attrs.get("cpv_main_code"))
+            if nid is not None:
+                stats["updated"] += 1
+            else:
+                nid = str(uuid.uuid4())
+                stats["created"] += 1
+            notices[nid] = {"id": nid, **attrs}
+            _remember(nid, (attrs["source"], attrs["source_id"], attrs.get("title"), attrs.get("cpv_main_code")))
+            children[nid] = _bosa_child_rows(nid, bosa_lots, bosa_additional_cpv)
+
+        # 4. Write notices, then replace child rows set-based
+        updated_ids = [nid for nid in notices if nid in existing_ids]
+        facets_before = count_notice_facets(self.db, updated_ids)
+        _bulk_insert_notices(self.db, [row for nid, row in notices.items() if nid not in existing_ids])
+        _bulk_update_notices(self.db, [notices[nid] for nid in updated_ids])
+
+        if updated_ids:
+            self.db.execute(NoticeLot.__table__.delete().where(NoticeLot.notice_id.in_(updated_ids)))
+            self.db.execute(
+                NoticeCpvAdditional.__table__.delete().where(NoticeCpvAdditional.notice_id.in_(updated_ids))
+            )
+        lot_rows = [row for lots, _ in children.values() for row in lots]
+        cpv_rows = [row for _, cpvs in children.values() for row in cpvs]
+        if lot_rows:
+            self.db.execute(NoticeLot.__table__.insert(), lot_rows)
+        if cpv_rows:
+            self.db.execute(NoticeCpvAdditional.__table__.insert(), cpv_rows)
+        sync_notice_nuts(self.db, notices)
+        sync_notice_search_texts(self.db, notices)
+        facet_delta = count_notice_facets(self.db, notices)
+        facet_delta.subtract(facets_before)
+        apply_facet_deltas(self.db, facet_delta)
+
+        replace_documents_bulk(self.db, [SimpleNamespace(**row) for row in notices.values()])
+
+        self.db.commit()
+        return stats
+
     async def import_from_ted_search(
         self,
         search_results: list[dict],
         fetch_details: bool = True,
+        bulk: bool = False,
     ) -> dict[str, Any]:
         """
         Import notices from TED search results.
         CAN (form-type=result) enriches existing CN via procedure_id.
+
+        bulk=True writes the whole page set-based (see _import_ted_page_bulk);
+        stats are identical to the per-item path, which remains the fallback.
         """
+        if bulk:
+            try:
+                return self._import_ted_page_bulk(search_results)
+            except Exception:
+                self.db.rollback()
+                logger.exception("TED bulk import failed, retrying page item by item")
+
         stats = {"created": 0, "updated": 0, "skipped": 0, "errors": [], "merged": 0}
 
         for item in search_results:
@@ -1041,10 +1382,6 @@ class NoticeService:
                     if target_cn:
                         # Enrich CN with CAN award fields
                         attrs = _map_ted_item_to_notice(raw, source_id)
-                        _CAN_FIELDS = (
-                            "award_winner_name", "award_value", "award_date",
-                            "number_tenders_received", "award_criteria_json",
-                        )
                         for field in _CAN_FIELDS:
                             new_val = attrs.get(field)
                             if new_val is not None:
@@ -1103,6 +1440,174 @@ class NoticeService:
 
         return stats
 
+    def _import_ted_page_bulk(self, search_results: list[dict]) -> dict[str, Any]:
+        """
+        Set-based TED page import: map every item, prefetch existing rows by
+        source_id and CN targets by procedure_id (one query each), replay the
+        per-item upsert/merge rules in memory, then write with one
+        INSERT ... ON CONFLICT (source_id) DO UPDATE per chunk.
+
+        Raises on write failure; the caller rolls back and falls back to the
+        per-item path.
+        """
+        stats: dict[str, Any] = {"created": 0, "updated": 0, "skipped": 0, "errors": [], "merged": 0}
+
+        # 1. Map the whole page
+        mapped: list[tuple[str, dict[str, Any], bool, Optional[str]]] = []
+        for item in search_results:
+            raw = item if isinstance(item, dict) else None
+            source_id = _ted_source_id(raw) if raw else None
+            if not source_id:
+                stats["skipped"] += 1
+                continue
+            try:
+                attrs = _map_ted_item_to_notice(raw, source_id)
+            except Exception as e:
+                stats["errors"].append({"source_id": source_id, "message": str(e)})
+                logger.warning("TED import failed for %s: %s", source_id, e)
+                continue
+            form_type = attrs.get("form_type")
+            is_can = bool(form_type) and form_type.lower() == "result"
+            mapped.append((source_id, attrs, is_can, attrs.get("procedure_id")))
+
+        if not mapped:
+            return stats
+
+        # 2. Prefetch existing rows (one query per key set)
+        source_ids = list({m[0] for m in mapped})
+        proc_ids = list({m[3] for m in mapped if m[2] and m[3]})
+
+        existing: dict[str, tuple[str, Optional[str], Optional[str]]] = {
+            sid: (nid, form_type, proc_id)
+            for nid, sid, form_type, proc_id in self.db.query(
+                ProcurementNotice.id,
+                ProcurementNotice.source_id,
+                ProcurementNotice.form_type,
+                ProcurementNotice.procedure_id,
+            ).filter(ProcurementNotice.source_id.in_(source_ids))
+        }
+
+        rows: dict[str, _PageRow] = {}
+        cn_by_proc: dict[str, str] = {}  # procedure_id -> source_id of CN target
+        if proc_ids:
+            targets = (
+                self.db.query(
+                    ProcurementNotice.id,
+                    ProcurementNotice.source_id,
+                    ProcurementNotice.procedure_id,
+                    ProcurementNotice.raw_data,
+                )
+                .filter(
+                    ProcurementNotice.source == TED_SOURCE,
+                    ProcurementNotice.procedure_id.in_(proc_ids),
+                    ProcurementNotice.form_type != "result",
+                )
+                .all()
+            )
+            for nid, sid, proc_id, raw_data in targets:
+                if proc_id in cn_by_proc:
+                    continue
+                cn_by_proc[proc_id] = sid
+                rows[sid] = _PageRow(nid, {"raw_data": raw_data}, full=False, is_new=False)
+                existing.setdefault(sid, (nid, None, proc_id))
+
+        def _row_for(sid: str) -> Optional[_PageRow]:
+            row = rows.get(sid)
+            if row is None and sid in existing:
+                row = rows[sid] = _PageRow(existing[sid][0], {}, full=False, is_new=False)
+            return row
+
+        def _reindex(sid: str, form_type: Optional[str], proc_id: Optional[str]) -> None:
+            for p, target_sid in list(cn_by_proc.items()):
+                if target_sid == sid:
+                    del cn_by_proc[p]
+            if _is_cn_target(form_type, proc_id):
+                cn_by_proc.setdefault(proc_id, sid)
+
+        # 3. Replay per-item rules in page order
+        deleted_ids: list[str] = []
+        for source_id, attrs, is_can, proc_id in mapped:
+            target_sid = cn_by_proc.get(proc_id) if is_can and proc_id else None
+            if target_sid is not None:
+                target = _row_for(target_sid)
+                for field in _CAN_FIELDS:
+                    if attrs.get(field) is not None:
+                        target.values[field] = attrs[field]
+                target.values["procedure_id"] = proc_id
+                merged_raw = dict(target.values.get("raw_data") or {})
+                merged_raw["_can_source_id"] = source_id
+                merged_raw["_can_publication_date"] = (
+                    attrs["publication_date"].isoformat() if attrs.get("publication_date") else None
+                )
+                target.values["raw_data"] = merged_raw
+
+                # Delete orphan CAN if it existed from a previous import (or earlier on this page)
+                orphan = _row_for(source_id)
+                if orphan is not None and orphan.id != target.id:
+                    if not orphan.is_new:
+                        deleted_ids.append(orphan.id)
+                    rows.pop(source_id, None)
+                    existing.pop(source_id, None)
+                    _reindex(source_id, None, None)
+
+                stats["merged"] += 1
+                continue
+
+            row = _row_for(source_id)
+            if row is not None:
+                row.values = dict(attrs)
+                row.full = True
+                stats["updated"] += 1
+            else:
+                rows[source_id] = _PageRow(str(uuid.uuid4()), dict(attrs), full=True, is_new=True)
+                stats["created"] += 1
+            _reindex(source_id, attrs.get("form_type"), attrs.get("procedure_id"))
+
+        # 4. Write: deletes, upserts, CAN merges onto untouched CNs, documents
+        upserts = [{"id": r.id, **r.values} for r in rows.values() if r.full and not r.is_new]
+        inserts = [{"id": r.id, **r.values} for r in rows.values() if r.full and r.is_new]
+        facets_before = count_notice_facets(self.db, deleted_ids + [row["id"] for row in upserts])
+        if deleted_ids:
+            self.db.execute(
+                ProcurementNotice.__table__.delete().where(ProcurementNotice.id.in_(deleted_ids))
+            )
+        merges = [
+            {"id": r.id, **r.values}
+            for r in rows.values()
+            if not r.full and "procedure_id" in r.values
+        ]
+        stored = _bulk_upsert_notices(self.db, upserts)
+        inserted = _bulk_upsert_notices(self.db, inserts, update_existing=False)
+
+        # source_ids stored by another importer since the prefetch: update that row (and id) instead
+        raced = [row for row in inserts if row["source_id"] not in inserted]
+        if raced:
+            raced_ids = dict(
+                self.db.query(ProcurementNotice.source_id, ProcurementNotice.id)
+                .filter(ProcurementNotice.source_id.in_([row["source_id"] for row in raced]))
+            )
+            for row in raced:
+                row["id"] = raced_ids[row["source_id"]]
+            facets_before.update(count_notice_facets(self.db, raced_ids.values()))
+            stored.update(_bulk_upsert_notices(self.db, raced))
+            stats["created"] -= len(raced)
+            stats["updated"] += len(raced)
+        for row in upserts:
+            row["id"] = stored.get(row["source_id"], row["id"])
+        upserts += inserts
+        touched_ids = deleted_ids + [row["id"] for row in upserts]
+
+        _bulk_merge_can_fields(self.db, merges)
+        sync_notice_nuts(self.db, touched_ids)
+        sync_notice_search_texts(self.db, [row["id"] for row in upserts + merges])
+        facet_delta = count_notice_facets(self.db, touched_ids)
+        facet_delta.subtract(facets_before)
+        apply_facet_deltas(self.db, facet_delta)
+        replace_documents_bulk(self.db, [SimpleNamespace(**row) for row in upserts])
+
+        self.db.commit()
+        return stats
+
     async def import_from_all_sources(
         self,
         search_criteria: dict[str, Any],
@@ -1142,8 +1647,7 @@ class NoticeService:
             if not run_bosa_src:
                 return
             try:
-                bosa_result = await asyncio.to_thread(
-                    search_publications_bosa,
+                bosa_result = await search_publications_bosa_async(
                     term=term,
                     page=page,
                     page_size=page_size,
@@ -1157,8 +1661,7 @@ class NoticeService:
             if not run_ted_src:
                 return
             try:
-                ted_result = await asyncio.to_thread(
-                    search_ted_notices_app,
+                ted_result = await search_ted_notices_app_async(
                     term=term,
                     page=page,
                     page_size=page_size,
@@ -0,0 +1,118 @@
+"""Preview engine behind the public /public/preview-matches teaser.
+
+Anonymous landing-page traffic used to run an OR of title ILIKEs, a full
+count and a separate sample query per request. Here:
+  - title ILIKE is served by the pg_trgm index ix_notices_title_trgm (migration 023)
+  - one query returns the 5 most recent matches plus the size of a capped
+    window (COUNT(*) OVER over at most _COUNT_CAP + 1 rows)
+  - totals beyond the cap use the Postgres planner estimate
+  - responses are cached for _PREVIEW_TTL seconds per normalized keywords + CPVs
+"""
+import time as _time
+from typing import Any
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.models.notice import ProcurementNotice
+
+_MAX_TERMS = 5  # keywords / CPV codes considered (first five of each)
+_SAMPLE_SIZE = 5
+_COUNT_CAP = 1000  # counted exactly up to here, estimated beyond
+
+# ── Response cache (in-memory, short TTL, keyed by normalized criteria) ──
+_preview_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+_PREVIEW_TTL = 120  # seconds
+_PREVIEW_CACHE_MAX = 1000
+
+
+def preview_key(keywords: list[str], cpv_codes: list[str]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Normalized criteria: usable keywords (lowercased) and CPV prefixes, sorted.
+
+    Title matching is case-insensitive and OR-ed, so order, case and
+    duplicates do not change the result.
+    """
+    kws = {kw.strip().lower() for kw in keywords[:_MAX_TERMS] if len(kw.strip()) >= 2}
+    cpvs = {c.replace("-", "").strip() for c in cpv_codes[:_MAX_TERMS]}
+    return tuple(sorted(kws)), tuple(sorted(c for c in cpvs if len(c) >= 2))
+
+
+def _authority(names: Any) -> str | None:
+    names = names if isinstance(names, dict) else {}
+    return (
+        names.get("fr")
+        or names.get("nl")
+        or names.get("en")
+        or next(iter(names.values()), None)
+    )
+
+
+def _run_preview(db: Session, keywords: tuple[str, ...], cpv_prefixes: tuple[str, ...]) -> dict[str, Any]:
+    N = ProcurementNotice
+    combined = or_(
+        *(N.title.ilike(f"%{kw}%") for kw in keywords),
+        *(N.cpv_digits.like(f"{cpv}%") for cpv in cpv_prefixes),
+    )
+    order = (N.publication_date.desc().nulls_last(), N.id)
+
+    # Most recent _COUNT_CAP + 1 matches; sample and window size in one round trip
+    window = (
+        select(
+            N.id, N.title, N.organisation_names, N.cpv_main_code,
+            N.source, N.publication_date, N.deadline,
+        )
+        .where(combined)
+        .order_by(*order)
+        .limit(_COUNT_CAP + 1)
+        .subquery()
+    )
+    rows = db.execute(
+        select(window, func.count().over().label("window_total"))
+        .order_by(window.c.publication_date.desc().nulls_last(), window.c.id)
+        .limit(_SAMPLE_SIZE)
+    ).all()
+
+    total = rows[0].window_total if rows else 0
+    if total > _COUNT_CAP and db.bind.dialect.name == "postgresql":
+        from app.services.search_service import _estimated_count
+        estimate = _estimated_count(db, db.query(N.id).filter(combined))
+        if estimate is not None:
+            total = max(estimate, total)
+
+    return {
+        "total_matches": total,
+        "sample": [
+            {
+                "title": r.title or "—",
+                "authority": _authority(r.organisation_names),
+                "cpv": r.cpv_main_code,
+                "source": "BOSA" if r.source and "BOSA" in r.source else "TED",
+                "publication_date": r.publication_date.isoformat() if r.publication_date else None,
+                "deadline": r.deadline.isoformat() if r.deadline else None,
+            }
+            for r in rows
+        ],
+    }
+
+
+def preview_matches(db: Session, keywords: list[str], cpv_codes: list[str]) -> dict[str, Any]:
+    """Teaser for keywords / CPV codes: {"total_matches", "sample"} (cached)."""
+    key = preview_key(keywords, cpv_codes)
+    if not key[0] and not key[1]:
+        return {"total_matches": 0, "sample": []}
+
+    now = _time.time()
+    cached = _preview_cache.get(key)
+    if cached and (now - cached[0]) < _PREVIEW_TTL:
+        return cached[1]
+
+    result = _run_preview(db, *key)
+    if len(_preview_cache) >= _PREVIEW_CACHE_MAX:
+        _preview_cache.clear()
+    _preview_cache[key] = (now, result)
+    return result
+
+
+def invalidate_preview_cache() -> None:
+    """Drop cached previews (after imports)."""
+    _preview_cache.clear()
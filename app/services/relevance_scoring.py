@@ -24,6 +24,7 @@ from datetime import datetime, timezone
 from typing import Any, Optional
 
 from app.utils.geo import closest_distance_km
+from app.utils.keyword_matcher import keyword_matcher
 from app.utils.nace_cpv import nace_matches_cpv, cpv_prefixes_for_nace_list
 
 logger = logging.getLogger(__name__)
@@ -48,19 +49,20 @@ def _keyword_score(notice: Any, keywords: list[str]) -> tuple[int, list[str]]:
     if not keywords:
         return 0, []
 
-    title = (getattr(notice, "title", "") or "").lower()
-    desc = (getattr(notice, "description", "") or "").lower()
+    # One automaton pass per field; first field containing the keyword wins
+    field_hits = keyword_matcher(keywords).field_hits({
+        "title": getattr(notice, "title", "") or "",
+        "description": getattr(notice, "description", "") or "",
+    })
 
     score = 0
     matched = []
-    for kw in keywords:
-        kw_lower = kw.lower().strip()
-        if not kw_lower:
-            continue
-        if kw_lower in title:
+    for i, kw in enumerate(keywords):
+        field = field_hits.get(i)
+        if field == "title":
             score += 12
             matched.append(kw)
-        elif kw_lower in desc:
+        elif field == "description":
             score += 6
             matched.append(kw)
 
@@ -230,6 +232,22 @@ def _nace_cpv_boost(
 # ─── Public API ──────────────────────────────────────────────────────
 
 
+class ScoringParams:
+    """Watchlist (and owner profile) criteria parsed once, for scoring many notices."""
+
+    __slots__ = ("keywords", "cpv_prefixes", "nuts_prefixes", "countries", "user_lat", "user_lng", "user_nace")
+
+    def __init__(self, watchlist: Any, user: Any = None) -> None:
+        self.keywords = _parse_csv(getattr(watchlist, "keywords", None))
+        self.cpv_prefixes = _parse_csv(getattr(watchlist, "cpv_prefixes", None))
+        self.nuts_prefixes = _parse_csv(getattr(watchlist, "nuts_prefixes", None))
+        self.countries = _parse_csv(getattr(watchlist, "countries", None))
+        # No user → no profile boost (the boost helpers score None as 0)
+        self.user_lat = getattr(user, "latitude", None)
+        self.user_lng = getattr(user, "longitude", None)
+        self.user_nace = getattr(user, "nace_codes", None)
+
+
 def calculate_relevance_score(
     notice: Any,
     watchlist: Any,
@@ -245,30 +263,28 @@ def calculate_relevance_score(
     Returns:
         (score, explanation) — score 0–100 and human-readable breakdown.
     """
-    keywords = _parse_csv(getattr(watchlist, "keywords", None))
-    cpv_prefixes = _parse_csv(getattr(watchlist, "cpv_prefixes", None))
-    nuts_prefixes = _parse_csv(getattr(watchlist, "nuts_prefixes", None))
-    countries = _parse_csv(getattr(watchlist, "countries", None))
+    return score_with_params(notice, ScoringParams(watchlist, user=user))
+
+
+def score_with_params(notice: Any, params: ScoringParams) -> tuple[int, str]:
+    """calculate_relevance_score with precompiled ScoringParams.
+
+    `notice` only needs title, description, cpv_main_code, nuts_codes and deadline
+    attributes, so column-projected rows work as well as ORM instances.
+    """
+    keywords = params.keywords
 
     # Layer 1: watchlist match (0–70)
     kw_pts, kw_matched = _keyword_score(notice, keywords)
-    cpv_pts, cpv_matched = _cpv_score(notice, cpv_prefixes)
-    geo_pts, geo_matched = _geo_score_watchlist(notice, nuts_prefixes, countries)
+    cpv_pts, cpv_matched = _cpv_score(notice, params.cpv_prefixes)
+    geo_pts, geo_matched = _geo_score_watchlist(notice, params.nuts_prefixes, params.countries)
     recency_pts = _recency_score(notice)
 
     layer1 = kw_pts + cpv_pts + geo_pts + recency_pts
 
     # Layer 2: profile boost (0–30)
-    prox_pts, prox_detail = 0, None
-    nace_pts, nace_detail = 0, None
-
-    if user is not None:
-        user_lat = getattr(user, "latitude", None)
-        user_lng = getattr(user, "longitude", None)
-        prox_pts, prox_detail = _geo_proximity_boost(notice, user_lat, user_lng)
-
-        user_nace = getattr(user, "nace_codes", None)
-        nace_pts, nace_detail = _nace_cpv_boost(notice, user_nace)
+    prox_pts, prox_detail = _geo_proximity_boost(notice, params.user_lat, params.user_lng)
+    nace_pts, nace_detail = _nace_cpv_boost(notice, params.user_nace)
 
     layer2 = prox_pts + nace_pts
     total = min(layer1 + layer2, 100)
@@ -36,7 +36,7 @@ def _run_import_pipeline() -> None:
             ted_days_back=settings.import_ted_days_back,
             page_size=settings.import_page_size,
             max_pages=settings.import_max_pages,
-            fetch_details=False,
+            fetch_details=settings.import_fetch_details,
             run_backfill=settings.backfill_after_import,
             run_matcher=True,
         )
@@ -166,6 +166,7 @@ def get_scheduler_status() -> dict[str, Any]:
             "import_ted_days_back": settings.import_ted_days_back,
             "import_page_size": settings.import_page_size,
             "import_max_pages": settings.import_max_pages,
+            "import_fetch_details": settings.import_fetch_details,
             "backfill_after_import": settings.backfill_after_import,
         },
         "jobs": jobs,
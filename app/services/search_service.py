@@ -1,28 +1,52 @@
 """Notice search service — full-text (Postgres) with ILIKE fallback (SQLite).
 
 Provides build_search_query() which returns a SQLAlchemy query + optional rank column,
-and get_facets() for dynamic filter values (cached 5 min).
+get_facets() for dynamic filter values (precomputed counters, cached 5 min),
+get_search_facets() for facet counts within a search, count_search_results()
+for page totals (exact when small, capped/estimated when large, cached briefly),
+and keyset (cursor) pagination over every supported sort (fetch_search_page).
 
 Phase 12: Added deadline_after, value_min/max, active_only, multi-source filters,
           value_desc/asc sort, enriched facets (NUTS, deadline range, value range).
 Phase 15: Performance — facets caching, consolidated aggregates, index hints.
 """
+import base64
+import json
+import logging
 import re
 import time as _time
 from datetime import date, datetime, timezone
-from typing import Any, Optional
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
 
-from sqlalchemy import case, cast, func, literal_column, or_, text, Float, String as sa_String
+from sqlalchemy import and_, case, func, literal, literal_column, or_, select, tuple_, union_all
 from sqlalchemy.orm import Session, Query
 
 from app.models.notice import ProcurementNotice, NoticeSource
+from app.models.notice_facet_count import NoticeFacetCount
+from app.models.notice_nuts import NoticeNuts, nuts_prefix_filter
 from app.services.dashboard_service import CPV_DIVISIONS as _CPV_DIVISIONS
 
+logger = logging.getLogger(__name__)
+
 # ── Facets cache (in-memory, 5-min TTL) ──────────────────────────────
 _facets_cache: dict[str, Any] = {}
 _facets_cache_ts: float = 0.0
 _FACETS_TTL = 300  # seconds
 
+# ── Search totals cache (in-memory, short TTL, keyed by normalized filters) ──
+_count_cache: dict[tuple, tuple[float, int, bool]] = {}
+_COUNT_TTL = 60  # seconds
+_COUNT_CACHE_MAX = 1000
+_COUNT_EXACT_THRESHOLD = 10_000  # above this, totals are estimated
+
+# ── Per-search facet counts (same TTL / key as totals) ──
+_search_facets_cache: dict[tuple, tuple[float, dict[str, Any]]] = {}
+
+# Text search configs search_vector is built with (migration 020)
+_TS_CONFIGS = ("simple", "french", "dutch", "english")
+
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -32,11 +56,21 @@ def _is_postgres(db: Session) -> bool:
     return db.bind.dialect.name == "postgresql"
 
 
+def _search_tsquery(tsq: str) -> Any:
+    """tsquery matching search_vector: tsq parsed with each config, OR-ed together."""
+    expr = func.to_tsquery(_TS_CONFIGS[0], tsq)
+    for config in _TS_CONFIGS[1:]:
+        expr = expr.op("||")(func.to_tsquery(config, tsq))
+    return expr
+
+
+@lru_cache(maxsize=1024)
 def _parse_tsquery(raw: str, expand_translations: bool = True) -> str:
     """
     Convert user input to a safe PostgreSQL tsquery string.
     When expand_translations is True, each term is expanded with FR/NL/EN
-    translations using OR groups.
+    translations using OR groups. Cached: filter, rank and cursor keys of one
+    request share a single expansion.
 
     'nettoyage bâtiment'  →  '(nettoyage:* | schoonmaak:* | cleaning:*) & (bâtiment:* | gebouw:* | building:*)'
     'route OR pont'       →  '(route:* | weg:* | road:*) | (pont:* | brug:* | bridge:*)'
@@ -78,6 +112,61 @@ def _source_value(source_str: str) -> Optional[str]:
     return None
 
 
+# ── Sort keys ────────────────────────────────────────────────────────
+
+
+class SortKey(NamedTuple):
+    """One ORDER BY key of a search sort."""
+
+    expr: Any
+    desc: bool
+    nullable: bool  # sorted NULLS LAST
+
+
+# sort name → (column, descending); unknown sorts fall back to date_desc
+_SORT_COLUMNS: dict[str, tuple[str, bool]] = {
+    "date_desc": ("publication_date", True),
+    "date_asc": ("publication_date", False),
+    "deadline": ("deadline", False),
+    "deadline_desc": ("deadline", True),
+    "value_desc": ("estimated_value", True),
+    "value_asc": ("estimated_value", False),
+    "award_desc": ("award_value", True),
+    "award_asc": ("award_value", False),
+    "award_date_desc": ("award_date", True),
+    "award_date_asc": ("award_date", False),
+    "cpv_asc": ("cpv_main_code", False),
+    "cpv_desc": ("cpv_main_code", True),
+    "source_asc": ("source", False),
+    "source_desc": ("source", True),
+}
+
+
+def _sort_keys(sort: str, rank_tsq: Optional[str] = None) -> list[SortKey]:
+    """ORDER BY keys for a sort, always ending with the id tie-breaker."""
+    N = ProcurementNotice
+    if sort == "relevance" and rank_tsq:
+        rank = func.ts_rank(literal_column("search_vector"), _search_tsquery(rank_tsq))
+        keys = [SortKey(rank, True, False), SortKey(N.publication_date, True, True)]
+    else:
+        name, desc = _SORT_COLUMNS.get(sort, _SORT_COLUMNS["date_desc"])
+        keys = [SortKey(getattr(N, name), desc, N.__table__.c[name].nullable)]
+    return keys + [SortKey(N.id, keys[0].desc, False)]
+
+
+def _order_clause(key: SortKey) -> Any:
+    clause = key.expr.desc() if key.desc else key.expr.asc()
+    return clause.nulls_last() if key.nullable else clause
+
+
+def search_sort_keys(db: Session, q: Optional[str], sort: str) -> list[SortKey]:
+    """Sort keys build_search_query() orders by for (q, sort)."""
+    rank_tsq = None
+    if sort == "relevance" and q and q.strip() and _is_postgres(db):
+        rank_tsq = _parse_tsquery(q.strip()) or None
+    return _sort_keys(sort, rank_tsq)
+
+
 # ── Main search query builder ────────────────────────────────────────
 
 
@@ -108,6 +197,7 @@ def build_search_query(
     """
     is_pg = _is_postgres(db)
     has_rank = False
+    tsq = ""
 
     query = db.query(ProcurementNotice)
 
@@ -117,9 +207,7 @@ def build_search_query(
         if is_pg:
             tsq = _parse_tsquery(term)
             if tsq:
-                query = query.filter(
-                    text("search_vector @@ to_tsquery('simple', :tsq)").bindparams(tsq=tsq)
-                )
+                query = query.filter(literal_column("search_vector").op("@@")(_search_tsquery(tsq)))
                 has_rank = True
             else:
                 like = f"%{term}%"
@@ -141,26 +229,11 @@ def build_search_query(
     # ── CPV prefix filter ──
     if cpv and cpv.strip():
         cpv_clean = re.sub(r"[\-\s]", "", cpv.strip())
-        query = query.filter(
-            func.replace(func.coalesce(ProcurementNotice.cpv_main_code, ""), "-", "").like(f"{cpv_clean}%")
-        )
+        query = query.filter(ProcurementNotice.cpv_digits.like(f"{cpv_clean}%"))
 
-    # ── NUTS prefix filter ──
+    # ── NUTS prefix filter (notice_nuts side table, index range scan) ──
     if nuts and nuts.strip():
-        nuts_upper = nuts.strip().upper()
-        if is_pg:
-            query = query.filter(
-                text(
-                    "notices.nuts_codes IS NOT NULL "
-                    "AND json_typeof(notices.nuts_codes) = 'array' "
-                    "AND EXISTS (SELECT 1 FROM jsonb_array_elements_text(notices.nuts_codes::jsonb) AS nc "
-                    "WHERE nc LIKE :nuts_prefix)"
-                ).bindparams(nuts_prefix=f"{nuts_upper}%")
-            )
-        else:
-            query = query.filter(
-                cast(ProcurementNotice.nuts_codes, sa_String()).like(f"%{nuts_upper}%")
-            )
+        query = query.filter(nuts_prefix_filter([nuts]))
 
     # ── Source filter (single) ──
     if source and source.strip() and not sources:
@@ -174,20 +247,9 @@ def build_search_query(
         if src_vals:
             query = query.filter(ProcurementNotice.source.in_(src_vals))
 
-    # ── Authority / organisation name search ──
+    # ── Authority / organisation name search (pg_trgm GIN on Postgres, LIKE on SQLite) ──
     if authority and authority.strip():
-        auth_term = f"%{authority.strip()}%"
-        if is_pg:
-            query = query.filter(
-                text(
-                    "EXISTS (SELECT 1 FROM jsonb_each_text(notices.organisation_names::jsonb) AS kv "
-                    "WHERE kv.value ILIKE :auth_term)"
-                ).bindparams(auth_term=auth_term)
-            )
-        else:
-            query = query.filter(
-                cast(ProcurementNotice.organisation_names, sa_String()).ilike(auth_term)
-            )
+        query = query.filter(ProcurementNotice.organisation_name_search.ilike(f"%{authority.strip()}%"))
 
     # ── Notice type filter ──
     if notice_type and notice_type.strip():
@@ -216,46 +278,234 @@ def build_search_query(
     if value_max is not None:
         query = query.filter(ProcurementNotice.estimated_value <= value_max)
 
-    # ── Sorting ──
-    if sort == "relevance" and has_rank and is_pg:
-        tsq = _parse_tsquery(q.strip())
-        query = query.order_by(
-            text("ts_rank(search_vector, to_tsquery('simple', :tsq_rank)) DESC").bindparams(tsq_rank=tsq),
-            ProcurementNotice.publication_date.desc().nulls_last(),
-        )
-    elif sort == "date_asc":
-        query = query.order_by(ProcurementNotice.publication_date.asc().nulls_last())
-    elif sort == "deadline":
-        query = query.order_by(ProcurementNotice.deadline.asc().nulls_last())
-    elif sort == "deadline_desc":
-        query = query.order_by(ProcurementNotice.deadline.desc().nulls_last())
-    elif sort == "value_desc":
-        query = query.order_by(ProcurementNotice.estimated_value.desc().nulls_last())
-    elif sort == "value_asc":
-        query = query.order_by(ProcurementNotice.estimated_value.asc().nulls_last())
-    elif sort == "award_desc":
-        query = query.order_by(ProcurementNotice.award_value.desc().nulls_last())
-    elif sort == "award_asc":
-        query = query.order_by(ProcurementNotice.award_value.asc().nulls_last())
-    elif sort == "award_date_desc":
-        query = query.order_by(ProcurementNotice.award_date.desc().nulls_last())
-    elif sort == "award_date_asc":
-        query = query.order_by(ProcurementNotice.award_date.asc().nulls_last())
-    elif sort == "cpv_asc":
-        query = query.order_by(ProcurementNotice.cpv_main_code.asc().nulls_last())
-    elif sort == "cpv_desc":
-        query = query.order_by(ProcurementNotice.cpv_main_code.desc().nulls_last())
-    elif sort == "source_asc":
-        query = query.order_by(ProcurementNotice.source.asc())
-    elif sort == "source_desc":
-        query = query.order_by(ProcurementNotice.source.desc())
-    else:
-        # Default: date_desc
-        query = query.order_by(ProcurementNotice.publication_date.desc().nulls_last())
+    # ── Sorting: sort key(s) + id tie-breaker (stable pages, keyset cursors) ──
+    rank_tsq = tsq if sort == "relevance" and has_rank else None
+    query = query.order_by(*(_order_clause(k) for k in _sort_keys(sort, rank_tsq)))
 
     return query, has_rank
 
 
+# ── Keyset (cursor) pagination ───────────────────────────────────────
+
+# Columns of a search result row (no raw_data / award_criteria_json, description
+# cut to its 300-char preview in SQL)
+SEARCH_RESULT_COLUMNS = [
+    ProcurementNotice.id,
+    ProcurementNotice.title,
+    ProcurementNotice.source,
+    ProcurementNotice.cpv_main_code,
+    ProcurementNotice.nuts_codes,
+    ProcurementNotice.organisation_names,
+    ProcurementNotice.publication_date,
+    ProcurementNotice.deadline,
+    ProcurementNotice.reference_number,
+    func.substr(ProcurementNotice.description, 1, 300).label("description"),
+    ProcurementNotice.notice_type,
+    ProcurementNotice.form_type,
+    ProcurementNotice.estimated_value,
+    ProcurementNotice.url,
+    ProcurementNotice.status,
+    ProcurementNotice.award_winner_name,
+    ProcurementNotice.award_value,
+    ProcurementNotice.award_date,
+    ProcurementNotice.number_tenders_received,
+]
+
+
+def _after(keys: list[SortKey], values: list[Any]) -> Any:
+    """Condition selecting rows strictly after `values` in `keys` order (NULLS LAST)."""
+    if not any(k.nullable for k in keys) and len({k.desc for k in keys}) == 1:
+        # Row-value comparison: a single index range condition
+        row = tuple_(*(k.expr for k in keys))
+        cursor = tuple_(*(literal(v, k.expr.type) for k, v in zip(keys, values)))
+        return row < cursor if keys[0].desc else row > cursor
+
+    clauses = []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        if value is None:
+            # Nothing sorts after NULL on this key; continue with ties only
+            continue
+        after = key.expr < value if key.desc else key.expr > value
+        if key.nullable:
+            after = or_(after, key.expr.is_(None))
+        ties = [k.expr.is_(None) if v is None else k.expr == v for k, v in zip(keys[:i], values[:i])]
+        clauses.append(and_(*ties, after))
+    return or_(*clauses)
+
+
+def fetch_search_page(
+    query: Query,
+    keys: list[SortKey],
+    limit: int,
+    offset: int = 0,
+    after: Optional[list[Any]] = None,
+    columns: Optional[list[Any]] = None,
+) -> tuple[list[Any], Optional[list[Any]]]:
+    """
+    Fetch one page of a build_search_query() query.
+
+    With `after` (sort key values of the previous page's last row) the page is
+    read by keyset instead of OFFSET: rows with a non-NULL leading key are read
+    by a range condition, then the NULLS LAST tail, so deep pages cost the same
+    as the first. Returns (notices, last row's key values or None on the last page).
+
+    With `columns` (e.g. SEARCH_RESULT_COLUMNS) only those are selected and
+    each row is returned as a {column name: value} dict instead of an entity.
+    """
+    if columns:
+        keyed = query.with_entities(*columns, *(k.expr for k in keys))
+        width = len(columns)
+    else:
+        keyed = query.add_columns(*(k.expr for k in keys))
+        width = 1
+    wanted = limit + 1  # one extra row tells whether another page exists
+
+    if after is None and offset:
+        rows = keyed.offset(offset).limit(wanted).all()
+    else:
+        head = keys[0]
+        in_null_tail = after is not None and head.nullable and after[0] is None
+        rows = []
+        if not in_null_tail:
+            part = keyed.filter(head.expr.isnot(None)) if head.nullable else keyed
+            if after is not None:
+                part = part.filter(_after([head._replace(nullable=False)] + keys[1:], after))
+            rows = part.limit(wanted).all()
+        if head.nullable and len(rows) < wanted:
+            tail = keyed.filter(head.expr.is_(None))
+            if in_null_tail:
+                tail = tail.filter(_after(keys[1:], after[1:]))
+            rows += tail.limit(wanted - len(rows)).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    last = list(rows[-1][width:]) if has_more and rows else None
+    if columns:
+        return [dict(zip(r._fields[:width], r[:width])) for r in rows], last
+    return [r[0] for r in rows], last
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    return value
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+        raise ValueError("bad cursor value")
+    return value
+
+
+def encode_search_cursor(sort: str, values: list[Any]) -> str:
+    """Opaque cursor for the row with these sort key values."""
+    payload = {"s": sort, "k": [_encode_cursor_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str, sort: str, keys: list[SortKey]) -> list[Any]:
+    """Sort key values from a cursor. Raises ValueError if malformed or from another sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        values = [_decode_cursor_value(v) for v in payload["k"]]
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+    if payload.get("s") != sort or len(values) != len(keys):
+        raise ValueError("Cursor does not match this sort")
+    return values
+
+
+# ── Search totals ────────────────────────────────────────────────────
+
+
+def _normalize_filter(value: Any) -> Any:
+    if isinstance(value, str):
+        value = " ".join(value.split())
+        return value or None
+    if isinstance(value, (list, tuple, set)):
+        items = sorted({v for v in (_normalize_filter(x) for x in value) if v is not None})
+        return tuple(items) or None
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def search_count_key(filters: dict[str, Any]) -> tuple:
+    """Cache key for a build_search_query filter set (sort/pagination excluded)."""
+    normalized = ((k, _normalize_filter(v)) for k, v in filters.items() if k != "sort")
+    return tuple(sorted((k, v) for k, v in normalized if v not in (None, False)))
+
+
+def _estimated_count(db: Session, query: Query) -> Optional[int]:
+    """Planner row estimate for query (Postgres EXPLAIN), None if unavailable."""
+    compiled = query.order_by(None).statement.compile(
+        dialect=db.bind.dialect, compile_kwargs={"render_postcompile": True},
+    )
+    try:
+        row = db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params,
+        ).first()
+        plan = row[0] if row else None
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug("EXPLAIN estimate failed: %s", e)
+        return None
+
+
+def count_search_results(db: Session, query: Query, filters: dict[str, Any]) -> tuple[int, bool]:
+    """
+    Total for a build_search_query() result set: returns (total, is_exact).
+
+    Counts up to _COUNT_EXACT_THRESHOLD rows exactly (LIMIT threshold+1 subquery);
+    beyond that the Postgres planner estimate is used (never below the threshold),
+    or the capped figure where no estimate is available. Totals are cached for
+    _COUNT_TTL seconds per normalized filter set.
+    """
+    key = search_count_key(filters)
+    now = _time.time()
+    cached = _count_cache.get(key)
+    if cached and (now - cached[0]) < _COUNT_TTL:
+        return cached[1], cached[2]
+
+    cap = _COUNT_EXACT_THRESHOLD + 1
+    capped = (
+        query.order_by(None)
+        .with_entities(ProcurementNotice.id)
+        .limit(cap)
+        .subquery()
+    )
+    total = db.query(func.count()).select_from(capped).scalar() or 0
+    exact = total < cap
+    if not exact and _is_postgres(db):
+        estimate = _estimated_count(db, query)
+        if estimate is not None:
+            total = max(estimate, cap)
+
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        _count_cache.clear()
+    _count_cache[key] = (now, total, exact)
+    return total, exact
+
+
+def invalidate_search_count_cache() -> None:
+    """Drop cached search totals (after imports)."""
+    _count_cache.clear()
+
+
 # ── Facets ───────────────────────────────────────────────────────────
 
 
@@ -279,30 +529,109 @@ def invalidate_facets_cache() -> None:
     """Call after bulk imports to force fresh facets on next request."""
     global _facets_cache_ts
     _facets_cache_ts = 0.0
+    _search_facets_cache.clear()
+
+
+def get_search_facets(db: Session, filters: dict[str, Any]) -> dict[str, Any]:
+    """
+    Facet counts within a search: build_search_query(**filters) result set
+    broken down by source, CPV division, NUTS country and notice type.
+
+    One statement: the filtered rows are a CTE and every facet is a GROUP BY
+    over it (UNION ALL), so the filter runs once. Cached for _COUNT_TTL seconds
+    per normalized filter set.
+    """
+    key = search_count_key(filters)
+    now = _time.time()
+    cached = _search_facets_cache.get(key)
+    if cached and (now - cached[0]) < _COUNT_TTL:
+        return cached[1]
+
+    N = ProcurementNotice
+    query, _ = build_search_query(db, **{k: v for k, v in filters.items() if k != "sort"})
+    f = (
+        query.order_by(None)
+        .with_entities(N.id, N.source, N.cpv_digits, N.notice_type)
+        .cte("filtered")
+    )
+    division = func.substr(f.c.cpv_digits, 1, 2)
+    country = func.substr(NoticeNuts.nuts_code, 1, 2)
+    stmt = union_all(
+        select(literal("total"), literal(""), func.count()).select_from(f),
+        select(literal("source"), f.c.source, func.count()).group_by(f.c.source),
+        select(literal("cpv_division"), division, func.count())
+        .where(f.c.cpv_digits.isnot(None))
+        .group_by(division),
+        select(literal("nuts_country"), country, func.count(func.distinct(NoticeNuts.notice_id)))
+        .join_from(f, NoticeNuts, NoticeNuts.notice_id == f.c.id)
+        .group_by(country),
+        select(literal("notice_type"), f.c.notice_type, func.count())
+        .where(f.c.notice_type.isnot(None))
+        .group_by(f.c.notice_type),
+    )
+
+    total = 0
+    counts: dict[str, list[tuple[str, int]]] = {}
+    for facet, value, count in db.execute(stmt):
+        if facet == "total":
+            total = count
+        elif value or (facet == "notice_type" and value is not None):
+            counts.setdefault(facet, []).append((value, count))
+
+    result = {"total": total, **_facet_lists(counts)}
+    if len(_search_facets_cache) >= _COUNT_CACHE_MAX:
+        _search_facets_cache.clear()
+    _search_facets_cache[key] = (now, result)
+    return result
+
+
+def _facet_lists(counts: dict[str, list[tuple[str, int]]]) -> dict[str, list[dict[str, Any]]]:
+    """UI facet lists from {facet: [(value, count), ...]} (top 20 per facet by count)."""
+    def _top(facet: str) -> list[tuple[str, int]]:
+        return sorted(counts.get(facet, []), key=lambda vc: (-vc[1], vc[0]))[:20]
+
+    return {
+        "sources": [
+            {"value": s, "label": "BOSA" if s == "BOSA_EPROC" else "TED", "count": c}
+            for s, c in sorted(counts.get("source", []))
+        ],
+        "top_cpv_divisions": [
+            {"code": code, "label": _CPV_DIVISIONS.get(code, ""), "count": c}
+            for code, c in _top("cpv_division")
+        ],
+        "top_nuts_countries": [{"code": code, "count": c} for code, c in _top("nuts_country")],
+        "notice_types": [{"value": t, "count": c} for t, c in _top("notice_type")],
+    }
 
 
 def _compute_facets(db: Session) -> dict[str, Any]:
-    """Compute facets from DB (uncached)."""
-    is_pg = _is_postgres(db)
+    """Build facets from notice_facet_counts plus index-backed min/max / active count."""
     N = ProcurementNotice
 
-    # ── Single aggregate query for totals, date ranges ──
+    # ── Grouped counts: precomputed, maintained on write ──
+    counts: dict[str, list[tuple[str, int]]] = {}
+    for facet, value, count in db.query(
+        NoticeFacetCount.facet, NoticeFacetCount.value, NoticeFacetCount.count,
+    ).filter(NoticeFacetCount.count > 0):
+        counts.setdefault(facet, []).append((value, count))
+
+    total = sum(c for _, c in counts.get("source", []))
+
+    # ── Single aggregate query for date ranges ──
     agg = db.query(
-        func.count(N.id),
         func.min(N.publication_date),
         func.max(N.publication_date),
         func.min(N.deadline),
         func.max(N.deadline),
     ).first()
 
-    total = agg[0] if agg else 0
     date_info = {
-        "min": agg[1].isoformat() if agg and agg[1] else None,
-        "max": agg[2].isoformat() if agg and agg[2] else None,
+        "min": agg[0].isoformat() if agg and agg[0] else None,
+        "max": agg[1].isoformat() if agg and agg[1] else None,
     }
     deadline_info = {
-        "min": agg[3].isoformat() if agg and agg[3] else None,
-        "max": agg[4].isoformat() if agg and agg[4] else None,
+        "min": agg[2].isoformat() if agg and agg[2] else None,
+        "max": agg[3].isoformat() if agg and agg[3] else None,
     }
 
     # ── Value range (separate — needs WHERE filter) ──
@@ -323,70 +652,10 @@ def _compute_facets(db: Session) -> dict[str, Any]:
         .scalar()
     ) or 0
 
-    # ── Sources ──
-    sources = db.query(N.source, func.count(N.id)).group_by(N.source).all()
-    source_list = [
-        {"value": s, "label": "BOSA" if s == "BOSA_EPROC" else "TED", "count": c}
-        for s, c in sources
-    ]
-
-    # ── Top CPV divisions (uses ix_notices_cpv_division expression index) ──
-    if is_pg:
-        cpv_rows = db.execute(text("""
-            SELECT LEFT(REPLACE(cpv_main_code, '-', ''), 2) AS div, COUNT(*) AS cnt
-            FROM notices
-            WHERE cpv_main_code IS NOT NULL
-            GROUP BY div
-            ORDER BY cnt DESC
-            LIMIT 20
-        """)).all()
-    else:
-        cpv_rows = db.execute(text("""
-            SELECT SUBSTR(REPLACE(cpv_main_code, '-', ''), 1, 2) AS div, COUNT(*) AS cnt
-            FROM notices
-            WHERE cpv_main_code IS NOT NULL
-            GROUP BY div
-            ORDER BY cnt DESC
-            LIMIT 20
-        """)).all()
-    cpv_list = [{"code": row[0], "label": _CPV_DIVISIONS.get(row[0], ""), "count": row[1]} for row in cpv_rows if row[0]]
-
-    # ── Top NUTS countries ──
-    nuts_list = []
-    if is_pg:
-        try:
-            nuts_rows = db.execute(text("""
-                SELECT LEFT(nc, 2) AS country, COUNT(*) AS cnt
-                FROM notices,
-                     jsonb_array_elements_text(nuts_codes::jsonb) AS nc
-                WHERE nuts_codes IS NOT NULL
-                  AND jsonb_typeof(nuts_codes::jsonb) = 'array'
-                GROUP BY country
-                ORDER BY cnt DESC
-                LIMIT 20
-            """)).all()
-            nuts_list = [{"code": row[0], "count": row[1]} for row in nuts_rows if row[0]]
-        except Exception:
-            pass
-
-    # ── Notice types ──
-    type_rows = (
-        db.query(N.notice_type, func.count(N.id))
-        .filter(N.notice_type.isnot(None))
-        .group_by(N.notice_type)
-        .order_by(func.count(N.id).desc())
-        .limit(20)
-        .all()
-    )
-    type_list = [{"value": t, "count": c} for t, c in type_rows]
-
     return {
         "total_notices": total,
         "active_count": active_count,
-        "sources": source_list,
-        "top_cpv_divisions": cpv_list,
-        "top_nuts_countries": nuts_list,
-        "notice_types": type_list,
+        **_facet_lists(counts),
         "date_range": date_info,
         "deadline_range": deadline_info,
         "value_range": value_info,
@@ -20,6 +20,7 @@ from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
 from app.models.notice import ProcurementNotice
+from app.models.notice_search_text import sync_notice_search_texts
 
 logger = logging.getLogger(__name__)
 
@@ -178,6 +179,7 @@ def enrich_ted_can_batch(
             stats["api_errors"] += 1
 
         # -- 3. SQL UPDATE all rows per source_id --
+        raw_rewritten: list[str] = []
         for pub_number in chunk:
             item = result_map.get(pub_number)
 
@@ -268,7 +270,18 @@ def enrich_ted_can_batch(
             rows_affected = result.rowcount
             stats["rows_updated"] += rows_affected
             stats["enriched"] += 1
-
+            if rows_affected:
+                raw_rewritten.append(pub_number)
+
+        # Raw SQL bypasses the ORM listeners: rebuild keyword matching texts
+        if raw_rewritten:
+            notice_ids = [
+                nid for (nid,) in db.query(ProcurementNotice.id).filter(
+                    ProcurementNotice.source == "TED_EU",
+                    ProcurementNotice.source_id.in_(raw_rewritten),
+                )
+            ]
+            sync_notice_search_texts(db, notice_ids)
         db.commit()
         logger.info(
             "[TED enrich] After batch %d: %d source_ids enriched, %d rows updated, "
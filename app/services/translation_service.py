@@ -6,7 +6,9 @@ two languages, so a search for "nettoyage" also matches notices titled
 
 Architecture:
   - Static dictionary of ~300 procurement concept groups (FR / NL / EN)
-  - Normalised lookup index built once at import time
+  - Normalised lookup index built once at import time, plus a substring
+    matcher (Aho-Corasick + substring map) for compound terms
+  - Static lookups and query expansions are LRU-cached
   - expand_keywords()  → given a keyword, returns {fr, nl, en} set
   - expand_search_terms() → given a query string, returns expanded tsquery-ready string
 
@@ -14,8 +16,11 @@ The dictionary covers the most common CPV domains encountered in
 Belgian (BOSA) and EU (TED) procurement notices.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 
+from app.utils.keyword_matcher import Automaton
+
 # ---------------------------------------------------------------------------
 # Procurement concept dictionary — (FR, NL, EN) tuples
 # Each tuple represents a single concept in three languages.
@@ -306,21 +311,13 @@ _CONCEPTS: list[tuple[str, str, str]] = [
 # Build normalised lookup index
 # ---------------------------------------------------------------------------
 
+_ACCENT_FOLD = str.maketrans("éèêëàâäùûüôöîïçñ", "eeeeaaauuuooiicn")
+
+
 def _normalise(s: str) -> str:
     """Lowercase, strip accents (basic), collapse whitespace."""
-    s = s.lower().strip()
     # Basic accent folding for lookup (not exhaustive, but covers FR/NL)
-    for src, dst in [
-        ("é", "e"), ("è", "e"), ("ê", "e"), ("ë", "e"),
-        ("à", "a"), ("â", "a"), ("ä", "a"),
-        ("ù", "u"), ("û", "u"), ("ü", "u"),
-        ("ô", "o"), ("ö", "o"),
-        ("î", "i"), ("ï", "i"),
-        ("ç", "c"), ("ñ", "n"),
-    ]:
-        s = s.replace(src, dst)
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return " ".join(s.lower().translate(_ACCENT_FOLD).split())
 
 
 # Index: normalised_term → set of concept indices
@@ -333,6 +330,49 @@ for _idx, (_fr, _nl, _en) in enumerate(_CONCEPTS):
             _TERM_INDEX.setdefault(_key, set()).add(_idx)
 
 
+class _TermMatcher:
+    """Substring lookups over _TERM_INDEX keys, built once at import time.
+
+    - terms_in(text): indexed terms occurring inside text (Aho-Corasick scan,
+      linear in len(text) whatever the dictionary size)
+    - containing(text): concepts whose indexed term contains text (every
+      substring of every term → concept ids)
+    """
+
+    def __init__(self, index: dict[str, set[int]]) -> None:
+        self._automaton = Automaton(index)
+        substrings: dict[str, set[int]] = {}
+        for term, ids in index.items():
+            for i in range(len(term)):
+                for j in range(i + 1, len(term) + 1):
+                    substrings.setdefault(term[i:j], set()).update(ids)
+        self._substrings = {k: frozenset(v) for k, v in substrings.items()}
+
+    def terms_in(self, text: str) -> set[int]:
+        return self._automaton.ids_in(text)
+
+    def containing(self, text: str) -> frozenset[int]:
+        return self._substrings.get(text, frozenset())
+
+
+_TERM_MATCHER = _TermMatcher(_TERM_INDEX)
+
+
+@lru_cache(maxsize=4096)
+def _concept_ids(key: str) -> tuple[int, ...]:
+    """Concept indices for a normalised keyword: exact hit, else substring matches."""
+    # Exact match
+    concept_ids = _TERM_INDEX.get(key, set())
+
+    # If no exact match, try substring match (for compound terms)
+    if not concept_ids:
+        concept_ids = set(_TERM_MATCHER.containing(key)) | _TERM_MATCHER.terms_in(key)
+        # Limit to 3 matches (earliest concepts) to avoid noise
+        return tuple(sorted(concept_ids)[:3])
+
+    return tuple(sorted(concept_ids))
+
+
 # ---------------------------------------------------------------------------
 # Public API — Static (instant, no DB)
 # ---------------------------------------------------------------------------
@@ -348,18 +388,7 @@ def translate_keyword(keyword: str) -> dict[str, list[str]]:
     if not key:
         return {"original": keyword, "fr": [], "nl": [], "en": [], "found": False}
 
-    # Exact match
-    concept_ids = _TERM_INDEX.get(key, set())
-
-    # If no exact match, try substring match (for compound terms)
-    if not concept_ids:
-        for indexed_key, ids in _TERM_INDEX.items():
-            if key in indexed_key or indexed_key in key:
-                concept_ids |= ids
-        # Limit to best 3 matches to avoid noise
-        if len(concept_ids) > 3:
-            concept_ids = set(list(concept_ids)[:3])
-
+    concept_ids = _concept_ids(key)
     if not concept_ids:
         return {"original": keyword, "fr": [], "nl": [], "en": [], "found": False}
 
@@ -565,9 +594,14 @@ def expand_keyword(keyword: str) -> list[str]:
 
     Example: expand_keyword("nettoyage") → ["nettoyage", "schoonmaak", "cleaning"]
     """
+    return list(_expand_keyword_cached(keyword))
+
+
+@lru_cache(maxsize=4096)
+def _expand_keyword_cached(keyword: str) -> tuple[str, ...]:
     result = translate_keyword(keyword)
     if not result["found"]:
-        return [keyword]  # Return original if no translation found
+        return (keyword,)  # Return original if no translation found
 
     all_terms: set[str] = set()
     all_terms.add(keyword)  # Always include the original
@@ -575,7 +609,7 @@ def expand_keyword(keyword: str) -> list[str]:
         for term in result[lang]:
             all_terms.add(term)
 
-    return sorted(all_terms)
+    return tuple(sorted(all_terms))
 
 
 def expand_keywords_list(keywords: list[str]) -> list[str]:
@@ -603,11 +637,13 @@ def expand_keywords_list(keywords: list[str]) -> list[str]:
     return result
 
 
+@lru_cache(maxsize=1024)
 def expand_tsquery_terms(raw_query: str) -> str:
     """Expand a user search query for PostgreSQL tsquery.
 
     Each word/term gets expanded with OR'd translations, while
-    preserving AND logic between different concepts.
+    preserving AND logic between different concepts. Results are cached
+    per query string (the dictionary is static).
 
     Example:
         "nettoyage bâtiment"
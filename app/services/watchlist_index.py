@@ -0,0 +1,198 @@
+"""Inverted watchlist index: match many watchlists against new notices in one pass.
+
+All enabled watchlists are compiled once into lookup tables:
+  - keyword  → watchlist ids   (substring of title OR description, case-insensitive)
+  - CPV prefix → watchlist ids (digits only, e.g. "45", "4523")
+  - NUTS prefix / country → watchlist ids (prefix of any notice NUTS code)
+  - source → watchlist ids
+
+Each notice is then looked up once per dimension and a watchlist matches when
+every filter it defines was hit (value range is checked per candidate).
+Cost scales with new notices and actual hits, not with the number of watchlists.
+
+Semantics mirror watchlist_matcher._build_match_query.
+"""
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.notice import ProcurementNotice as Notice
+from app.models.watchlist import Watchlist
+from app.utils.dates import naive_utc
+from app.utils.keyword_matcher import KeywordMatcher
+
+# Columns needed to evaluate watchlist filters (no raw_data / large JSON)
+_MATCH_COLUMNS = (
+    Notice.id,
+    Notice.title,
+    Notice.description,
+    Notice.cpv_main_code,
+    Notice.nuts_codes,
+    Notice.source,
+    Notice.estimated_value,
+    Notice.created_at,
+)
+
+# Filter dimensions in a compiled watchlist
+_KEYWORDS = "keywords"
+_CPV = "cpv"
+_NUTS = "nuts"
+_COUNTRY = "country"
+_SOURCE = "source"
+
+
+def _prefixes(value: str) -> Iterator[str]:
+    """All non-empty prefixes of value ("452" → "4", "45", "452")."""
+    for i in range(1, len(value) + 1):
+        yield value[:i]
+
+
+class _CompiledWatchlist:
+    __slots__ = ("id", "required", "value_min", "value_max", "since")
+
+    def __init__(self, watchlist_id: str, since: Optional[datetime]) -> None:
+        self.id = watchlist_id
+        self.required: set[str] = set()
+        self.value_min: Optional[float] = None
+        self.value_max: Optional[float] = None
+        self.since = since
+
+
+class WatchlistIndex:
+    """Compiled, read-only index over a set of watchlists."""
+
+    def __init__(self, watchlists: Iterable[Watchlist]) -> None:
+        # Imported lazily: watchlist_matcher imports this module
+        from app.services.watchlist_matcher import _parse_csv, _parse_sources_json, _source_map
+
+        self._compiled: dict[str, _CompiledWatchlist] = {}
+        self._keywords: dict[str, set[str]] = defaultdict(set)
+        self._cpv: dict[str, set[str]] = defaultdict(set)
+        self._nuts: dict[str, set[str]] = defaultdict(set)
+        self._country: dict[str, set[str]] = defaultdict(set)
+        self._source: dict[str, set[str]] = defaultdict(set)
+        # Watchlists with no indexed filter match every notice (subject to value range)
+        self._unfiltered: set[str] = set()
+
+        for wl in watchlists:
+            cw = _CompiledWatchlist(wl.id, naive_utc(wl.last_refresh_at))
+
+            for kw in _parse_csv(wl.keywords):
+                self._keywords[kw.lower()].add(wl.id)
+                cw.required.add(_KEYWORDS)
+
+            for prefix in _parse_csv(wl.cpv_prefixes):
+                digits = prefix.replace("-", "").strip()
+                if digits:
+                    self._cpv[digits].add(wl.id)
+                    cw.required.add(_CPV)
+
+            for prefix in _parse_csv(getattr(wl, "nuts_prefixes", None)):
+                p = prefix.strip().upper()
+                if p:
+                    self._nuts[p].add(wl.id)
+                    cw.required.add(_NUTS)
+
+            for country in _parse_csv(wl.countries):
+                self._country[country.upper()].add(wl.id)
+                cw.required.add(_COUNTRY)
+
+            for src in _parse_sources_json(wl.sources):
+                db_source = _source_map(src)
+                if db_source:
+                    self._source[db_source].add(wl.id)
+                    cw.required.add(_SOURCE)
+
+            cw.value_min = getattr(wl, "value_min", None)
+            cw.value_max = getattr(wl, "value_max", None)
+
+            if not cw.required:
+                self._unfiltered.add(wl.id)
+            self._compiled[wl.id] = cw
+
+        # All keywords in one matcher (automaton once the keyword set is large)
+        self._keyword_ids = list(self._keywords.values())
+        self._keyword_matcher = KeywordMatcher(self._keywords)
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    @property
+    def min_since(self) -> Optional[datetime]:
+        """Oldest refresh cutoff across watchlists (None if any watchlist was never refreshed)."""
+        cutoffs = [cw.since for cw in self._compiled.values()]
+        if not cutoffs or any(c is None for c in cutoffs):
+            return None
+        return min(cutoffs)
+
+    def match(self, notice: Any) -> list[str]:
+        """Return ids of watchlists whose filters all match this notice."""
+        hits: dict[str, int] = defaultdict(int)
+
+        def _hit(dimension_ids: set[str]) -> None:
+            for wl_id in dimension_ids:
+                hits[wl_id] += 1
+
+        if self._keywords:
+            text = f"{notice.title or ''}\n{notice.description or ''}"
+            kw_ids: set[str] = set()
+            for i in self._keyword_matcher.hits(text):
+                kw_ids |= self._keyword_ids[i]
+            _hit(kw_ids)
+
+        if self._cpv:
+            cpv = (notice.cpv_main_code or "").replace("-", "")
+            cpv_ids: set[str] = set()
+            for prefix in _prefixes(cpv):
+                cpv_ids |= self._cpv.get(prefix, set())
+            _hit(cpv_ids)
+
+        if self._nuts or self._country:
+            codes = notice.nuts_codes if isinstance(notice.nuts_codes, list) else []
+            nuts_ids: set[str] = set()
+            country_ids: set[str] = set()
+            for code in codes:
+                code_upper = str(code).upper()
+                for prefix in _prefixes(code_upper):
+                    nuts_ids |= self._nuts.get(prefix, set())
+                    country_ids |= self._country.get(prefix, set())
+            _hit(nuts_ids)
+            _hit(country_ids)
+
+        _hit(self._source.get(notice.source, set()))
+
+        created_at = naive_utc(notice.created_at)
+        matched = []
+        for wl_id in list(hits) + list(self._unfiltered):
+            cw = self._compiled[wl_id]
+            if hits.get(wl_id, 0) != len(cw.required):
+                continue
+            if cw.since is not None and (created_at is None or created_at <= cw.since):
+                continue
+            if cw.value_min is not None and (notice.estimated_value is None or notice.estimated_value < cw.value_min):
+                continue
+            if cw.value_max is not None and (notice.estimated_value is None or notice.estimated_value > cw.value_max):
+                continue
+            matched.append(wl_id)
+        return matched
+
+    def stream_matches(
+        self,
+        db: Session,
+        batch_size: int = 500,
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Stream notices created after the oldest watchlist cutoff through the index
+        once and yield (watchlist_id, notice_id) pairs. Only filter columns are loaded.
+        """
+        if not self._compiled:
+            return
+        query = db.query(*_MATCH_COLUMNS)
+        since = self.min_since
+        if since is not None:
+            query = query.filter(Notice.created_at > since)
+        for row in query.execution_options(yield_per=batch_size):
+            for wl_id in self.match(row):
+                yield wl_id, row.id
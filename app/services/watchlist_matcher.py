@@ -10,15 +10,18 @@ Called after each import run via run_watchlist_matcher(db).
 """
 import logging
 import os
+import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import and_, cast, func, or_, String, text
+from sqlalchemy import and_, func, or_, String
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
+from app.db.query_counter import QueryCounter
 from app.models.notice import ProcurementNotice as Notice, NoticeSource
+from app.models.notice_nuts import nuts_prefix_filter
 from app.models.watchlist import Watchlist
 from app.models.watchlist_match import WatchlistMatch
 
@@ -59,7 +62,6 @@ def _build_match_query(
     since: Optional[datetime] = None,
 ) -> Any:
     """Build SQLAlchemy query for notices matching watchlist criteria."""
-    is_pg = db.bind.dialect.name == "postgresql"
     query = db.query(Notice)
 
     if since:
@@ -89,52 +91,19 @@ def _build_match_query(
         for prefix in cpv_prefixes:
             prefix_clean = prefix.replace("-", "").strip()
             if prefix_clean:
-                cpv_conditions.append(
-                    func.replace(func.coalesce(Notice.cpv_main_code, ""), "-", "").like(f"{prefix_clean}%")
-                )
+                cpv_conditions.append(Notice.cpv_digits.like(f"{prefix_clean}%"))
         if cpv_conditions:
             query = query.filter(or_(*cpv_conditions))
 
-    # NUTS prefix filter
-    nuts_prefixes = _parse_csv(getattr(watchlist, "nuts_prefixes", None))
-    if nuts_prefixes and is_pg:
-        nuts_conditions = []
-        for prefix in nuts_prefixes:
-            p = prefix.strip().upper()
-            if p:
-                nuts_conditions.append(
-                    text(
-                        "notices.nuts_codes IS NOT NULL AND json_typeof(notices.nuts_codes) = 'array' "
-                        "AND EXISTS (SELECT 1 FROM jsonb_array_elements_text(notices.nuts_codes::jsonb) AS nc "
-                        "WHERE nc LIKE :nuts_p)"
-                    ).bindparams(nuts_p=f"{p}%")
-                )
-        if nuts_conditions:
-            query = query.filter(or_(*nuts_conditions))
-
-    # Country filter
-    countries = _parse_csv(watchlist.countries)
-    if countries:
-        if is_pg:
-            country_conditions = []
-            for c in countries:
-                country_conditions.append(
-                    text(
-                        "notices.nuts_codes IS NOT NULL AND json_typeof(notices.nuts_codes) = 'array' "
-                        "AND EXISTS (SELECT 1 FROM jsonb_array_elements_text(notices.nuts_codes::jsonb) AS nc "
-                        "WHERE nc LIKE :country_p)"
-                    ).bindparams(country_p=f"{c.upper()}%")
-                )
-            if country_conditions:
-                query = query.filter(or_(*country_conditions))
-        else:
-            country_conditions = []
-            for c in countries:
-                country_conditions.append(
-                    cast(Notice.nuts_codes, String).ilike(f'%"{c.upper()}%')
-                )
-            if country_conditions:
-                query = query.filter(or_(*country_conditions))
+    # NUTS prefix filter (notice_nuts side table)
+    nuts_clause = nuts_prefix_filter(_parse_csv(getattr(watchlist, "nuts_prefixes", None)))
+    if nuts_clause is not None:
+        query = query.filter(nuts_clause)
+
+    # Country filter (country code = NUTS prefix)
+    country_clause = nuts_prefix_filter(_parse_csv(watchlist.countries))
+    if country_clause is not None:
+        query = query.filter(country_clause)
 
     # Value range filter
     if getattr(watchlist, "value_min", None) is not None:
@@ -199,6 +168,47 @@ def _resolve_user_name(db: Session, watchlist: Watchlist) -> str:
     return ""
 
 
+class _MatcherContext:
+    """Per-run in-memory state: users and their plan limits, loaded in one query."""
+
+    def __init__(self, db: Session, watchlists: list[Watchlist]) -> None:
+        from app.models.user import User
+        from app.services.subscription import effective_plan, get_plan_limits
+
+        user_ids = list({wl.user_id for wl in watchlists if getattr(wl, "user_id", None)})
+        self.users: dict[str, Any] = {}
+        for i in range(0, len(user_ids), _MATCH_CHUNK_SIZE):
+            for user in db.query(User).filter(User.id.in_(user_ids[i:i + _MATCH_CHUNK_SIZE])):
+                self.users[user.id] = user
+        self.email_digest = {
+            uid: get_plan_limits(effective_plan(user)).email_digest for uid, user in self.users.items()
+        }
+
+    def user(self, watchlist: Watchlist) -> Optional[Any]:
+        user_id = getattr(watchlist, "user_id", None)
+        return self.users.get(user_id) if user_id else None
+
+    def email(self, watchlist: Watchlist) -> Optional[str]:
+        """Same resolution as _resolve_email, from preloaded users."""
+        email = getattr(watchlist, "notify_email", None)
+        if email:
+            return email
+        user = self.user(watchlist)
+        return user.email if user and user.email else None
+
+    def user_name(self, watchlist: Watchlist) -> str:
+        """Same resolution as _resolve_user_name, from preloaded users."""
+        user = self.user(watchlist)
+        if user:
+            return getattr(user, "full_name", None) or user.email.split("@")[0]
+        return ""
+
+    def can_send_email(self, watchlist: Watchlist) -> bool:
+        """Plan allows email digest (watchlists without a known user are allowed)."""
+        user = self.user(watchlist)
+        return self.email_digest[user.id] if user else True
+
+
 # ── Get existing open matches for reminder ───────────────────────────
 
 def _get_open_matches(db: Session, watchlist: Watchlist, limit: int = 20) -> list[Notice]:
@@ -220,8 +230,82 @@ def _get_open_matches(db: Session, watchlist: Watchlist, limit: int = 20) -> lis
     return query.all()
 
 
+def _get_open_matches_bulk(
+    db: Session,
+    watchlist_ids: list[str],
+    limit: int = 20,
+) -> dict[str, list[Notice]]:
+    """_get_open_matches for many watchlists: top `limit` open notices per watchlist via row_number()."""
+    now = datetime.now(timezone.utc).date()
+    result: dict[str, list[Notice]] = {wl_id: [] for wl_id in watchlist_ids}
+    for i in range(0, len(watchlist_ids), _MATCH_CHUNK_SIZE):
+        rn = func.row_number().over(
+            partition_by=WatchlistMatch.watchlist_id,
+            order_by=Notice.deadline.asc().nulls_last(),
+        ).label("rn")
+        ranked = (
+            db.query(WatchlistMatch.watchlist_id.label("wl_id"), Notice.id.label("notice_id"), rn)
+            .join(Notice, WatchlistMatch.notice_id == Notice.id)
+            .filter(WatchlistMatch.watchlist_id.in_(watchlist_ids[i:i + _MATCH_CHUNK_SIZE]))
+            .filter(or_(Notice.deadline.is_(None), Notice.deadline >= now))
+            .subquery()
+        )
+        rows = (
+            db.query(ranked.c.wl_id, Notice)
+            .join(Notice, Notice.id == ranked.c.notice_id)
+            .filter(ranked.c.rn <= limit)
+            .order_by(ranked.c.wl_id, ranked.c.rn)
+        )
+        for wl_id, notice in rows:
+            result[wl_id].append(notice)
+    return result
+
+
 # ── Core matching ────────────────────────────────────────────────────
 
+_MATCH_CHUNK_SIZE = 500
+
+
+def _existing_match_notice_ids(db: Session, watchlist_id: str, notice_ids: list[str]) -> set[str]:
+    """notice_ids (among the given ones) already matched to this watchlist, one query per chunk."""
+    existing: set[str] = set()
+    for i in range(0, len(notice_ids), _MATCH_CHUNK_SIZE):
+        existing.update(
+            nid for (nid,) in db.query(WatchlistMatch.notice_id).filter(
+                WatchlistMatch.watchlist_id == watchlist_id,
+                WatchlistMatch.notice_id.in_(notice_ids[i:i + _MATCH_CHUNK_SIZE]),
+            )
+        )
+    return existing
+
+
+def _insert_matches(db: Session, rows: list[dict[str, Any]]) -> set[tuple[str, str]]:
+    """Bulk INSERT watchlist_matches rows; returns the (watchlist_id, notice_id) pairs inserted.
+
+    Pairs stored concurrently are skipped (ON CONFLICT DO NOTHING) and left out,
+    read back with RETURNING (all rows assumed inserted if the dialect lacks it).
+    """
+    if not rows:
+        return set()
+    dialect = db.bind.dialect
+    if dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(WatchlistMatch).on_conflict_do_nothing(
+        index_elements=[WatchlistMatch.watchlist_id, WatchlistMatch.notice_id],
+    )
+    if not dialect.insert_returning:
+        for i in range(0, len(rows), _MATCH_CHUNK_SIZE):
+            db.execute(stmt, rows[i:i + _MATCH_CHUNK_SIZE])
+        return {(r["watchlist_id"], r["notice_id"]) for r in rows}
+    stmt = stmt.returning(WatchlistMatch.watchlist_id, WatchlistMatch.notice_id)
+    inserted: set[tuple[str, str]] = set()
+    for i in range(0, len(rows), _MATCH_CHUNK_SIZE):
+        inserted.update((wl_id, nid) for wl_id, nid in db.execute(stmt, rows[i:i + _MATCH_CHUNK_SIZE]))
+    return inserted
+
+
 def match_watchlist(
     db: Session,
     watchlist: Watchlist,
@@ -244,35 +328,201 @@ def match_watchlist(
     if user_id:
         user = db.query(User).filter(User.id == user_id).first()
 
+    existing = _existing_match_notice_ids(db, watchlist.id, [n.id for n in candidates])
+    rows: list[dict[str, Any]] = []
+
     for notice in candidates:
-        existing = (
-            db.query(WatchlistMatch.id)
-            .filter(
-                WatchlistMatch.watchlist_id == watchlist.id,
-                WatchlistMatch.notice_id == notice.id,
-            )
-            .first()
-        )
-        if existing:
+        if notice.id in existing:
             continue
+        existing.add(notice.id)
 
         score, score_explanation = calculate_relevance_score(notice, watchlist, user=user)
 
-        match = WatchlistMatch(
-            watchlist_id=watchlist.id,
-            notice_id=notice.id,
-            matched_on=explanation,
-            relevance_score=score,
-        )
-        db.add(match)
+        rows.append({
+            "id": str(uuid.uuid4()),
+            "watchlist_id": watchlist.id,
+            "notice_id": notice.id,
+            "matched_on": explanation,
+            "relevance_score": score,
+        })
         new_matches.append(notice)
 
+    inserted = _insert_matches(db, rows)
+    new_matches = [n for n in new_matches if (watchlist.id, n.id) in inserted]
     watchlist.last_refresh_at = datetime.now(timezone.utc)
     db.commit()
 
     return new_matches
 
 
+def match_watchlists(
+    db: Session,
+    watchlists: list[Watchlist],
+    ctx: Optional[_MatcherContext] = None,
+) -> dict[str, list[Notice]]:
+    """
+    Match all watchlists against new notices in a single pass (see watchlist_index).
+
+    Notices created after each watchlist's last_refresh_at are streamed once through
+    the compiled index; new (watchlist, notice) pairs are scored and stored, and every
+    watchlist's last_refresh_at is updated. Returns {watchlist_id: [new matched notices]}.
+    """
+    from app.services.relevance_scoring import calculate_relevance_score
+    from app.services.watchlist_index import WatchlistIndex
+
+    new_by_watchlist: dict[str, list[Notice]] = {wl.id: [] for wl in watchlists}
+    if not watchlists:
+        return new_by_watchlist
+
+    index = WatchlistIndex(watchlists)
+    pairs: dict[str, set[str]] = defaultdict(set)
+    for wl_id, notice_id in index.stream_matches(db):
+        pairs[notice_id].add(wl_id)
+
+    wl_by_id = {wl.id: wl for wl in watchlists}
+    notice_ids = list(pairs)
+    chunk = _MATCH_CHUNK_SIZE
+
+    # Drop pairs that already have a stored match
+    for i in range(0, len(notice_ids), chunk):
+        for wl_id, notice_id in (
+            db.query(WatchlistMatch.watchlist_id, WatchlistMatch.notice_id)
+            .filter(WatchlistMatch.notice_id.in_(notice_ids[i:i + chunk]))
+            .filter(WatchlistMatch.watchlist_id.in_(list(wl_by_id)))
+        ):
+            pairs[notice_id].discard(wl_id)
+
+    # Users for profile-based scoring boost, loaded once
+    users = (ctx or _MatcherContext(db, watchlists)).users
+    explanations = {wl.id: _build_explanation(wl) for wl in watchlists}
+
+    pending = [nid for nid in notice_ids if pairs[nid]]
+    rows: list[dict[str, Any]] = []
+    for i in range(0, len(pending), chunk):
+        for notice in db.query(Notice).filter(Notice.id.in_(pending[i:i + chunk])):
+            for wl_id in sorted(pairs[notice.id]):
+                wl = wl_by_id[wl_id]
+                score, _ = calculate_relevance_score(notice, wl, user=users.get(wl.user_id))
+                rows.append({
+                    "id": str(uuid.uuid4()),
+                    "watchlist_id": wl_id,
+                    "notice_id": notice.id,
+                    "matched_on": explanations[wl_id],
+                    "relevance_score": score,
+                })
+                new_by_watchlist[wl_id].append(notice)
+
+    inserted = _insert_matches(db, rows)
+    for wl_id, notices in new_by_watchlist.items():
+        notices[:] = [n for n in notices if (wl_id, n.id) in inserted]
+
+    now = datetime.now(timezone.utc)
+    for wl in watchlists:
+        wl.last_refresh_at = now
+    db.commit()
+
+    return new_by_watchlist
+
+
+# ── Bulk rescoring ───────────────────────────────────────────────────
+
+_RESCORE_BATCH_SIZE = 1000
+_MATCHED_ON_MAX = WatchlistMatch.__table__.c.matched_on.type.length
+
+# Columns read by relevance_scoring (no ORM entities, no raw_data)
+_RESCORE_COLUMNS = (
+    WatchlistMatch.id,
+    WatchlistMatch.watchlist_id,
+    WatchlistMatch.relevance_score,
+    WatchlistMatch.matched_on,
+    Notice.title,
+    Notice.description,
+    Notice.cpv_main_code,
+    Notice.nuts_codes,
+    Notice.deadline,
+)
+
+
+def _update_match_scores(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Write (id, relevance_score, matched_on) rows: one UPDATE ... FROM (VALUES ...) on Postgres."""
+    if not rows:
+        return
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy import Integer, column, update, values
+
+        v = values(
+            column("id", String),
+            column("relevance_score", Integer),
+            column("matched_on", String),
+            name="v",
+        ).data([(r["id"], r["relevance_score"], r["matched_on"]) for r in rows])
+        table = WatchlistMatch.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == v.c.id)
+            .values(relevance_score=v.c.relevance_score, matched_on=v.c.matched_on)
+        )
+        return
+    from sqlalchemy import bindparam, update
+
+    stmt = (
+        update(WatchlistMatch.__table__)
+        .where(WatchlistMatch.__table__.c.id == bindparam("b_id"))
+        .values(relevance_score=bindparam("b_relevance_score"), matched_on=bindparam("b_matched_on"))
+    )
+    db.execute(stmt, [{f"b_{k}": v for k, v in r.items()} for r in rows])
+
+
+def rescore_matches(db: Session, batch_size: int = _RESCORE_BATCH_SIZE) -> dict[str, int]:
+    """
+    Recompute relevance_score / matched_on for every stored watchlist match.
+
+    Matches are walked by keyset pagination on id (joined to the notice columns the
+    scorer reads), each watchlist's criteria are parsed once, and only rows whose
+    score or explanation changed are written, one batch UPDATE per page.
+    Returns {"scored": n, "updated": n}.
+    """
+    from app.models.user import User
+    from app.services.relevance_scoring import ScoringParams, score_with_params
+
+    watchlists = (
+        db.query(Watchlist)
+        .filter(Watchlist.id.in_(db.query(WatchlistMatch.watchlist_id).distinct()))
+        .all()
+    )
+    user_ids = {wl.user_id for wl in watchlists if wl.user_id}
+    users = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids))} if user_ids else {}
+    params = {wl.id: ScoringParams(wl, user=users.get(wl.user_id)) for wl in watchlists}
+
+    scored = updated = 0
+    last_id: Optional[str] = None
+    while True:
+        query = db.query(*_RESCORE_COLUMNS).join(Notice, Notice.id == WatchlistMatch.notice_id)
+        if last_id is not None:
+            query = query.filter(WatchlistMatch.id > last_id)
+        page = query.order_by(WatchlistMatch.id).limit(batch_size).all()
+        if not page:
+            break
+        last_id = page[-1].id
+
+        changes: list[dict[str, Any]] = []
+        for row in page:
+            wl_params = params.get(row.watchlist_id)
+            if wl_params is None:
+                continue
+            score, explanation = score_with_params(row, wl_params)
+            explanation = explanation[:_MATCHED_ON_MAX]
+            scored += 1
+            if score != row.relevance_score or explanation != row.matched_on:
+                changes.append({"id": row.id, "relevance_score": score, "matched_on": explanation})
+
+        _update_match_scores(db, changes)
+        db.commit()
+        updated += len(changes)
+
+    return {"scored": scored, "updated": updated}
+
+
 def _notice_to_email_dict(notice: Notice, is_new: bool = False) -> dict[str, Any]:
     """Convert notice to dict for email template."""
     buyer = None
@@ -318,11 +568,35 @@ def run_watchlist_matcher(db: Session) -> dict[str, Any]:
     email per user (not per watchlist).
 
     Flow:
-      1. For each enabled watchlist: match NEW notices + get existing OPEN matches
+      1. Match NEW notices for all enabled watchlists in one pass (match_watchlists),
+         then get existing OPEN matches for all watchlists in one query
       2. Group results by user email (auto-resolved from user account)
       3. For each user with any matches (new or open): send 1 consolidated digest
+
+    Users and plans are preloaded once (_MatcherContext); the summary includes
+    "db_queries", the number of SQL statements issued by the run.
     """
+    # Objects loaded for the run stay usable after the intermediate commits
+    # (no per-row reloads of watchlists, users and notices).
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        with QueryCounter(db) as query_counter:
+            results = _run_watchlist_matcher(db)
+    finally:
+        db.expire_on_commit = expire_on_commit
+    results["db_queries"] = query_counter.count
+    logger.info(
+        "Watchlist matcher: %d watchlists, %d new matches, %d DB queries",
+        results["watchlists_processed"], results["total_new_matches"], query_counter.count,
+    )
+    return results
+
+
+def _run_watchlist_matcher(db: Session) -> dict[str, Any]:
+    # Watchlists, users and plan limits are loaded once and shared through the run
     watchlists = db.query(Watchlist).filter(Watchlist.enabled == True).all()
+    ctx = _MatcherContext(db, watchlists)
 
     results = {
         "watchlists_processed": 0,
@@ -336,13 +610,37 @@ def run_watchlist_matcher(db: Session) -> dict[str, Any]:
     user_digests: dict[str, list[dict[str, Any]]] = defaultdict(list)
     user_names: dict[str, str] = {}
 
+    # 1a. Find new matches for all watchlists in one pass over new notices;
+    # fall back to per-watchlist queries if the batched pass fails.
+    try:
+        new_by_watchlist: Optional[dict[str, list[Notice]]] = match_watchlists(db, watchlists, ctx=ctx)
+    except Exception as e:
+        logger.error(f"Batched watchlist matching failed, falling back to per-watchlist: {e}")
+        db.rollback()
+        new_by_watchlist = None
+
+    # 1b. Open matches (new ones + existing reminders) for all watchlists at once
+    try:
+        open_by_watchlist: Optional[dict[str, list[Notice]]] = (
+            _get_open_matches_bulk(db, [wl.id for wl in watchlists], limit=20)
+            if new_by_watchlist is not None else None
+        )
+    except Exception as e:
+        logger.error(f"Batched open-match lookup failed, falling back to per-watchlist: {e}")
+        db.rollback()
+        open_by_watchlist = None
+
     for wl in watchlists:
         try:
-            # 1a. Find new matches
-            new_matches = match_watchlist(db, wl)
+            if new_by_watchlist is not None:
+                new_matches = new_by_watchlist.get(wl.id, [])
+            else:
+                new_matches = match_watchlist(db, wl)
 
-            # 1b. Get all open matches (includes new ones + existing reminders)
-            open_matches = _get_open_matches(db, wl, limit=20)
+            if open_by_watchlist is not None:
+                open_matches = open_by_watchlist.get(wl.id, [])
+            else:
+                open_matches = _get_open_matches(db, wl, limit=20)
 
             # Track which notice IDs are new for highlighting
             new_ids = {n.id for n in new_matches}
@@ -356,18 +654,10 @@ def run_watchlist_matcher(db: Session) -> dict[str, Any]:
             }
 
             # 1c. Resolve email (watchlist notify_email → user account email)
-            email_addr = _resolve_email(db, wl)
+            email_addr = ctx.email(wl)
 
             # 1d. Check if user's plan allows email digest
-            can_send_email = True
-            user_id = getattr(wl, "user_id", None)
-            if user_id:
-                from app.services.subscription import effective_plan as _eff_plan, get_plan_limits as _get_limits
-                from app.models.user import User
-                user_obj = db.query(User).filter(User.id == user_id).first()
-                if user_obj:
-                    plan_limits = _get_limits(_eff_plan(user_obj))
-                    can_send_email = plan_limits.email_digest
+            can_send_email = ctx.can_send_email(wl)
 
             if email_addr and open_matches and can_send_email:
                 email_data = [
@@ -385,7 +675,7 @@ def run_watchlist_matcher(db: Session) -> dict[str, Any]:
                 detail["resolved_email"] = email_addr
 
                 if email_addr not in user_names:
-                    user_names[email_addr] = _resolve_user_name(db, wl)
+                    user_names[email_addr] = ctx.user_name(wl)
 
             elif not email_addr:
                 detail["skipped_reason"] = "no email (no notify_email and no user account)"
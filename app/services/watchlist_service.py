@@ -3,12 +3,13 @@ import json
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import false, func, or_
+from sqlalchemy import false, or_
 from sqlalchemy.orm import Session
 
 from app.models.watchlist import Watchlist
 from app.models.watchlist_match import WatchlistMatch
 from app.models.notice import ProcurementNotice
+from app.utils.keyword_matcher import keyword_matcher
 
 # Map watchlist source identifiers (TED, BOSA) to notice.source column (ProcurementNotice schema)
 WATCHLIST_SOURCE_TO_NOTICE_SOURCE = {
@@ -112,9 +113,7 @@ class WatchlistService:
             for p in cpv_prefixes:
                 if not p:
                     continue
-                cpv_conditions.append(
-                    func.replace(func.coalesce(ProcurementNotice.cpv_main_code, ""), "-", "").like(f"{p}%")
-                )
+                cpv_conditions.append(ProcurementNotice.cpv_digits.like(f"{p}%"))
 
         # OR logic: include notices that match keywords OR cpv (or both)
         if keyword_conditions and cpv_conditions:
@@ -137,17 +136,18 @@ class WatchlistService:
 
         new_matches: list[dict[str, Any]] = []
         now = datetime.now(timezone.utc)
+        matcher = keyword_matcher(expanded_keywords)
 
         for notice in candidate_notices:
             if notice.id in existing_match_ids:
                 continue
             keywords_matched = []
             if expanded_keywords:
-                title_lower = (notice.title or "").lower()
-                desc_lower = (notice.description or "").lower()
-                for k in expanded_keywords:
-                    if k.lower() in title_lower or k.lower() in desc_lower:
-                        keywords_matched.append(k)
+                field_hits = matcher.field_hits({
+                    "title": notice.title or "",
+                    "description": notice.description or "",
+                })
+                keywords_matched = [k for i, k in enumerate(expanded_keywords) if i in field_hits]
             cpv_matched = []
             main_cpv = (notice.cpv_main_code or "").replace("-", "").replace(" ", "")
             if cpv_prefixes:
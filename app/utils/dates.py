@@ -0,0 +1,12 @@
+"""Datetime helpers."""
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    """Normalize to naive UTC so DB values (naive) and cutoffs (often aware) compare."""
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
@@ -0,0 +1,128 @@
+"""Multi-pattern substring matching for keyword checks.
+
+A watchlist keyword list (several times longer after translation expansion)
+is checked against notice texts on every scoring / refresh pass.
+KeywordMatcher lowercases each text once and runs the C substring search per
+distinct keyword, which stays fastest up to a few hundred keywords. Larger
+lists (the cross-watchlist index) switch to an Aho-Corasick automaton, linear
+in len(text) whatever the number of keywords (crossover measured at ~250
+keywords on 0.5-6 KB texts; tests/test_keyword_matcher.py keeps the small-list
+path on par with the naive loop).
+
+- Automaton: pattern → ids index compiled once; ids_in(text) scans a text
+  (also used directly by translation_service for short texts / big dictionaries)
+- KeywordMatcher: matcher over a keyword list, with per-field hits
+- keyword_matcher(keywords): compiled matchers, LRU-cached by keyword list
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+
+class Automaton:
+    """Aho-Corasick automaton: ids of the patterns occurring inside a text."""
+
+    def __init__(self, index: Mapping[str, Iterable[int]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[frozenset[int]] = [frozenset()]
+        for pattern, ids in index.items():
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(frozenset())
+                node = nxt
+            self._out[node] = self._out[node] | frozenset(ids)
+
+        # Breadth-first failure links; outputs inherit those of their fail node
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] | self._out[self._fail[child]]
+                queue.append(child)
+
+    def ids_in(self, text: str) -> set[int]:
+        found: set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            found |= self._out[node]
+        return found
+
+
+# Distinct keywords from which the automaton beats per-keyword substring search
+AUTOMATON_MIN_KEYWORDS = 256
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a keyword list.
+
+    Hits are keyword positions in `keywords` (duplicates get one position
+    each); blank keywords never match.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(keywords)
+        index: dict[str, list[int]] = {}
+        for i, kw in enumerate(self.keywords):
+            needle = kw.lower().strip()
+            if needle:
+                index.setdefault(needle, []).append(i)
+        self._needles = tuple(index.items())
+        self._automaton = Automaton(index) if len(index) >= AUTOMATON_MIN_KEYWORDS else None
+
+    def _hits_lower(self, text: str) -> set[int]:
+        if self._automaton is not None:
+            return self._automaton.ids_in(text)
+        return {i for needle, ids in self._needles if needle in text for i in ids}
+
+    def hits(self, text: str) -> set[int]:
+        """Positions of the keywords occurring in text."""
+        return self._hits_lower(text.lower()) if text else set()
+
+    def found_in(self, text: str) -> list[str]:
+        """Keywords occurring in text, in keyword-list order."""
+        hits = self.hits(text)
+        return [kw for i, kw in enumerate(self.keywords) if i in hits]
+
+    def field_hits(self, fields: Mapping[str, str]) -> dict[int, str]:
+        """Keyword position → first field (in mapping order) whose text contains it."""
+        texts = [(field, text.lower()) for field, text in fields.items() if text]
+        by_keyword: dict[int, str] = {}
+        if self._automaton is not None:
+            for field, text in texts:
+                for i in self._automaton.ids_in(text):
+                    by_keyword.setdefault(i, field)
+            return by_keyword
+        for needle, ids in self._needles:
+            for field, text in texts:
+                if needle in text:
+                    for i in ids:
+                        by_keyword[i] = field
+                    break
+        return by_keyword
+
+
+@lru_cache(maxsize=512)
+def _compiled(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def keyword_matcher(keywords: Iterable[str]) -> KeywordMatcher:
+    """Compiled matcher for a keyword list, shared by every caller with the same list."""
+    return _compiled(tuple(keywords))
@@ -1,10 +1,17 @@
 """Utility functions for building searchable text from notices."""
+import hashlib
 import json
 from typing import Any, Optional
 
 from app.models.notice import Notice  # alias for ProcurementNotice
 from app.models.notice_detail import NoticeDetail
 
+# Bump when the text built below changes: stored hashes then no longer match
+SEARCHABLE_TEXT_VERSION = 1
+
+_TITLE_FIELDS = ("notice-title", "title-proc", "title-glo")
+_DESCRIPTION_FIELDS = ("description-glo", "description-proc", "description")
+
 
 def pick_text(value: Any) -> str | None:
     """
@@ -46,74 +53,76 @@ def build_searchable_text(
     - raw_data fields (notice-title, title-proc, description, keywords, etc.)
     - Optional notice_detail content if present
     """
-    parts = []
+    return searchable_text_from_values(
+        notice.title,
+        notice.description,
+        notice.raw_data,
+        notice_detail.raw_json if notice_detail else None,
+    )
+
+
+def searchable_text_from_values(
+    title: Optional[str],
+    description: Optional[str],
+    raw_data: Any,
+    detail_raw_json: Optional[str] = None,
+) -> str:
+    """build_searchable_text() from column values (notices row + notice_details.raw_json)."""
+    parts: list[str] = []
+    seen: set[str] = set()
+
+    def add(text: Optional[str], dedupe: bool = True) -> None:
+        if text and not (dedupe and text in seen):
+            parts.append(text)
+            seen.add(text)
 
     # Add notice title and description
-    if notice.title:
-        parts.append(notice.title)
-    if notice.description:
-        parts.append(notice.description)
+    add(title, dedupe=False)
+    add(description, dedupe=False)
 
     # Extract from raw_data (ProcurementNotice stores this as a JSON dict)
-    raw_data = notice.raw_data
     if isinstance(raw_data, dict):
-        for field in ("notice-title", "title-proc", "title-glo"):
-            text = pick_text(raw_data.get(field))
-            if text and text not in parts:
-                parts.append(text)
-        for field in (
-            "description-glo",
-            "description-proc",
-            "description",
-            "dossier_title",
-            "organisation_name",
-        ):
-            text = pick_text(raw_data.get(field))
-            if text and text not in parts:
-                parts.append(text)
+        for field in _TITLE_FIELDS + _DESCRIPTION_FIELDS + ("dossier_title", "organisation_name"):
+            add(pick_text(raw_data.get(field)))
         # Include BOSA keywords if present
         keywords = raw_data.get("keywords")
         if isinstance(keywords, list):
             for kw in keywords:
                 if isinstance(kw, str) and kw.strip():
-                    parts.append(kw.strip())
+                    add(kw.strip(), dedupe=False)
     elif isinstance(raw_data, str) and raw_data.strip():
         # Fallback: try parsing as JSON string (legacy data)
         try:
             parsed = json.loads(raw_data)
             if isinstance(parsed, dict):
-                for field in ("notice-title", "title-proc", "title-glo"):
-                    text = pick_text(parsed.get(field))
-                    if text and text not in parts:
-                        parts.append(text)
-                for field in (
-                    "description-glo",
-                    "description-proc",
-                    "description",
-                ):
-                    text = pick_text(parsed.get(field))
-                    if text and text not in parts:
-                        parts.append(text)
+                for field in _TITLE_FIELDS + _DESCRIPTION_FIELDS:
+                    add(pick_text(parsed.get(field)))
         except (json.JSONDecodeError, AttributeError, TypeError):
             pass
 
     # Extract from notice_detail if available
-    if notice_detail and notice_detail.raw_json:
+    if detail_raw_json:
         try:
-            detail_data = json.loads(notice_detail.raw_json)
-            for field in ("notice-title", "title-proc", "title-glo"):
-                text = pick_text(detail_data.get(field))
-                if text and text not in parts:
-                    parts.append(text)
-            for field in (
-                "description-glo",
-                "description-proc",
-                "description",
-            ):
-                text = pick_text(detail_data.get(field))
-                if text and text not in parts:
-                    parts.append(text)
+            detail_data = json.loads(detail_raw_json)
+            for field in _TITLE_FIELDS + _DESCRIPTION_FIELDS:
+                add(pick_text(detail_data.get(field)))
         except (json.JSONDecodeError, AttributeError, TypeError):
             pass
 
     return " ".join(parts).lower()
+
+
+def searchable_text_hash(
+    title: Optional[str],
+    description: Optional[str],
+    raw_data: Any,
+    detail_raw_json: Optional[str] = None,
+) -> str:
+    """SHA-256 of the inputs of searchable_text_from_values() (and its version)."""
+    payload = json.dumps(
+        [SEARCHABLE_TEXT_VERSION, title, description, raw_data, detail_raw_json],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -32,7 +32,7 @@ import signal
 import subprocess
 import sys
 import time as _time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # ── Project root on path ───────────────────────────────────────────
@@ -137,7 +137,11 @@ def step_import(db) -> dict:
 def step_backfill(db) -> dict:
     logger.info("=" * 60)
     logger.info("STEP 3/8: Backfill (raw_data → structured fields)")
-    from app.services.enrichment_service import backfill_from_raw_data, refresh_search_vectors
+    from app.services.enrichment_service import (
+        backfill_from_raw_data,
+        refresh_search_texts,
+        refresh_search_vectors,
+    )
 
     total_enriched = 0
     for pass_num in range(1, 4):  # max 3 passes
@@ -155,7 +159,13 @@ def step_backfill(db) -> dict:
         rows = refresh_search_vectors(db)
         logger.info("  Search vectors refreshed (%d rows)", rows)
 
-    return {"total_enriched": total_enriched}
+    # Keyword matching texts: build missing rows, re-hash notices updated since the
+    # previous run (window overlaps one missed run; the watchlist step reads them)
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=2)
+    texts = refresh_search_texts(db, updated_since=since)
+    logger.info("  Searchable texts built (%d rows)", texts)
+
+    return {"total_enriched": total_enriched, "search_texts": texts}
 
 
 # ═════════════════════════════════════════════════════════════════════
@@ -257,7 +267,12 @@ def step_merge_cleanup(db) -> dict:
     else:
         logger.info("  No orphan CANs to clean up.")
 
-    return {"merged": total_merged, "cleaned": deleted}
+    # Reconcile facet counters (repairs drift from writes outside the tracked paths)
+    from app.models.notice_facet_count import refresh_facet_counts
+    facets_fixed = refresh_facet_counts(db)
+    logger.info("  Facet counters reconciled (%d rows changed)", facets_fixed)
+
+    return {"merged": total_merged, "cleaned": deleted, "facets_fixed": facets_fixed}
 
 
 # ═════════════════════════════════════════════════════════════════════
@@ -321,42 +336,15 @@ def step_watchlists(db) -> dict:
 
     # Rescore all existing matches
     try:
-        from app.models.watchlist_match import WatchlistMatch
-        from app.models.watchlist import Watchlist
-        from app.models.notice import ProcurementNotice as Notice
-        from app.models.user import User
-        from app.services.relevance_scoring import calculate_relevance_score
-
-        total_matches = db.query(WatchlistMatch).count()
-        if total_matches > 0:
-            wl_ids = [r[0] for r in db.query(WatchlistMatch.watchlist_id).distinct().all()]
-            watchlists = {wl.id: wl for wl in db.query(Watchlist).filter(Watchlist.id.in_(wl_ids)).all()}
-            user_ids = {wl.user_id for wl in watchlists.values() if wl.user_id}
-            users = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()} if user_ids else {}
-
-            updated = 0
-            offset = 0
-            while offset < total_matches:
-                matches = db.query(WatchlistMatch).order_by(WatchlistMatch.id).offset(offset).limit(500).all()
-                if not matches:
-                    break
-                notice_ids = [m.notice_id for m in matches]
-                notice_map = {n.id: n for n in db.query(Notice).filter(Notice.id.in_(notice_ids)).all()}
-                for match in matches:
-                    wl = watchlists.get(match.watchlist_id)
-                    notice = notice_map.get(match.notice_id)
-                    if wl and notice:
-                        user = users.get(wl.user_id) if wl.user_id else None
-                        score, explanation = calculate_relevance_score(notice, wl, user=user)
-                        match.relevance_score = score
-                        match.matched_on = explanation
-                        updated += 1
-                db.commit()
-                offset += 500
-            logger.info("  Rescore: updated=%d/%d", updated, total_matches)
+        from app.services.watchlist_matcher import rescore_matches
+
+        rescore = rescore_matches(db)
+        if rescore["scored"]:
+            logger.info("  Rescore: updated=%d/%d", rescore["updated"], rescore["scored"])
         else:
             logger.info("  Rescore: no matches to score.")
     except Exception as e:
+        db.rollback()
         logger.warning("  Rescore error: %s", e)
 
     return results
@@ -226,9 +226,9 @@ def run_source(
                 continue
             try:
                 if source == "BOSA":
-                    stats = asyncio.run(service.import_from_eproc_search(items, fetch_details=False))
+                    stats = asyncio.run(service.import_from_eproc_search(items, fetch_details=False, bulk=True))
                 else:
-                    stats = asyncio.run(service.import_from_ted_search(items, fetch_details=False))
+                    stats = asyncio.run(service.import_from_ted_search(items, fetch_details=False, bulk=True))
                 total_created += stats["created"]
                 total_updated += stats["updated"]
                 errs = stats.get("errors") or []
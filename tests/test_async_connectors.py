@@ -0,0 +1,193 @@
+"""Tests for the async connector variants (httpx.MockTransport, offline)."""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import requests
+
+from app.connectors.async_http import AsyncClientPool, request_with_retry, run_async
+from app.connectors.bosa.official_client import OfficialEProcurementClient
+from app.connectors.ted.official_client import OfficialTEDClient
+
+
+def _mock_pool(pool: AsyncClientPool, handler) -> None:
+    """Make pool.get() return a client backed by a MockTransport for the running loop."""
+    transport = httpx.MockTransport(handler)
+
+    def _get() -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        client = pool._clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(transport=transport, limits=pool.limits)
+            pool._clients[loop] = client
+        return client
+
+    pool.get = _get
+
+
+def _bosa_client() -> OfficialEProcurementClient:
+    client = OfficialEProcurementClient(
+        token_url="https://example.com/token",
+        client_id="id",
+        client_secret="secret",
+        dos_base_url="https://api.example.com/dos",
+        endpoint_confirmed=True,
+    )
+    client._access_token = "tok"
+    client._token_expires_at = 10**12
+    return client
+
+
+def test_request_with_retry_retries_5xx_then_succeeds():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503 if len(calls) < 3 else 200, json={"ok": True})
+
+    async def run() -> httpx.Response:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await request_with_retry(client, "GET", "https://api.example.com/x")
+
+    with patch("app.connectors.async_http.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        resp = asyncio.run(run())
+
+    assert resp.status_code == 200
+    assert len(calls) == 3
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [1, 2]
+
+
+def test_bosa_workspace_async_returns_json_or_none():
+    client = _bosa_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer tok"
+        assert "BelGov-Trace-Id" in request.headers
+        if request.url.path.endswith("/ws-1"):
+            return httpx.Response(200, json={"id": "ws-1"})
+        return httpx.Response(404)
+
+    _mock_pool(client._async_pool, handler)
+
+    async def run():
+        return await asyncio.gather(
+            client.get_publication_workspace_async("ws-1"),
+            client.get_publication_workspace_async("missing"),
+        )
+
+    found, missing = run_async(run())
+    assert found == {"id": "ws-1"}
+    assert missing is None
+
+
+
+def test_bosa_async_token_refresh_runs_once_for_concurrent_calls():
+    client = _bosa_client()
+    client._access_token = None
+    client._token_expires_at = 0
+    _mock_pool(client._async_pool, lambda request: httpx.Response(200, json={}))
+    token_response = requests.Response()
+    token_response.status_code = 200
+    token_response._content = json.dumps({"access_token": "fresh", "expires_in": 3600}).encode()
+
+    async def run():
+        await asyncio.gather(*(client.get_publication_workspace_async(f"ws-{i}") for i in range(8)))
+
+    def slow_post(*args, **kwargs):
+        time.sleep(0.05)  # token endpoint latency: other coroutines see the expiring token meanwhile
+        return token_response
+
+    with patch("app.connectors.bosa.official_client.requests.post", side_effect=slow_post) as post:
+        run_async(run())
+    assert post.call_count == 1
+    assert client._access_token == "fresh"
+
+
+def test_fetch_publication_workspaces_gives_none_for_failed_fetches():
+    from app.connectors.eproc_connector import fetch_publication_workspaces
+
+    client = _bosa_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/ws-broken"):
+            raise RuntimeError("connection reset")
+        return httpx.Response(200, json={"id": "ws-1"})
+
+    _mock_pool(client._async_pool, handler)
+    with patch("app.connectors.eproc_connector._get_client", return_value=(client, "official")):
+        result = run_async(fetch_publication_workspaces(["ws-1", "ws-broken", "ws-1"]))
+    assert result == {"ws-1": {"id": "ws-1"}, "ws-broken": None}
+
+
+def test_bosa_workspace_documents_async_returns_list_or_empty():
+    from app.services.document_crawler import list_workspace_documents_async
+
+    client = _bosa_client()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["Authorization"] == "Bearer tok"
+        assert request.url.params["type"] == "WORKSPACE"
+        workspace = request.url.path.split("/")[-2]
+        if workspace == "ws-1":
+            return httpx.Response(200, json=[{"id": "doc-1"}])
+        return httpx.Response(403 if workspace == "ws-private" else 500, text="nope")
+
+    _mock_pool(client._async_pool, handler)
+
+    async def run():
+        return await asyncio.gather(
+            list_workspace_documents_async("ws-1"),
+            list_workspace_documents_async("ws-private"),
+            list_workspace_documents_async("ws-down"),
+        )
+
+    with patch("app.services.document_crawler._get_bosa_client", return_value=client), \
+         patch("app.connectors.async_http.asyncio.sleep", new_callable=AsyncMock):
+        found, private, down = run_async(run())
+    assert found == [{"id": "doc-1"}]
+    assert private == []
+    assert down == []
+
+def test_run_async_closes_pooled_clients():
+    client = _bosa_client()
+    _mock_pool(client._async_pool, lambda request: httpx.Response(200, json={}))
+    opened = []
+
+    async def run():
+        http = client._async_pool.get()
+        opened.append(http)
+        await client.get_publication_workspace_async("ws-1")
+
+    run_async(run())
+    assert opened[0].is_closed
+    assert not client._async_pool._clients
+
+
+def test_ted_search_notices_async_matches_sync_shape():
+    client = OfficialTEDClient(search_base_url="https://api.ted.europa.eu")
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"notices": [{"publication-number": "1-2026"}], "totalNoticeCount": 1})
+
+    _mock_pool(client._async_pool, handler)
+    result = run_async(client.search_notices_async("solar", page=2, page_size=10))
+
+    assert result["notices"] == [{"publication-number": "1-2026"}]
+    assert result["metadata"]["totalCount"] == 1
+    assert result["metadata"]["url"] == "https://api.ted.europa.eu/v3/notices/search"
+    assert bodies[0]["page"] == 2
+    assert bodies[0]["limit"] == 10
+    assert "solar" in bodies[0]["query"]
+
+
+def test_ted_search_notices_async_raises_http_error_on_4xx():
+    client = OfficialTEDClient(search_base_url="https://api.ted.europa.eu")
+    _mock_pool(client._async_pool, lambda request: httpx.Response(400, json={"error": "bad query"}))
+
+    with pytest.raises(requests.HTTPError):
+        run_async(client.search_notices_async("solar"))
@@ -88,7 +88,7 @@ def test_search_publications_includes_trace_id() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"totalCount": 0, "items": []}
@@ -135,7 +135,7 @@ def test_get_cpv_label_includes_trace_id() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -167,7 +167,7 @@ def test_request_method_includes_trace_id() -> None:
     )
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {}
@@ -68,7 +68,7 @@ class TestBulkImportSource:
 
         import asyncio
 
-        async def mock_import(items, fetch_details=False):
+        async def mock_import(items, fetch_details=False, bulk=False):
             return {"created": len(items), "updated": 0, "skipped": 0, "errors": []}
 
         mock_svc = MagicMock()
@@ -94,7 +94,7 @@ class TestBulkImportSource:
 
         import asyncio
 
-        async def mock_import(items, fetch_details=False):
+        async def mock_import(items, fetch_details=False, bulk=False):
             return {"created": 1, "updated": 0, "skipped": 0, "errors": []}
 
         mock_svc = MagicMock()
@@ -121,7 +121,7 @@ class TestBulkImportSource:
 
         import asyncio
 
-        async def mock_import(items, fetch_details=False):
+        async def mock_import(items, fetch_details=False, bulk=False):
             return {"created": len(items), "updated": 0, "skipped": 0, "errors": []}
 
         mock_svc = MagicMock()
@@ -148,7 +148,7 @@ class TestBulkImportSource:
 
         import asyncio
 
-        async def mock_import(items, fetch_details=False):
+        async def mock_import(items, fetch_details=False, bulk=False):
             return {"created": len(items), "updated": 0, "skipped": 0, "errors": []}
 
         mock_svc = MagicMock()
@@ -180,7 +180,10 @@ class TestBulkImportSource:
 
         import asyncio
 
-        async def mock_import(items, fetch_details=False):
+        bulk_flags = []
+
+        async def mock_import(items, fetch_details=False, bulk=False):
+            bulk_flags.append(bulk)
             return {"created": 1, "updated": 0, "skipped": 0, "errors": []}
 
         mock_svc = MagicMock()
@@ -191,6 +194,63 @@ class TestBulkImportSource:
             result = bulk_import_source(db, "TED", page_size=50)
 
         assert result["total_created"] == 1
+        assert bulk_flags == [True]
+
+    def test_fetch_runs_ahead_of_import(self):
+        import threading
+        import time
+        from app.services.bulk_import import bulk_import_source
+
+        db = MagicMock()
+        events = []
+        lock = threading.Lock()
+
+        def mock_fetch(term, page, page_size, **kwargs):
+            with lock:
+                events.append(("fetch", page))
+            return {
+                "items": [{"publicationWorkspaceId": f"ws-{page}-{i}"} for i in range(5)],
+                "total_count": 15,
+            }
+
+        async def mock_import(items, fetch_details=False, bulk=False):
+            page = int(items[0]["publicationWorkspaceId"].split("-")[1])
+            time.sleep(0.05)  # blocking DB work
+            with lock:
+                events.append(("imported", page))
+            return {"created": len(items), "updated": 0, "skipped": 0, "errors": []}
+
+        mock_svc = MagicMock()
+        mock_svc.import_from_eproc_search = mock_import
+
+        with patch("app.services.bulk_import._fetch_page_bosa", side_effect=mock_fetch), \
+             patch("app.services.bulk_import.NoticeService", return_value=mock_svc):
+            result = bulk_import_source(db, "BOSA", page_size=5)
+
+        assert result["total_created"] == 15
+        assert [p["page"] for p in result["pages"]] == [1, 2, 3]
+        assert all("fetch_seconds" in p and "import_seconds" in p for p in result["pages"])
+        # Page 2 was fetched while page 1 was still being imported
+        assert events.index(("fetch", 2)) < events.index(("imported", 1))
+
+    def test_abort_after_failed_pages_does_not_hang(self):
+        from app.services.bulk_import import bulk_import_source
+
+        db = MagicMock()
+        pages_called = []
+
+        def mock_fetch(term, page, page_size, **kwargs):
+            pages_called.append(page)
+            raise RuntimeError("gateway timeout")
+
+        with patch("app.services.bulk_import._fetch_page_bosa", side_effect=mock_fetch), \
+             patch("app.services.bulk_import.NoticeService", return_value=MagicMock()):
+            result = bulk_import_source(db, "BOSA", page_size=10, max_pages=50, prefetch_pages=1)
+
+        assert result["total_errors"] == 3
+        assert [p["page"] for p in result["pages"]] == [1, 2, 3]
+        # Fetcher is at most prefetch_pages + 1 pages ahead when the importer aborts
+        assert len(pages_called) <= 5
 
 
 class TestBulkImportAll:
@@ -72,7 +72,7 @@ def test_cpv_retry_tries_candidates_in_order() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # First candidate returns 204, second returns 200 with label
             mock_resp_204 = Mock()
             mock_resp_204.status_code = 204
@@ -129,7 +129,7 @@ def test_cpv_retry_returns_none_if_all_candidates_fail() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # All candidates return 204
             mock_resp_204 = Mock()
             mock_resp_204.status_code = 204
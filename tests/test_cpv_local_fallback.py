@@ -37,7 +37,7 @@ def test_cpv_normalization_removes_check_digit() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # First candidate (raw input) returns 204, second (8-digit) returns 200
             mock_resp_204 = Mock()
             mock_resp_204.status_code = 204
@@ -102,7 +102,7 @@ def test_cpv_local_fallback_on_204() -> None:
         client._endpoint_confirmed = True
         
         with patch.object(client, "get_access_token", return_value="test-token"):
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 # Mock 204 No Content response
                 mock_response = Mock()
                 mock_response.status_code = 204
@@ -158,7 +158,7 @@ def test_cpv_local_fallback_not_found() -> None:
         client._endpoint_confirmed = True
         
         with patch.object(client, "get_access_token", return_value="test-token"):
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_response = Mock()
                 mock_response.status_code = 204
                 mock_response.text = ""
@@ -40,7 +40,7 @@ def test_cpv_probe_tries_query_params_in_order() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # First candidate (raw input) returns 204, second (8-digit) returns 200
             mock_resp_204 = Mock()
             mock_resp_204.status_code = 204
@@ -105,7 +105,7 @@ def test_cpv_probe_returns_none_if_all_candidates_fail() -> None:
             mock_get.return_value = mock_response
             
             # Mock the initial path-based call to return 204
-            with patch("requests.request") as mock_request:
+            with patch("requests.Session.request") as mock_request:
                 mock_resp_204 = Mock()
                 mock_resp_204.status_code = 204
                 mock_resp_204.text = ""
@@ -144,7 +144,7 @@ def test_cpv_probe_finds_label_in_list_response() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # First candidate returns 204, second returns 200 with list
             mock_resp_204 = Mock()
             mock_resp_204.status_code = 204
@@ -37,7 +37,7 @@ def test_cpv_path_substitution_with_id_param() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -87,7 +87,7 @@ def test_cpv_path_substitution_with_single_path_param() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"code": "45000000", "label": "Test"}
@@ -134,7 +134,7 @@ def test_cpv_path_substitution_code_param_matches_path_param() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"code": "45000000", "label": "Test"}
@@ -177,7 +177,7 @@ def test_cpv_label_with_response_returns_error_diagnostics() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # Mock HTTP 404 error with JSON error response
             mock_response = Mock()
             mock_response.status_code = 404
@@ -227,7 +227,7 @@ def test_cpv_label_with_response_handles_non_json_error() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.request") as mock_request:
+        with patch("requests.Session.request") as mock_request:
             # Mock HTTP 500 error with plain text response
             mock_response = Mock()
             mock_response.status_code = 500
@@ -24,7 +24,7 @@ def test_get_publication_workspace_url_construction() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"id": "workspace-123", "name": "Test"}
@@ -35,7 +35,7 @@ def test_get_publication_workspace_url_construction() -> None:
             # Verify URL construction
             assert mock_get.called
             call_args = mock_get.call_args
-            url = call_args[0][0]
+            url = call_args[0][1]
             assert url == "https://api.example.com/v1/publication-workspaces/workspace-123"
             
             # Verify headers include BelGov-Trace-Id and Accept-Language
@@ -57,7 +57,7 @@ def test_get_notice_url_construction() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"id": "notice-456", "title": "Test Notice"}
@@ -68,7 +68,7 @@ def test_get_notice_url_construction() -> None:
             # Verify URL construction
             assert mock_get.called
             call_args = mock_get.call_args
-            url = call_args[0][0]
+            url = call_args[0][1]
             assert url == "https://api.example.com/v1/notices/notice-456"
             
             # Verify headers include BelGov-Trace-Id and Accept-Language
@@ -89,7 +89,7 @@ def test_get_publication_workspace_returns_none_on_404() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -111,7 +111,7 @@ def test_get_notice_returns_none_on_403() -> None:
     client._endpoint_confirmed = True
     
     with patch.object(client, "get_access_token", return_value="test-token"):
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 403
             mock_get.return_value = mock_response
@@ -68,7 +68,7 @@ def test_request_adds_bearer_token(mock_token_response):
     mock_api_response.raise_for_status = Mock()
 
     with patch("requests.post", return_value=mock_token_response), patch(
-        "requests.request", return_value=mock_api_response
+        "requests.Session.request", return_value=mock_api_response
     ) as mock_request:
         response = client.request("GET", "https://api.example.com/test")
 
@@ -223,7 +223,7 @@ def test_discover_script_no_api_call_when_not_confirmed(mock_swagger_response, m
     # Mock requests
     with patch("requests.get", return_value=mock_swagger_response), patch(
         "requests.post", return_value=mock_token_response
-    ), patch("requests.request") as mock_request:
+    ), patch("requests.Session.request") as mock_request:
         # Import and run discovery logic (simplified)
         from scripts.discover_eprocurement_sea import find_search_endpoints
 
@@ -237,3 +237,75 @@ def test_discover_script_no_api_call_when_not_confirmed(mock_swagger_response, m
         # The script should exit early when endpoint_confirmed is False
         # So mock_request should not be called for endpoint testing
         # (We can't easily test the full script flow, but we verify the logic)
+
+
+def _status_response(status: int) -> Mock:
+    resp = Mock()
+    resp.status_code = status
+    resp.raise_for_status = Mock()
+    return resp
+
+
+def test_session_pool_size_is_configurable():
+    """The keep-alive session mounts an adapter sized to pool_size."""
+    client = OfficialEProcurementClient(
+        token_url="https://example.com/token",
+        client_id="id",
+        client_secret="secret",
+        pool_size=4,
+    )
+    adapter = client._session.get_adapter("https://api.example.com/x")
+    assert adapter._pool_maxsize == 4
+    assert adapter._pool_connections == 4
+    client.close()
+
+
+def test_request_retries_429_and_5xx(mock_token_response):
+    """429/5xx are retried with backoff on the pooled session, like the TED client."""
+    client = OfficialEProcurementClient(
+        token_url="https://example.com/token",
+        client_id="id",
+        client_secret="secret",
+    )
+    responses = [_status_response(429), _status_response(503), _status_response(200)]
+    with patch("requests.post", return_value=mock_token_response), patch(
+        "requests.Session.request", side_effect=responses
+    ) as mock_request, patch("app.connectors.bosa.official_client.time.sleep") as mock_sleep:
+        response = client.request("GET", "https://api.example.com/test")
+
+    assert response.status_code == 200
+    assert mock_request.call_count == 3
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 2]
+
+
+def test_request_does_not_retry_4xx(mock_token_response):
+    """4xx responses are returned immediately without retry."""
+    client = OfficialEProcurementClient(
+        token_url="https://example.com/token",
+        client_id="id",
+        client_secret="secret",
+    )
+    with patch("requests.post", return_value=mock_token_response), patch(
+        "requests.Session.request", return_value=_status_response(404)
+    ) as mock_request, patch("app.connectors.bosa.official_client.time.sleep") as mock_sleep:
+        response = client.request("GET", "https://api.example.com/test")
+
+    assert response.status_code == 404
+    assert mock_request.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_request_retries_connection_errors(mock_token_response):
+    """Transport errors are retried; the last one is raised when attempts run out."""
+    client = OfficialEProcurementClient(
+        token_url="https://example.com/token",
+        client_id="id",
+        client_secret="secret",
+    )
+    with patch("requests.post", return_value=mock_token_response), patch(
+        "requests.Session.request", side_effect=requests.ConnectionError("reset")
+    ) as mock_request, patch("app.connectors.bosa.official_client.time.sleep"):
+        with pytest.raises(requests.ConnectionError):
+            client.request("GET", "https://api.example.com/test")
+
+    assert mock_request.call_count == 3
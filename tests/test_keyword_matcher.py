@@ -0,0 +1,74 @@
+"""Unit tests for the Aho-Corasick keyword matcher."""
+import random
+import timeit
+
+from app.utils.keyword_matcher import AUTOMATON_MIN_KEYWORDS, Automaton, KeywordMatcher, keyword_matcher
+
+
+def test_automaton_finds_overlapping_patterns() -> None:
+    automaton = Automaton({"he": [0], "she": [1], "his": [2], "hers": [3, 4]})
+    assert automaton.ids_in("ushers") == {0, 1, 3, 4}
+    assert automaton.ids_in("this") == {2}
+    assert automaton.ids_in("") == set()
+
+
+def test_found_in_matches_substring_check() -> None:
+    """Same result as `kw.lower() in text.lower()` for every keyword."""
+    rng = random.Random(7)
+    alphabet = "abcé "
+    for _ in range(200):
+        keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(6)]
+        text = "".join(rng.choice(alphabet + "AÉ") for _ in range(rng.randint(0, 40)))
+        expected = [kw for kw in keywords if kw.lower().strip() and kw.lower().strip() in text.lower()]
+        assert KeywordMatcher(keywords).found_in(text) == expected
+
+
+def test_field_hits_reports_first_field() -> None:
+    matcher = KeywordMatcher(["Nettoyage", "bureaux", "vitres", "nettoyage", "  "])
+    hits = matcher.field_hits({
+        "title": "Nettoyage de bureaux",
+        "description": "Nettoyage des vitres et des bureaux",
+    })
+    # Duplicate keywords hit at each position; blank keywords never match
+    assert hits == {0: "title", 1: "title", 2: "description", 3: "title"}
+
+
+def test_keyword_matcher_is_cached_per_keyword_list() -> None:
+    assert keyword_matcher(["a", "b"]) is keyword_matcher(("a", "b"))
+    assert keyword_matcher(["a", "b"]) is not keyword_matcher(["b", "a"])
+
+
+def test_large_keyword_lists_use_automaton() -> None:
+    """Past the crossover the automaton path gives the same hits as the substring path."""
+    rng = random.Random(11)
+    keywords = list({"".join(rng.choice("abcde") for _ in range(rng.randint(2, 6))) for _ in range(2000)})
+    matcher = KeywordMatcher(keywords)
+    assert len(keywords) >= AUTOMATON_MIN_KEYWORDS and matcher._automaton is not None
+    for _ in range(50):
+        title = "".join(rng.choice("abcdeABCDE ") for _ in range(rng.randint(0, 30)))
+        description = "".join(rng.choice("abcde ") for _ in range(rng.randint(0, 80)))
+        assert matcher.found_in(description) == [kw for kw in keywords if kw in description]
+        expected = {
+            i: "title" if kw in title.lower() else "description"
+            for i, kw in enumerate(keywords) if kw in title.lower() or kw in description
+        }
+        assert matcher.field_hits({"title": title, "description": description}) == expected
+
+
+def test_small_keyword_lists_keep_pace_with_naive_loop() -> None:
+    """Regression guard: a watchlist-sized list is no slower than one `in` check per keyword."""
+    rng = random.Random(3)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(3, 10))) for _ in range(2000)]
+    text = " ".join(rng.choice(words) for _ in range(1000))[:6000]
+    keywords = [rng.choice(words) for _ in range(15)]
+    matcher = KeywordMatcher(keywords)
+    assert matcher._automaton is None
+
+    def naive() -> list[str]:
+        lowered = text.lower()
+        return [kw for kw in keywords if kw in lowered]
+
+    assert matcher.found_in(text) == naive()
+    matcher_time = min(timeit.repeat(lambda: matcher.found_in(text), number=50, repeat=5))
+    naive_time = min(timeit.repeat(naive, number=50, repeat=5))
+    assert matcher_time < 2 * naive_time
@@ -0,0 +1,151 @@
+"""Tests for notice_facet_counts (delta maintenance + full refresh)."""
+import asyncio
+from datetime import date
+
+from app.models.notice import ProcurementNotice, NoticeSource
+from app.models.notice_facet_count import NoticeFacetCount, facet_keys, refresh_facet_counts
+from tests.conftest import make_notice
+
+
+def _counts(db) -> dict[tuple[str, str], int]:
+    return {(r.facet, r.value): r.count for r in db.query(NoticeFacetCount) if r.count}
+
+
+def _assert_matches_refresh(db) -> dict[tuple[str, str], int]:
+    """Delta-maintained counters equal a full recompute."""
+    maintained = _counts(db)
+    assert refresh_facet_counts(db) == 0
+    assert _counts(db) == maintained
+    return maintained
+
+
+def test_facet_keys():
+    keys = facet_keys("TED_EU", "45 210000-2", ["be100", "BE241", "fr101"], "CONTRACT_NOTICE")
+    assert keys == [
+        ("source", "TED_EU"), ("cpv_division", "45"),
+        ("nuts_country", "BE"), ("nuts_country", "FR"), ("notice_type", "CONTRACT_NOTICE"),
+    ]
+    assert facet_keys("BOSA_EPROC", None, None, None) == [("source", "BOSA_EPROC")]
+
+
+def test_orm_writes_apply_deltas(db):
+    a = make_notice(cpv_main_code="45000000-7", nuts_codes=["BE100"], notice_type="CONTRACT_NOTICE")
+    b = make_notice(cpv_main_code="71000000-8", nuts_codes=["BE241", "NL310"])
+    db.add_all([a, b])
+    db.commit()
+    assert _assert_matches_refresh(db) == {
+        ("source", "BOSA_EPROC"): 2,
+        ("cpv_division", "45"): 1, ("cpv_division", "71"): 1,
+        ("nuts_country", "BE"): 2, ("nuts_country", "NL"): 1,
+        ("notice_type", "CONTRACT_NOTICE"): 1,
+    }
+
+    b.source = NoticeSource.TED_EU.value
+    b.cpv_main_code = "45210000-2"
+    b.nuts_codes = ["FR101"]
+    db.commit()
+    counts = _assert_matches_refresh(db)
+    assert counts[("cpv_division", "45")] == 2
+    assert counts[("source", "TED_EU")] == 1
+    assert ("nuts_country", "NL") not in counts
+
+    db.delete(a)
+    db.commit()
+    counts = _assert_matches_refresh(db)
+    assert ("source", "BOSA_EPROC") not in counts
+    assert ("notice_type", "CONTRACT_NOTICE") not in counts
+
+
+def test_refresh_repairs_drift(db):
+    db.add(make_notice(notice_type="CONTRACT_AWARD"))
+    db.commit()
+    db.query(NoticeFacetCount).delete()
+    db.add(NoticeFacetCount(facet="notice_type", value="STALE", count=3))
+    db.commit()
+
+    assert refresh_facet_counts(db) == 3  # source, type re-created; STALE zeroed
+    assert _counts(db) == {("source", "BOSA_EPROC"): 1, ("notice_type", "CONTRACT_AWARD"): 1}
+
+
+def test_bulk_imports_apply_deltas(db):
+    from app.services.notice_service import NoticeService
+    from tests.test_notice_service import TED_CAN, TED_CN, TED_ITEM_MINIMAL, _bosa_item
+
+    svc = NoticeService(db)
+    asyncio.run(svc.import_from_eproc_search(
+        [_bosa_item("ws-a", "Travaux A", nutsCodes=["BE100"]), _bosa_item("ws-b", "Travaux B")],
+        fetch_details=False, bulk=True,
+    ))
+    asyncio.run(svc.import_from_ted_search([TED_ITEM_MINIMAL, TED_CAN], bulk=True))
+    _assert_matches_refresh(db)
+
+    # Re-import: updates, and the standalone CAN is merged into its CN and deleted
+    asyncio.run(svc.import_from_eproc_search(
+        [_bosa_item("ws-a", "Travaux A", nutsCodes=["NL310"])], fetch_details=False, bulk=True,
+    ))
+    asyncio.run(svc.import_from_ted_search([TED_CN, TED_CAN], bulk=True))
+    counts = _assert_matches_refresh(db)
+    assert sum(c for (f, _), c in counts.items() if f == "source") == db.query(ProcurementNotice).count()
+
+
+
+def test_raw_sql_admin_writes_apply_deltas(db):
+    from app.api.routes.admin_ted import fix_ted_cpv
+    from app.services.cleanup_service import cleanup_bosa_duplicates
+
+    db.add_all([
+        make_notice(title="Voirie", cpv_main_code="45000000-7", nuts_codes=["BE100"], publication_date=date(2024, 1, 1)),
+        make_notice(title="Voirie", cpv_main_code="45000000-7", nuts_codes=["NL310"], publication_date=date(2024, 2, 1)),
+        make_notice(source=NoticeSource.TED_EU.value, cpv_main_code="['71000000']"),
+    ])
+    db.commit()
+
+    assert cleanup_bosa_duplicates(db, dry_run=False)["deleted_count"] == 1
+    assert fix_ted_cpv(dry_run=False, db=db)["fixed"] == 1
+    counts = _assert_matches_refresh(db)
+    assert counts[("source", "BOSA_EPROC")] == 1
+    assert counts[("source", "TED_EU")] == 1
+    assert counts[("cpv_division", "71")] == 1
+    assert counts[("nuts_country", "NL")] == 1
+
+
+def test_flushes_without_facet_changes_skip_counters(db):
+    from sqlalchemy import event
+
+    notice = make_notice(cpv_main_code="45000000-7")
+    db.add(notice)
+    db.commit()
+
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        db.query(ProcurementNotice).all()
+        db.commit()  # read-only session
+        notice.title = "Renamed"  # non-facet column
+        db.commit()
+    finally:
+        event.remove(db.bind, "before_cursor_execute", listener)
+    assert not [s for s in statements if "notice_facet_counts" in s]
+    # No count_notice_facets snapshot either
+    assert not [s for s in statements if s.startswith("SELECT notices.source, notices.cpv_main_code")]
+
+
+def test_get_facets_reads_counters(db):
+    from app.services.search_service import get_facets, invalidate_facets_cache
+
+    db.add_all([
+        make_notice(cpv_main_code="45000000-7", nuts_codes=["BE100"]),
+        make_notice(cpv_main_code="45210000-2", source=NoticeSource.TED_EU.value),
+    ])
+    db.commit()
+    # Counters are authoritative: get_facets does not rescan notices
+    db.query(NoticeFacetCount).filter(NoticeFacetCount.facet == "cpv_division").update({"count": 7})
+    db.commit()
+
+    invalidate_facets_cache()
+    facets = get_facets(db)
+    assert facets["total_notices"] == 2
+    assert facets["top_cpv_divisions"] == [{"code": "45", "label": facets["top_cpv_divisions"][0]["label"], "count": 7}]
+    assert facets["top_nuts_countries"] == [{"code": "BE", "count": 1}]
+    assert [s["value"] for s in facets["sources"]] == ["BOSA_EPROC", "TED_EU"]
@@ -0,0 +1,77 @@
+"""Tests for the notice_nuts side table (sync + NUTS/country prefix filters)."""
+import uuid
+
+from app.models.notice import ProcurementNotice
+from app.models.notice_nuts import NoticeNuts, normalize_nuts_codes, sync_notice_nuts
+from tests.conftest import make_notice
+
+
+def _codes(db, notice_id: str) -> list[str]:
+    return sorted(r.nuts_code for r in db.query(NoticeNuts).filter(NoticeNuts.notice_id == notice_id))
+
+
+def test_normalize_nuts_codes():
+    assert normalize_nuts_codes([" be100", "BE100", None, "", "fr1"]) == ["BE100", "FR1"]
+    assert normalize_nuts_codes("BE100") == []
+    assert normalize_nuts_codes(None) == []
+
+
+def test_orm_insert_and_update_keep_side_table_in_sync(db):
+    n = make_notice(nuts_codes=["be100", "BE241"])
+    db.add(n)
+    db.commit()
+    assert _codes(db, n.id) == ["BE100", "BE241"]
+
+    n.nuts_codes = ["FR101"]
+    db.commit()
+    assert _codes(db, n.id) == ["FR101"]
+
+    n.title = "Renamed"  # unrelated change leaves rows alone
+    db.commit()
+    assert _codes(db, n.id) == ["FR101"]
+
+
+def test_sync_after_core_write(db):
+    n = make_notice(nuts_codes=["BE100"])
+    db.add(n)
+    db.commit()
+    table = ProcurementNotice.__table__
+    db.execute(table.update().where(table.c.id == n.id).values(nuts_codes=["NL310", "NL320"]))
+
+    sync_notice_nuts(db, [n.id, "deleted-id"])
+    db.commit()
+    assert _codes(db, n.id) == ["NL310", "NL320"]
+
+
+def test_search_nuts_filter_is_prefix_only(db):
+    from app.services.search_service import build_search_query
+
+    db.add_all([
+        make_notice(title="Brussels", nuts_codes=["BE100"]),
+        make_notice(title="Antwerp", nuts_codes=["BE211"]),
+        make_notice(title="Not Belgian", nuts_codes=["FRBE1"]),
+        make_notice(title="No NUTS", nuts_codes=None),
+    ])
+    db.commit()
+
+    query, _ = build_search_query(db, nuts="be1")
+    assert [n.title for n in query.all()] == ["Brussels"]
+
+    query, _ = build_search_query(db, nuts="BE")
+    assert sorted(n.title for n in query.all()) == ["Antwerp", "Brussels"]
+
+
+def test_matcher_country_and_nuts_filters(db):
+    from app.models.watchlist import Watchlist
+    from app.services.watchlist_matcher import _build_match_query
+
+    be = make_notice(title="Travaux", nuts_codes=["BE241"])
+    fr = make_notice(title="Travaux", nuts_codes=["FR101"])
+    db.add_all([be, fr])
+    db.commit()
+
+    wl = Watchlist(id=str(uuid.uuid4()), name="BE", countries="BE", enabled=True)
+    assert [n.id for n in _build_match_query(db, wl).all()] == [be.id]
+
+    wl = Watchlist(id=str(uuid.uuid4()), name="FR1", nuts_prefixes="fr1", enabled=True)
+    assert [n.id for n in _build_match_query(db, wl).all()] == [fr.id]
@@ -0,0 +1,139 @@
+"""Tests for notice_search_texts (materialized keyword-matching text)."""
+import json
+import uuid
+
+from app.models.notice import ProcurementNotice, NoticeSource
+from app.models.notice_detail import NoticeDetail
+from app.models.notice_search_text import (
+    NoticeSearchText,
+    load_searchable_texts,
+    searchable_text_filter,
+    sync_notice_search_texts,
+)
+from app.models.watchlist import Watchlist
+from app.utils.searchable_text import build_searchable_text
+from tests.conftest import make_notice
+
+
+def _stored(db, notice_id: str) -> NoticeSearchText:
+    db.expire_all()
+    return db.get(NoticeSearchText, notice_id)
+
+
+def test_orm_writes_keep_text_in_sync(db):
+    """Text equals build_searchable_text() after notice and detail writes."""
+    notice = make_notice(
+        source=NoticeSource.TED_EU.value,
+        title="Rénovation école",
+        raw_data={"title-proc": {"fra": "Marché de toiture"}, "keywords": ["Isolation"]},
+    )
+    db.add(notice)
+    db.commit()
+    row = _stored(db, notice.id)
+    assert row.searchable_text == build_searchable_text(notice)
+    assert "isolation" in row.searchable_text
+
+    detail = NoticeDetail(
+        notice_id=notice.id, source=notice.source, source_id=notice.source_id,
+        raw_json=json.dumps({"description-proc": {"eng": "Photovoltaic panels"}}),
+    )
+    db.add(detail)
+    db.commit()
+    row = _stored(db, notice.id)
+    assert row.searchable_text == build_searchable_text(notice, detail)
+    assert "photovoltaic panels" in row.searchable_text
+
+    hash_before = row.input_hash
+    notice.description = "Toiture plate"
+    db.commit()
+    row = _stored(db, notice.id)
+    assert row.input_hash != hash_before
+    assert "toiture plate" in row.searchable_text
+
+
+def test_sync_skips_unchanged_inputs(db):
+    notices = [make_notice(title=f"Notice {i}") for i in range(3)]
+    db.add_all(notices)
+    db.commit()
+    ids = [n.id for n in notices]
+    assert sync_notice_search_texts(db, ids) == 0
+
+    # Core write (no listener): only the changed notice is rebuilt
+    db.execute(
+        ProcurementNotice.__table__.update()
+        .where(ProcurementNotice.id == ids[1])
+        .values(title="Nettoyage bureaux")
+    )
+    assert sync_notice_search_texts(db, ids) == 1
+    assert load_searchable_texts(db, ids)[ids[1]] == "nettoyage bureaux"
+
+
+def test_keyword_filter_reads_stored_text(db):
+    """SQL pre-filter sees raw_data text; unmaterialized notices fall back to title."""
+    in_raw = make_notice(title="Travaux", raw_data={"description-proc": "Pose de panneaux SOLAIRES"})
+    in_title = make_notice(title="Centrale solaire")
+    neither = make_notice(title="Nettoyage")
+    db.add_all([in_raw, in_title, neither])
+    db.commit()
+    db.query(NoticeSearchText).filter(NoticeSearchText.notice_id == in_title.id).delete()
+    db.commit()
+
+    def matching(*keywords: str) -> set[str]:
+        clause = searchable_text_filter(keywords)
+        return {n.id for n in db.query(ProcurementNotice).filter(clause)}
+
+    assert matching("Solaire") == {in_raw.id, in_title.id}
+    assert matching("50%") == set()
+    assert searchable_text_filter(["", " "]) is None
+
+
+def test_refresh_watchlist_matches_does_not_rebuild_text(db, monkeypatch):
+    """Deep-check reads stored texts; only unmaterialized notices are built."""
+    from app.db.crud import watchlists_mvp
+    from app.db.crud.watchlists_mvp import refresh_watchlist_matches
+
+    stored = make_notice(title="Travaux", raw_data={"keywords": ["Toiture"]})
+    missing = make_notice(title="Toiture verte")
+    db.add_all([stored, missing, make_notice(title="Nettoyage")])
+    wl = Watchlist(id=str(uuid.uuid4()), name="Toitures", keywords="toiture")
+    db.add(wl)
+    db.commit()
+    db.query(NoticeSearchText).filter(NoticeSearchText.notice_id == missing.id).delete()
+    db.commit()
+
+    built: list[str] = []
+    real_build = watchlists_mvp.build_searchable_text
+
+    def counting_build(notice, detail=None):
+        built.append(notice.id)
+        return real_build(notice, detail)
+
+    monkeypatch.setattr(watchlists_mvp, "build_searchable_text", counting_build)
+    result = refresh_watchlist_matches(db, wl)
+    assert result["matched"] == 2
+    assert built == [missing.id]
+
+
+def test_refresh_search_texts_rehashes_recently_updated(db):
+    """Raw SQL raw_data rewrites are repaired by the updated_since pass."""
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import text
+
+    from app.services.enrichment_service import refresh_search_texts
+
+    notice = make_notice(title="Travaux")
+    db.add(notice)
+    db.commit()
+    db.execute(
+        text("UPDATE notices SET raw_data = :rd, updated_at = :ts WHERE id = :nid"),
+        {"rd": json.dumps({"dossier_title": "Photovoltaique"}), "ts": datetime.utcnow(), "nid": notice.id},
+    )
+    db.commit()
+    assert _stored(db, notice.id).searchable_text == "travaux"
+
+    assert refresh_search_texts(db) == 0  # only fills missing rows
+    since = datetime.utcnow() - timedelta(days=1)
+    assert refresh_search_texts(db, updated_since=since) == 1
+    assert _stored(db, notice.id).searchable_text == "travaux photovoltaique"
+    assert refresh_search_texts(db, updated_since=since) == 0
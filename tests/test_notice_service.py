@@ -299,7 +299,7 @@ def test_import_from_all_sources_bosa_only(db: Session):
     }
 
     with patch(
-        "app.services.notice_service.search_publications_bosa",
+        "app.services.notice_service.search_publications_bosa_async",
         return_value=fake_bosa_result,
     ):
         result = asyncio.run(
@@ -320,7 +320,7 @@ def test_import_from_all_sources_ted_only(db: Session):
     fake_ted_result = {"notices": [TED_ITEM_MINIMAL]}
 
     with patch(
-        "app.services.notice_service.search_ted_notices_app",
+        "app.services.notice_service.search_ted_notices_app_async",
         return_value=fake_ted_result,
     ):
         result = asyncio.run(
@@ -332,3 +332,294 @@ def test_import_from_all_sources_ted_only(db: Session):
     assert result["ted"]["created"] == 1
     assert result["bosa"]["created"] == 0
     assert result["total"]["created"] == 1
+
+
+# ── TED bulk (set-based) import ──────────────────────────────────────
+
+
+TED_CN = {
+    "publication-number": "2026/S 020-000001",
+    "notice-title": "Cleaning services",
+    "procedure-identifier": "proc-42",
+    "form-type": "competition",
+    "links": {"pdf": {"fra": "https://ted.europa.eu/fr/notice/1/pdf"}},
+}
+TED_CAN = {
+    "publication-number": "2026/S 030-000002",
+    "notice-title": "Cleaning services - award",
+    "procedure-identifier": "proc-42",
+    "form-type": "result",
+    "business-name": "Clean SA",
+    "tender-value": "125000",
+}
+
+
+def test_ted_bulk_import_matches_row_stats(db: Session):
+    items = [
+        {**TED_ITEM_MINIMAL, "publication-number": f"2026/S 01{i}-000{i}"} for i in range(5)
+    ]
+    svc = NoticeService(db)
+    stats = asyncio.run(svc.import_from_ted_search(items + [{"title": "orphan"}], bulk=True))
+    assert stats == {"created": 5, "updated": 0, "skipped": 1, "errors": [], "merged": 0}
+
+    items[0] = {**items[0], "notice-title": "Updated title"}
+    stats = asyncio.run(svc.import_from_ted_search(items, bulk=True))
+    assert stats["created"] == 0
+    assert stats["updated"] == 5
+    assert db.query(ProcurementNotice).count() == 5
+    assert (
+        db.query(ProcurementNotice)
+        .filter(ProcurementNotice.source_id == "2026/S 010-0000")
+        .one()
+        .title
+    ) == "Updated title"
+
+
+def test_ted_bulk_import_duplicate_in_page_counts_as_update(db: Session):
+    svc = NoticeService(db)
+    second = {**TED_ITEM_MINIMAL, "notice-title": "Second version"}
+    stats = asyncio.run(svc.import_from_ted_search([TED_ITEM_MINIMAL, second], bulk=True))
+    assert stats["created"] == 1
+    assert stats["updated"] == 1
+    assert db.query(ProcurementNotice).one().title == "Second version"
+
+
+def test_ted_bulk_import_merges_can_into_cn(db: Session):
+    from app.models.notice_document import NoticeDocument
+
+    svc = NoticeService(db)
+    asyncio.run(svc.import_from_ted_search([TED_CN], bulk=True))
+    stats = asyncio.run(svc.import_from_ted_search([TED_CAN], bulk=True))
+    assert stats["merged"] == 1
+    assert stats["created"] == 0
+
+    cn = db.query(ProcurementNotice).one()
+    assert cn.source_id == TED_CN["publication-number"]
+    assert cn.award_winner_name == "Clean SA"
+    assert float(cn.award_value) == 125000
+    assert cn.raw_data["_can_source_id"] == TED_CAN["publication-number"]
+    assert db.query(NoticeDocument).filter(NoticeDocument.notice_id == cn.id).count() == 1
+
+
+def test_ted_bulk_import_deletes_orphan_can(db: Session):
+    svc = NoticeService(db)
+    # CAN imported before its CN exists → stored standalone
+    asyncio.run(svc.import_from_ted_search([TED_CAN], bulk=True))
+    asyncio.run(svc.import_from_ted_search([TED_CN], bulk=True))
+    assert db.query(ProcurementNotice).count() == 2
+
+    stats = asyncio.run(svc.import_from_ted_search([TED_CAN], bulk=True))
+    assert stats["merged"] == 1
+    remaining = db.query(ProcurementNotice).one()
+    assert remaining.source_id == TED_CN["publication-number"]
+    assert remaining.award_winner_name == "Clean SA"
+
+
+def test_ted_bulk_import_falls_back_to_row_path(db: Session):
+    svc = NoticeService(db)
+    with patch(
+        "app.services.notice_service._bulk_upsert_notices",
+        side_effect=RuntimeError("boom"),
+    ):
+        stats = asyncio.run(svc.import_from_ted_search([TED_ITEM_MINIMAL], bulk=True))
+    assert stats["created"] == 1
+    assert db.query(ProcurementNotice).count() == 1
+
+
+
+def test_ted_bulk_import_adopts_row_inserted_after_prefetch(db: Session):
+    """A source_id stored by another importer mid-page is updated under its own id."""
+    from app.models.notice_document import NoticeDocument
+    from app.models.notice_facet_count import NoticeFacetCount, refresh_facet_counts
+    from app.models.notice_search_text import NoticeSearchText
+    from app.services import notice_service
+
+    real_upsert = notice_service._bulk_upsert_notices
+
+    def racing_upsert(session, rows, update_existing=True):
+        if not update_existing:  # concurrent importer commits between prefetch and insert
+            session.add(ProcurementNotice(
+                id="concurrent-id",
+                source=NoticeSource.TED_EU.value,
+                source_id=TED_ITEM_MINIMAL["publication-number"],
+                publication_workspace_id=TED_ITEM_MINIMAL["publication-number"],
+                title="Stored concurrently",
+                cpv_main_code="71000000-8",
+            ))
+            session.flush()
+        return real_upsert(session, rows, update_existing)
+
+    with patch("app.services.notice_service._bulk_upsert_notices", side_effect=racing_upsert):
+        stats = asyncio.run(NoticeService(db).import_from_ted_search([TED_ITEM_MINIMAL], bulk=True))
+
+    assert (stats["created"], stats["updated"]) == (0, 1)
+    notice = db.query(ProcurementNotice).one()
+    assert (notice.id, notice.title) == ("concurrent-id", "Road construction services")
+    assert [t.notice_id for t in db.query(NoticeSearchText)] == ["concurrent-id"]
+    assert {d.notice_id for d in db.query(NoticeDocument)} <= {"concurrent-id"}
+    counters = {(r.facet, r.value): r.count for r in db.query(NoticeFacetCount) if r.count}
+    assert refresh_facet_counts(db) == 0
+    assert counters[("source", NoticeSource.TED_EU.value)] == 1
+
+# ── BOSA bulk (page-level) import ────────────────────────────────────
+
+
+def _bosa_item(workspace_id: str, title: str, **extra) -> dict:
+    return {
+        **BOSA_ITEM_MINIMAL,
+        "publicationWorkspaceId": workspace_id,
+        "dossier": {"titles": [{"language": "FR", "text": title}]},
+        **extra,
+    }
+
+
+def test_bosa_bulk_import_creates_and_skips(db: Session):
+    svc = NoticeService(db)
+    items = [_bosa_item("ws-a", "Travaux A"), _bosa_item("ws-b", "Travaux B"), {"title": "orphan"}]
+    stats = asyncio.run(svc.import_from_eproc_search(items, fetch_details=False, bulk=True))
+    assert stats == {"created": 2, "updated": 0, "skipped": 1, "errors": []}
+    assert db.query(ProcurementNotice).count() == 2
+
+
+def test_bosa_bulk_import_dedupes_by_title_and_cpv(db: Session):
+    svc = NoticeService(db)
+    asyncio.run(svc.import_from_eproc_search([_bosa_item("ws-a", "Travaux A")], fetch_details=False, bulk=True))
+
+    # Same tender republished under a new workspace id → updates the existing row
+    stats = asyncio.run(
+        svc.import_from_eproc_search([_bosa_item("ws-a2", "Travaux A")], fetch_details=False, bulk=True)
+    )
+    assert stats["created"] == 0
+    assert stats["updated"] == 1
+    notice = db.query(ProcurementNotice).one()
+    assert notice.source_id == "ws-a2"
+
+
+def test_bosa_bulk_import_replaces_lots_and_cpv(db: Session):
+    svc = NoticeService(db)
+    item = _bosa_item(
+        "ws-a", "Travaux A",
+        allCpvCodes=[{"code": "45233120-6"}, {"code": "71322000-1"}],
+        lots=[
+            {"number": "1", "titles": [{"language": "FR", "text": "Lot A"}]},
+            {"number": "2", "titles": [{"language": "FR", "text": "Lot B"}]},
+        ],
+    )
+    asyncio.run(svc.import_from_eproc_search([item], fetch_details=False, bulk=True))
+    notice = db.query(ProcurementNotice).one()
+    assert db.query(NoticeLot).filter(NoticeLot.notice_id == notice.id).count() == 2
+    assert {c.cpv_code for c in db.query(NoticeCpvAdditional)} == {"71322000-1"}
+
+    item = {**item, "lots": [{"number": "3", "titles": [{"language": "FR", "text": "Lot C"}]}]}
+    stats = asyncio.run(svc.import_from_eproc_search([item], fetch_details=False, bulk=True))
+    assert stats["updated"] == 1
+    lots = db.query(NoticeLot).filter(NoticeLot.notice_id == notice.id).all()
+    assert [l.lot_number for l in lots] == ["3"]
+    assert db.query(NoticeCpvAdditional).count() == 1
+
+
+def test_bosa_bulk_import_sets_derived_search_columns(db: Session):
+    from app.models.notice_nuts import NoticeNuts
+
+    item = _bosa_item("ws-a", "Travaux A", nutsCodes=["be100"])
+    asyncio.run(NoticeService(db).import_from_eproc_search([item], fetch_details=False, bulk=True))
+    notice = db.query(ProcurementNotice).one()
+    assert notice.organisation_name_search == "Ville de Bruxelles"
+    assert [r.nuts_code for r in db.query(NoticeNuts)] == ["BE100"]
+
+
+def test_bosa_bulk_import_matches_row_path(db: Session):
+    items = [
+        _bosa_item("ws-1", "Voirie"),
+        _bosa_item("ws-2", "Eclairage"),
+        _bosa_item("ws-3", "Voirie"),  # same title+CPV as ws-1 within the page
+    ]
+    bulk_stats = asyncio.run(
+        NoticeService(db).import_from_eproc_search(items, fetch_details=False, bulk=True)
+    )
+    bulk_rows = sorted((n.source_id, n.title) for n in db.query(ProcurementNotice))
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    row_db = sessionmaker(bind=engine)()
+    row_stats = asyncio.run(
+        NoticeService(row_db).import_from_eproc_search(items, fetch_details=False)
+    )
+    row_rows = sorted((n.source_id, n.title) for n in row_db.query(ProcurementNotice))
+    row_db.close()
+
+    assert bulk_stats == row_stats
+    assert bulk_rows == row_rows
+
+
+
+def test_bosa_bulk_import_follows_retitled_notice_within_page(db: Session):
+    items = [
+        _bosa_item("ws-1", "Voirie"),
+        _bosa_item("ws-1", "Voirie phase 2"),  # same workspace, new title → updates ws-1
+        _bosa_item("ws-2", "Voirie"),  # old title no longer matches anything → new notice
+        _bosa_item("ws-3", "Voirie phase 2"),  # matches ws-1 by its new title
+    ]
+    stats = asyncio.run(NoticeService(db).import_from_eproc_search(items, fetch_details=False, bulk=True))
+    assert (stats["created"], stats["updated"]) == (2, 2)
+    assert sorted((n.source_id, n.title) for n in db.query(ProcurementNotice)) == [
+        ("ws-2", "Voirie"),
+        ("ws-3", "Voirie phase 2"),
+    ]
+
+# ── Workspace detail prefetch ────────────────────────────────────────
+
+
+def test_prefetch_workspaces_bounded_concurrency(db: Session):
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(workspace_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return {"id": workspace_id}
+
+    items = [{"publicationWorkspaceId": f"ws-{i}"} for i in range(12)] + [{"title": "orphan"}]
+    svc = NoticeService(db)
+    with patch("app.connectors.eproc_connector.fetch_publication_workspace_async", side_effect=fake_fetch):
+        workspaces = asyncio.run(svc.prefetch_workspaces(items, concurrency=4, rate_per_second=0))
+
+    assert set(workspaces) == {f"ws-{i}" for i in range(12)}
+    assert workspaces["ws-3"] == {"id": "ws-3"}
+    assert 1 < peak <= 4
+
+
+def test_prefetch_workspaces_respects_rate_budget(db: Session):
+    import time
+
+    items = [{"publicationWorkspaceId": f"ws-{i}"} for i in range(5)]
+    svc = NoticeService(db)
+    with patch("app.connectors.eproc_connector.fetch_publication_workspace_async", return_value=None):
+        started = time.monotonic()
+        asyncio.run(svc.prefetch_workspaces(items, concurrency=5, rate_per_second=50))
+        elapsed = time.monotonic() - started
+
+    # 5 starts spaced 20ms apart → at least 80ms
+    assert elapsed >= 0.07
+
+
+def test_bosa_import_uses_prefetched_workspace(db: Session):
+    workspace = {
+        **BOSA_ITEM_MINIMAL,
+        "dossier": {"titles": [{"language": "FR", "text": "Titre du workspace"}]},
+    }
+    svc = NoticeService(db)
+    for bulk in (False, True):
+        with patch(
+            "app.connectors.eproc_connector.fetch_publication_workspace_async",
+            return_value=workspace,
+        ) as mock_fetch:
+            stats = asyncio.run(
+                svc.import_from_eproc_search([BOSA_ITEM_MINIMAL], fetch_details=True, bulk=bulk)
+            )
+        mock_fetch.assert_called_once_with("ws-001")
+        assert stats["errors"] == []
+    assert db.query(ProcurementNotice).one().title == "Titre du workspace"
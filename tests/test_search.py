@@ -69,6 +69,29 @@ def test_parse_tsquery_empty():
     assert _parse_tsquery("   ") == ""
 
 
+def test_translation_substring_fallback():
+    """Non-exact keywords match dictionary terms they contain or are contained in."""
+    from app.services.translation_service import _TERM_MATCHER, _normalise, translate_keyword
+
+    assert _normalise("  Bâtiment   Éclairé ") == "batiment eclaire"
+    assert "schoonmaak" in translate_keyword("schoonmaakdiensten")["nl"]  # term inside keyword
+    assert "zonnepanelen" in translate_keyword("zonnepanel")["nl"]  # keyword inside term
+    assert translate_keyword("qqqq")["found"] is False
+    assert _TERM_MATCHER.terms_in("xxbetonyy") == _TERM_MATCHER.containing("beton")
+
+
+def test_search_tsquery_ors_every_vector_config():
+    """search_vector holds simple + FR/NL/EN lexemes; the query is parsed with each config."""
+    from sqlalchemy.dialects import postgresql
+    from app.services.search_service import _TS_CONFIGS, _search_tsquery
+
+    compiled = _search_tsquery("travaux:*").compile(dialect=postgresql.dialect())
+    params = list(compiled.params.values())
+    assert [p for p in params if p != "travaux:*"] == list(_TS_CONFIGS)
+    assert params.count("travaux:*") == len(_TS_CONFIGS)
+    assert str(compiled).count("to_tsquery(") == len(_TS_CONFIGS)
+
+
 # ── _source_value tests ──
 
 
@@ -132,6 +155,50 @@ def test_search_cpv_prefix(db):
     assert query2.count() == 1
 
 
+def test_cpv_digits_generated_on_insert_and_update(db):
+    """cpv_digits is maintained by the database from cpv_main_code."""
+    from app.services.search_service import build_search_query
+
+    n = _make_notice(cpv_main_code="45 210000-2")
+    _seed(db, [n, _make_notice(cpv_main_code=None)])
+    db.refresh(n)
+    assert n.cpv_digits == "452100002"
+
+    n.cpv_main_code = "71000000-8"
+    db.commit()
+    db.refresh(n)
+    assert n.cpv_digits == "710000008"
+
+    query, _ = build_search_query(db, cpv="71-0")
+    assert [r.id for r in query.all()] == [n.id]
+
+
+def test_search_authority_uses_name_search_column(db):
+    """Authority filter matches any language of organisation_names, case-insensitively."""
+    from app.services.search_service import build_search_query
+    from app.services.dashboard_service import get_top_authorities
+
+    n = _make_notice(organisation_names={"fr": "Ville de Bruxelles", "nl": "Stad Brussel"})
+    _seed(db, [
+        n,
+        _make_notice(organisation_names={"fr": "Ville de Bruxelles"}),
+        _make_notice(organisation_names={"fr": "SPF Finances"}),
+        _make_notice(organisation_names=None),
+    ])
+    assert n.organisation_name_search == "Ville de Bruxelles | Stad Brussel"
+    # Display name (first entry) follows fr / nl / en, not dict order
+    mixed = _make_notice(organisation_names={"de": "Stadt Brüssel", "nl": "Stad Brussel", "fr": "Ville de Bruxelles"})
+    assert mixed.organisation_name_search == "Ville de Bruxelles | Stad Brussel | Stadt Brüssel"
+
+    query, _ = build_search_query(db, authority="stad brussel")
+    assert [r.id for r in query.all()] == [n.id]
+    query, _ = build_search_query(db, authority="bruxelles")
+    assert query.count() == 2
+
+    top = get_top_authorities(db)["data"]
+    assert top[0] == {"name": "Ville de Bruxelles", "count": 2}
+
+
 def test_search_source_filter(db):
     """Source filter maps BOSA/TED to enum values."""
     from app.services.search_service import build_search_query
@@ -202,6 +269,78 @@ def test_search_sort_date_asc(db):
     assert rows[2].title == "C"
 
 
+# ── Keyset (cursor) pagination ──
+
+
+@pytest.mark.parametrize("sort", ["date_desc", "date_asc", "deadline", "value_desc", "value_asc", "source_asc"])
+def test_cursor_pages_match_full_ordering(db, sort):
+    """Walking next cursors yields every row once, in build_search_query order (NULLs included)."""
+    from decimal import Decimal
+    from app.services.search_service import (
+        build_search_query, decode_search_cursor, encode_search_cursor, fetch_search_page, search_sort_keys,
+    )
+
+    notices = []
+    for i in range(11):
+        notices.append(_make_notice(
+            title=f"N{i}",
+            publication_date=None if i % 4 == 0 else date(2024, 1 + i % 3, 1),
+            deadline=None if i % 3 == 0 else datetime(2025, 1, 1 + i % 2),
+            estimated_value=None if i % 5 == 0 else Decimal(1000 * (i % 3)),
+            source=NoticeSource.TED_EU.value if i % 2 else NoticeSource.BOSA_EPROC.value,
+        ))
+    _seed(db, notices)
+
+    query, _ = build_search_query(db, sort=sort)
+    expected = [n.id for n in query.all()]
+    keys = search_sort_keys(db, None, sort)
+
+    seen, after = [], None
+    while True:
+        rows, last = fetch_search_page(query, keys, limit=3, after=after)
+        seen += [n.id for n in rows]
+        if last is None:
+            break
+        after = decode_search_cursor(encode_search_cursor(sort, last), sort, keys)
+
+    assert seen == expected
+
+
+def test_projected_page_matches_entity_page(db):
+    """columns= selects result columns only (description preview cut in SQL), same page order."""
+    from app.services.search_service import (
+        SEARCH_RESULT_COLUMNS, build_search_query, fetch_search_page, search_sort_keys,
+    )
+
+    _seed(db, [
+        _make_notice(title=f"N{i}", description="x" * 500, raw_data={"big": "y" * 1000},
+                     publication_date=None if i == 2 else date(2024, 1, 1 + i))
+        for i in range(5)
+    ])
+    query, _ = build_search_query(db, sort="date_desc")
+    keys = search_sort_keys(db, None, "date_desc")
+
+    notices, last = fetch_search_page(query, keys, limit=3)
+    rows, row_last = fetch_search_page(query, keys, limit=3, columns=SEARCH_RESULT_COLUMNS)
+    assert [r["id"] for r in rows] == [n.id for n in notices]
+    assert row_last == last
+    assert "raw_data" not in rows[0]
+    assert rows[0]["description"] == "x" * 300
+
+    rows, _ = fetch_search_page(query, keys, limit=3, after=row_last, columns=SEARCH_RESULT_COLUMNS)
+    assert [r["title"] for r in rows] == ["N0", "N2"]
+
+
+def test_cursor_rejects_other_sort(db):
+    from app.services.search_service import decode_search_cursor, encode_search_cursor, search_sort_keys
+
+    cursor = encode_search_cursor("date_desc", [date(2024, 1, 1), "id-1"])
+    with pytest.raises(ValueError):
+        decode_search_cursor(cursor, "deadline", search_sort_keys(db, None, "deadline"))
+    with pytest.raises(ValueError):
+        decode_search_cursor("not-a-cursor", "date_desc", search_sort_keys(db, None, "date_desc"))
+
+
 # ── get_facets tests ──
 
 
@@ -237,6 +376,31 @@ def test_facets_basic(db):
     assert facets["date_range"]["max"] is not None
 
 
+def test_search_facets_conditioned_on_filters(db):
+    """get_search_facets counts only notices matching the search filters."""
+    from app.services.search_service import get_search_facets, invalidate_facets_cache
+
+    _seed(db, [
+        _make_notice(title="Construction pont", cpv_main_code="45000000-7", nuts_codes=["BE100", "BE241"],
+                     notice_type="CONTRACT_NOTICE"),
+        _make_notice(title="Construction école", cpv_main_code="45210000-2", nuts_codes=["FR101"],
+                     source=NoticeSource.TED_EU.value),
+        _make_notice(title="Fournitures", cpv_main_code="33000000-0", nuts_codes=["BE100"]),
+    ])
+    invalidate_facets_cache()
+
+    facets = get_search_facets(db, {"q": "construction", "sort": "relevance"})
+    assert facets["total"] == 2
+    assert [(s["value"], s["count"]) for s in facets["sources"]] == [("BOSA_EPROC", 1), ("TED_EU", 1)]
+    assert [(c["code"], c["count"]) for c in facets["top_cpv_divisions"]] == [("45", 2)]
+    assert [(n["code"], n["count"]) for n in facets["top_nuts_countries"]] == [("BE", 1), ("FR", 1)]
+    assert facets["notice_types"] == [{"value": "CONTRACT_NOTICE", "count": 1}]
+
+    # Cached per normalized filter set (whitespace / sort ignored)
+    assert get_search_facets(db, {"q": " construction "}) is facets
+    assert get_search_facets(db, {"nuts": "BE"})["total"] == 2
+
+
 # ── _safe_date tests ──
 
 
@@ -249,3 +413,44 @@ def test_safe_date():
     assert _safe_date("invalid") is None
     assert _safe_date(None) is None
     assert _safe_date("") is None
+
+
+# ── Public preview engine ──
+
+
+def test_preview_matches_sample_count_and_cache(db, monkeypatch):
+    """One capped query gives the 5 most recent matches and the count; cached per normalized criteria."""
+    from app.services import preview_service
+
+    preview_service.invalidate_preview_cache()
+    _seed(db, [
+        _make_notice(title=f"Nettoyage lot {i}", publication_date=date(2024, 1, 1 + i),
+                     organisation_names={"nl": "Stad Gent", "fr": "Ville de Gand"})
+        for i in range(6)
+    ] + [
+        _make_notice(title="Travaux de voirie", cpv_main_code="45233000-9", publication_date=None),
+        _make_notice(title="Fournitures de bureau"),
+    ])
+
+    result = preview_service.preview_matches(db, ["Nettoyage", "x"], ["45-2"])
+    assert result["total_matches"] == 7
+    assert [n["title"] for n in result["sample"]] == [f"Nettoyage lot {i}" for i in (5, 4, 3, 2, 1)]
+    assert result["sample"][0]["authority"] == "Ville de Gand"
+    assert result["sample"][0]["source"] == "BOSA"
+
+    # Same criteria up to case / order / duplicates: served from cache
+    assert preview_service.preview_key([" NETTOYAGE", "nettoyage"], ["452"]) == (("nettoyage",), ("452",))
+    db.add(_make_notice(title="Nettoyage vitres", publication_date=date(2025, 1, 1)))
+    db.commit()
+    assert preview_service.preview_matches(db, [" NETTOYAGE", "nettoyage"], ["452"]) is result
+    preview_service.invalidate_preview_cache()
+    assert preview_service.preview_matches(db, ["nettoyage"], ["452"])["total_matches"] == 8
+
+    # Beyond the cap the window size is reported (planner estimate on Postgres only)
+    monkeypatch.setattr(preview_service, "_COUNT_CAP", 3)
+    preview_service.invalidate_preview_cache()
+    capped = preview_service.preview_matches(db, ["nettoyage"], [])
+    assert capped["total_matches"] == 4
+    assert capped["sample"][0]["title"] == "Nettoyage vitres"
+
+    assert preview_service.preview_matches(db, ["a", " "], ["4"]) == {"total_matches": 0, "sample": []}
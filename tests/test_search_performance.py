@@ -214,3 +214,47 @@ class TestMultiSourceFilter:
         ])
         query, _ = build_search_query(db, sources=["TED"])
         assert query.count() == 1
+
+
+# ── Search totals ────────────────────────────────────────────────────
+
+@pytest.mark.unit
+class TestSearchCount:
+    """count_search_results: exact below threshold, capped above, cached per filter set."""
+
+    def test_exact_below_threshold(self, db):
+        from app.services.search_service import (
+            build_search_query, count_search_results, invalidate_search_count_cache,
+        )
+        invalidate_search_count_cache()
+
+        seed_notices(db, [make_notice(cpv_main_code="45000000"), make_notice(cpv_main_code="72000000")])
+        filters = {"cpv": "45"}
+        query, _ = build_search_query(db, **filters)
+        assert count_search_results(db, query, filters) == (1, True)
+
+    def test_capped_above_threshold(self, db, monkeypatch):
+        from app.services import search_service
+        search_service.invalidate_search_count_cache()
+        monkeypatch.setattr(search_service, "_COUNT_EXACT_THRESHOLD", 3)
+
+        seed_notices(db, [make_notice() for _ in range(6)])
+        query, _ = search_service.build_search_query(db)
+        assert search_service.count_search_results(db, query, {}) == (4, False)
+
+    def test_cached_by_normalized_filters(self, db):
+        from app.services.search_service import (
+            build_search_query, count_search_results, invalidate_search_count_cache,
+        )
+        invalidate_search_count_cache()
+
+        seed_notices(db, [make_notice(title="Route communale")])
+        query, _ = build_search_query(db, q="route")
+        assert count_search_results(db, query, {"q": "route", "cpv": None}) == (1, True)
+
+        seed_notices(db, [make_notice(title="Route régionale")])
+        query, _ = build_search_query(db, q=" route ")
+        assert count_search_results(db, query, {"q": " route ", "active_only": False}) == (1, True)
+
+        invalidate_search_count_cache()
+        assert count_search_results(db, query, {"q": "route"}) == (2, True)
@@ -196,6 +196,27 @@ def test_matcher_source_filter(db):
     assert new[0].source == NoticeSource.BOSA_EPROC.value
 
 
+
+def test_matcher_skips_pairs_stored_concurrently(db):
+    """A pair inserted between the dedup check and the INSERT is not reported as new."""
+    from app.services.watchlist_matcher import match_watchlist
+
+    now = datetime.now(timezone.utc)
+    n1 = _notice(title="Construction A", created_at=now)
+    n2 = _notice(title="Construction B", created_at=now)
+    wl = _watchlist(keywords="construction")
+    db.add_all([n1, n2, wl])
+    db.commit()
+    db.add(WatchlistMatch(watchlist_id=wl.id, notice_id=n1.id, matched_on="concurrent run"))
+    db.commit()
+
+    # Dedup pre-check misses the concurrent row; ON CONFLICT DO NOTHING skips it
+    with patch("app.services.watchlist_matcher._existing_match_notice_ids", return_value=set()):
+        new = match_watchlist(db, wl, since=datetime(2020, 1, 1, tzinfo=timezone.utc))
+
+    assert [n.id for n in new] == [n2.id]
+    assert db.query(WatchlistMatch).filter(WatchlistMatch.watchlist_id == wl.id).count() == 2
+
 # ── Email notification tests ──
 
 
@@ -281,3 +302,260 @@ def test_run_matcher_multiple_watchlists(db):
     details = {d["watchlist_name"]: d["new_matches"] for d in result["details"]}
     assert details["Construction"] == 1
     assert details["IT"] == 1
+
+
+# ── Inverted index (single pass) ──
+
+
+def test_index_matches_sql_filters(db):
+    """WatchlistIndex yields the same pairs as the per-watchlist SQL query."""
+    from app.services.watchlist_index import WatchlistIndex
+    from app.services.watchlist_matcher import _build_match_query
+
+    now = datetime.now(timezone.utc)
+    notices = [
+        _notice(title="Construction de route", cpv_main_code="45233000-9", nuts_codes=["BE100"], created_at=now),
+        _notice(title="Papier", description="Fourniture de PAPIER recyclé", cpv_main_code="30190000-7",
+                nuts_codes=["FR101"], source=NoticeSource.TED_EU.value, created_at=now),
+        _notice(title="Travaux routiers", cpv_main_code="45000000-7", nuts_codes=["BE241"],
+                estimated_value=250000, created_at=now),
+        _notice(title="Nettoyage", cpv_main_code="90910000-9", created_at=now),
+    ]
+    db.add_all(notices)
+    watchlists = [
+        _watchlist(name="kw", keywords="route, papier"),
+        _watchlist(name="cpv", cpv_prefixes="45,909"),
+        _watchlist(name="cpv+country", cpv_prefixes="45", countries="BE"),
+        _watchlist(name="ted only", sources=json.dumps(["TED"])),
+        _watchlist(name="value", cpv_prefixes="45", value_min=100000),
+        _watchlist(name="all"),
+    ]
+    db.add_all(watchlists)
+    db.commit()
+
+    expected = {
+        (wl.id, n.id) for wl in watchlists for n in _build_match_query(db, wl).all()
+    }
+    got = set(WatchlistIndex(watchlists).stream_matches(db))
+    assert got == expected
+    assert len(expected) > 8
+
+
+def test_index_respects_each_watchlist_cutoff(db):
+    """A notice is matched only for watchlists refreshed before it was created."""
+    from app.services.watchlist_index import WatchlistIndex
+
+    n_old = _notice(title="Route A", created_at=datetime(2024, 1, 10, tzinfo=timezone.utc))
+    n_new = _notice(title="Route B", created_at=datetime(2024, 3, 10, tzinfo=timezone.utc))
+    wl_early = _watchlist(keywords="route", last_refresh_at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    wl_late = _watchlist(keywords="route", last_refresh_at=datetime(2024, 2, 1, tzinfo=timezone.utc))
+    db.add_all([n_old, n_new, wl_early, wl_late])
+    db.commit()
+
+    got = set(WatchlistIndex([wl_early, wl_late]).stream_matches(db))
+    assert got == {(wl_early.id, n_old.id), (wl_early.id, n_new.id), (wl_late.id, n_new.id)}
+
+
+def test_match_watchlists_stores_new_pairs_once(db):
+    """match_watchlists scores and stores new pairs, skipping existing matches."""
+    from app.services.watchlist_matcher import match_watchlists
+
+    now = datetime.now(timezone.utc)
+    n1 = _notice(title="Construction route", cpv_main_code="45000000-7", created_at=now)
+    n2 = _notice(title="Fournitures IT", cpv_main_code="72000000-5", created_at=now)
+    wl1 = _watchlist(name="Construction", keywords="construction")
+    wl2 = _watchlist(name="IT", cpv_prefixes="72")
+    db.add_all([n1, n2, wl1, wl2])
+    db.commit()
+    db.add(WatchlistMatch(watchlist_id=wl2.id, notice_id=n2.id, matched_on="earlier"))
+    db.commit()
+
+    result = match_watchlists(db, [wl1, wl2])
+
+    assert [n.id for n in result[wl1.id]] == [n1.id]
+    assert result[wl2.id] == []
+    assert db.query(WatchlistMatch).count() == 2
+    stored = db.query(WatchlistMatch).filter(WatchlistMatch.watchlist_id == wl1.id).one()
+    assert stored.relevance_score is not None
+    assert wl1.last_refresh_at is not None and wl2.last_refresh_at is not None
+
+
+def test_match_watchlist_batches_existing_lookup_and_insert(db):
+    """Query count of match_watchlist does not grow with the number of candidates."""
+    from sqlalchemy import event
+    from app.services.watchlist_matcher import match_watchlist
+
+    now = datetime.now(timezone.utc)
+    notices = [_notice(title=f"Construction lot {i}", created_at=now) for i in range(40)]
+    wl = _watchlist(keywords="construction")
+    db.add_all(notices + [wl])
+    db.commit()
+    db.add(WatchlistMatch(watchlist_id=wl.id, notice_id=notices[0].id, matched_on="earlier"))
+    db.commit()
+
+    statements = []
+    listener = lambda conn, cursor, stmt, params, ctx, many: statements.append(stmt)
+    event.listen(db.bind, "before_cursor_execute", listener)
+    try:
+        new = match_watchlist(db, wl, since=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    finally:
+        event.remove(db.bind, "before_cursor_execute", listener)
+
+    assert len(new) == 39
+    assert db.query(WatchlistMatch).filter(WatchlistMatch.watchlist_id == wl.id).count() == 40
+    assert len([s for s in statements if "watchlist_matches" in s]) <= 3
+
+
+def test_run_matcher_query_count_independent_of_watchlists(db):
+    """Users/plans/open matches are preloaded: query count stays flat as watchlists grow."""
+    from app.services.watchlist_matcher import run_watchlist_matcher
+
+    def _seed(n_watchlists: int) -> None:
+        now = datetime.now(timezone.utc)
+        for i in range(n_watchlists):
+            user = User(email=f"u{uuid.uuid4().hex[:8]}@test.com", password_hash="x", name=f"User {i}")
+            db.add(user)
+            db.flush()
+            db.add(_notice(title=f"Construction {uuid.uuid4().hex[:6]}", created_at=now))
+            db.add(_watchlist(name=f"wl-{i}", keywords="construction", user_id=user.id))
+        db.commit()
+
+    _seed(2)
+    with patch("app.services.notification_service.send_consolidated_digest"):
+        small = run_watchlist_matcher(db)
+
+    db.query(WatchlistMatch).delete()
+    db.query(Watchlist).delete()
+    db.commit()
+    _seed(8)
+    with patch("app.services.notification_service.send_consolidated_digest"):
+        large = run_watchlist_matcher(db)
+
+    assert large["watchlists_processed"] == 8
+    assert large["emails_sent"] == 8
+    assert small["db_queries"] > 0
+    assert large["db_queries"] == small["db_queries"]
+
+
+def test_rescore_matches_pages_and_writes_changed_rows_only(db):
+    """rescore_matches walks all matches by id and matches calculate_relevance_score."""
+    from app.services.relevance_scoring import calculate_relevance_score
+    from app.services.watchlist_matcher import rescore_matches
+
+    notices = [_notice(title=f"Construction école {i}", cpv_main_code="45000000-7") for i in range(7)]
+    wl = _watchlist(keywords="construction,école", cpv_prefixes="45")
+    db.add_all(notices + [wl])
+    db.commit()
+    db.add_all([WatchlistMatch(watchlist_id=wl.id, notice_id=n.id, matched_on="stale") for n in notices])
+    db.commit()
+
+    first = rescore_matches(db, batch_size=3)
+    assert first == {"scored": 7, "updated": 7}
+
+    db.expire_all()
+    expected_score, expected_expl = calculate_relevance_score(notices[0], wl)
+    stored = db.query(WatchlistMatch).filter(WatchlistMatch.notice_id == notices[0].id).one()
+    assert stored.relevance_score == expected_score
+    assert stored.matched_on == expected_expl
+
+    assert rescore_matches(db, batch_size=3) == {"scored": 7, "updated": 0}
+
+
+def test_refresh_watchlist_matches_reconciles_stored_set(db):
+    """refresh_watchlist_matches writes only the diff: inserts, deletes, changed rows."""
+    from app.db.crud.watchlists_mvp import refresh_watchlist_matches
+    from app.models.notice_cpv_additional import NoticeCpvAdditional
+
+    main = _notice(title="Construction école", cpv_main_code="45000000-7")
+    additional = _notice(title="Construction crèche", cpv_main_code="71000000-8")
+    other = _notice(title="Construction bureau", cpv_main_code="33000000-0")
+    wl = _watchlist(keywords="construction", cpv_prefixes="45")
+    db.add_all([main, additional, other, wl])
+    db.flush()
+    db.add_all([
+        NoticeCpvAdditional(notice_id=additional.id, cpv_code="45210000-2"),
+        NoticeCpvAdditional(notice_id=additional.id, cpv_code="45220000-5"),
+    ])
+    db.commit()
+
+    assert refresh_watchlist_matches(db, wl) == {"matched": 2, "added": 2, "removed": 0, "updated": 0}
+    ids_before = {m.notice_id: m.id for m in db.query(WatchlistMatch)}
+    assert set(ids_before) == {main.id, additional.id}
+
+    # Unchanged data: nothing written
+    assert refresh_watchlist_matches(db, wl) == {"matched": 2, "added": 0, "removed": 0, "updated": 0}
+
+    # One notice leaves the set, one joins, surviving rows keep their ids
+    main.cpv_main_code = "90000000-7"
+    other.cpv_main_code = "45300000-0"
+    db.query(WatchlistMatch).filter(WatchlistMatch.notice_id == additional.id).update({"matched_on": "stale"})
+    db.commit()
+    assert refresh_watchlist_matches(db, wl) == {"matched": 2, "added": 1, "removed": 1, "updated": 1}
+    stored = {m.notice_id: m for m in db.query(WatchlistMatch)}
+    assert set(stored) == {additional.id, other.id}
+    assert stored[additional.id].id == ids_before[additional.id]
+    assert stored[additional.id].matched_on == "keywords: construction, CPV: 45"
+
+
+def test_watchlist_preview_pages_from_cached_candidates(db, monkeypatch):
+    """Aperçu / Nouveaux pages cut from cached candidates equal the SQL path."""
+    from decimal import Decimal
+
+    from app.db.crud import watchlists_mvp
+    from app.db.crud.watchlists_mvp import (
+        invalidate_watchlist_candidates,
+        list_new_since_for_watchlist,
+        list_notices_for_watchlist,
+        update_watchlist,
+    )
+
+    future = datetime.now() + timedelta(days=30)
+    notices = [
+        _notice(title="Nettoyage A", publication_date=date(2024, 6, 3), deadline=future,
+                estimated_value=Decimal("1000"), created_at=datetime(2024, 6, 3)),
+        _notice(title="Nettoyage B", publication_date=None, source=NoticeSource.TED_EU.value,
+                created_at=datetime(2024, 6, 5)),
+        _notice(title="Nettoyage C", publication_date=date(2024, 6, 3), estimated_value=Decimal("50"),
+                deadline=datetime(2024, 1, 1), created_at=datetime(2024, 6, 4)),
+        _notice(title="Nettoyage D", publication_date=date(2024, 6, 1), created_at=datetime(2024, 6, 1)),
+        _notice(title="Travaux"),
+    ]
+    wl = _watchlist(keywords="nettoyage", last_refresh_at=datetime(2024, 6, 2, tzinfo=timezone.utc))
+    db.add_all(notices + [wl])
+    db.commit()
+    invalidate_watchlist_candidates()
+
+    builds = []
+    real_build = watchlists_mvp._build_watchlist_query
+
+    def counting_build(db_, watchlist):
+        builds.append(watchlist.id)
+        return real_build(db_, watchlist)
+
+    monkeypatch.setattr(watchlists_mvp, "_build_watchlist_query", counting_build)
+
+    def ids(result):
+        page, total = result
+        return [n.id for n in page], total
+
+    for sort in ("date_desc", "date_asc", "deadline", "deadline_desc", "value_desc"):
+        for kwargs in ({}, {"source": "BOSA_EPROC"}, {"active_only": True}, {"limit": 2, "offset": 1}):
+            for lister in (list_notices_for_watchlist, list_new_since_for_watchlist):
+                cached = ids(lister(db, wl, sort=sort, **kwargs))
+                # Same call through the SQL path
+                monkeypatch.setattr(watchlists_mvp, "_watchlist_candidates", lambda *a: None)
+                direct = ids(lister(db, wl, sort=sort, **kwargs))
+                monkeypatch.undo()
+                monkeypatch.setattr(watchlists_mvp, "_build_watchlist_query", counting_build)
+                assert cached == direct, (lister.__name__, sort, kwargs)
+
+    builds.clear()
+    page, total = list_notices_for_watchlist(db, wl)
+    assert total == 4 and builds == []  # served from cache
+    assert [n.title for n in page] == ["Nettoyage C", "Nettoyage A", "Nettoyage D", "Nettoyage B"]
+
+    # Editing the watchlist drops its candidates
+    update_watchlist(db, wl.id, keywords=["travaux"])
+    page, total = list_notices_for_watchlist(db, wl)
+    assert builds == [wl.id]
+    assert [n.title for n in page] == ["Travaux"]